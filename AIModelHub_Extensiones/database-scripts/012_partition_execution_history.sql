@@ -0,0 +1,315 @@
+-- ====================================================================
+-- Partition execution_history by Day, with Retention and Hourly Rollups
+-- Created: 2026-10-18
+-- Purpose: Keep execution_history bounded and cheap to insert into, and
+--          give dashboards per-asset hourly aggregates instead of raw scans
+-- ====================================================================
+--
+-- - execution_history becomes a table range-partitioned on created_at, with
+--   one partition per day (execution_history_pYYYYMMDD) and a default
+--   partition for rows outside them. Existing rows are copied over.
+-- - Indexes: the primary key (id, created_at), one composite index for the
+--   backend's "latest executions of an asset for a user" query, and a BRIN
+--   index on created_at (tiny, and cheap to maintain for append-only rows).
+--   The separate user_id and status indexes are gone.
+-- - Lookups by id alone probe every partition: the backend's execution
+--   update (and GET /v3/models/executions/:id when given createdAt) also
+--   filter on created_at so only one partition is touched.
+-- - execution_history_hourly: executions, errors and latency percentiles
+--   per asset and hour.
+-- - execution_history_maintain(): creates the next days' partitions, rolls
+--   up recent hours and drops partitions past the retention period (after
+--   rolling them up). Run it periodically with
+--   database-scripts/execution_history_maintenance.py or pg_cron, e.g.
+--   SELECT cron.schedule('*/15 * * * *', 'SELECT execution_history_maintain()');
+-- ====================================================================
+
+BEGIN;
+
+-- ====================================================================
+-- PART 1: Partitioned Table
+-- ====================================================================
+
+-- Step 1: Set the unpartitioned table aside (skipped if already migrated)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_class WHERE relname = 'execution_history' AND relkind = 'r') THEN
+        ALTER TABLE execution_history RENAME TO execution_history_unpartitioned;
+        ALTER INDEX execution_history_pkey RENAME TO execution_history_unpartitioned_pkey;
+        DROP INDEX IF EXISTS idx_execution_history_asset_id;
+        DROP INDEX IF EXISTS idx_execution_history_user_id;
+        DROP INDEX IF EXISTS idx_execution_history_status;
+        DROP INDEX IF EXISTS idx_execution_history_created_at;
+    END IF;
+END $$;
+
+-- Step 2: Same columns, partitioned by created_at (part of the primary key,
+-- as PostgreSQL requires for unique constraints on partitioned tables)
+CREATE TABLE IF NOT EXISTS execution_history (
+    id VARCHAR(255) NOT NULL,
+    asset_id VARCHAR(255) NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    user_id VARCHAR(255) NOT NULL,
+    connector_id VARCHAR(255) NOT NULL,
+    status VARCHAR(50) NOT NULL CHECK (status IN ('pending', 'running', 'success', 'error', 'timeout')),
+    input_payload JSONB NOT NULL,
+    output_payload JSONB,
+    error_message TEXT,
+    error_code VARCHAR(100),
+    http_status_code INT,
+    execution_time_ms INT,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE IF NOT EXISTS execution_history_default PARTITION OF execution_history DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_execution_history_asset_user_created
+    ON execution_history (asset_id, user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_execution_history_created_at_brin
+    ON execution_history USING BRIN (created_at);
+
+-- ====================================================================
+-- PART 2: Hourly Rollups
+-- ====================================================================
+
+CREATE TABLE IF NOT EXISTS execution_history_hourly (
+    asset_id VARCHAR(255) NOT NULL,
+    hour TIMESTAMP NOT NULL,
+    executions INT NOT NULL,
+    errors INT NOT NULL,
+    avg_ms NUMERIC(12, 2),
+    p50_ms DOUBLE PRECISION,
+    p95_ms DOUBLE PRECISION,
+    p99_ms DOUBLE PRECISION,
+    max_ms INT,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (asset_id, hour)
+);
+
+CREATE INDEX IF NOT EXISTS idx_execution_history_hourly_hour ON execution_history_hourly (hour DESC);
+
+-- ====================================================================
+-- PART 3: Maintenance Functions
+-- ====================================================================
+
+-- Partition for one day. Rows of that day already in the default partition
+-- are moved into it (ATTACH would fail otherwise).
+CREATE OR REPLACE FUNCTION execution_history_create_partition(p_day DATE)
+RETURNS TEXT AS $$
+DECLARE
+    partition_name TEXT := 'execution_history_p' || to_char(p_day, 'YYYYMMDD');
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM execution_history_default
+               WHERE created_at >= p_day AND created_at < p_day + 1) THEN
+        EXECUTE format('CREATE TABLE %I (LIKE execution_history INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                       partition_name);
+        EXECUTE format('WITH moved AS (DELETE FROM execution_history_default
+                                       WHERE created_at >= %L AND created_at < %L RETURNING *)
+                        INSERT INTO %I SELECT * FROM moved', p_day, p_day + 1, partition_name);
+        EXECUTE format('ALTER TABLE execution_history ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                       partition_name, p_day, p_day + 1);
+    ELSE
+        EXECUTE format('CREATE TABLE %I PARTITION OF execution_history FOR VALUES FROM (%L) TO (%L)',
+                       partition_name, p_day, p_day + 1);
+    END IF;
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Partitions from today to p_days_ahead days from now; returns how many were created
+CREATE OR REPLACE FUNCTION execution_history_ensure_partitions(p_days_ahead INT DEFAULT 7)
+RETURNS INT AS $$
+DECLARE
+    created INT := 0;
+    day DATE;
+BEGIN
+    FOR day IN SELECT generate_series(CURRENT_DATE, CURRENT_DATE + p_days_ahead, INTERVAL '1 day')::DATE LOOP
+        IF execution_history_create_partition(day) IS NOT NULL THEN
+            created := created + 1;
+        END IF;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recompute the rollups of every hour starting in [p_from, p_to); returns the rows written.
+-- Percentiles cannot be merged, so each hour is always recomputed from its raw rows.
+CREATE OR REPLACE FUNCTION execution_history_rollup(p_from TIMESTAMP, p_to TIMESTAMP)
+RETURNS INT AS $$
+DECLARE
+    written INT;
+BEGIN
+    INSERT INTO execution_history_hourly
+        (asset_id, hour, executions, errors, avg_ms, p50_ms, p95_ms, p99_ms, max_ms, updated_at)
+    SELECT
+        asset_id,
+        date_trunc('hour', created_at),
+        COUNT(*),
+        COUNT(*) FILTER (WHERE status IN ('error', 'timeout')),
+        ROUND(AVG(execution_time_ms), 2),
+        percentile_cont(0.50) WITHIN GROUP (ORDER BY execution_time_ms),
+        percentile_cont(0.95) WITHIN GROUP (ORDER BY execution_time_ms),
+        percentile_cont(0.99) WITHIN GROUP (ORDER BY execution_time_ms),
+        MAX(execution_time_ms),
+        NOW()
+    FROM execution_history
+    WHERE created_at >= date_trunc('hour', p_from) AND created_at < p_to
+    GROUP BY 1, 2
+    ON CONFLICT (asset_id, hour) DO UPDATE SET
+        executions = EXCLUDED.executions,
+        errors = EXCLUDED.errors,
+        avg_ms = EXCLUDED.avg_ms,
+        p50_ms = EXCLUDED.p50_ms,
+        p95_ms = EXCLUDED.p95_ms,
+        p99_ms = EXCLUDED.p99_ms,
+        max_ms = EXCLUDED.max_ms,
+        updated_at = EXCLUDED.updated_at;
+    GET DIAGNOSTICS written = ROW_COUNT;
+    RETURN written;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop the daily partitions that ended more than p_retention_days ago, rolling
+-- each one up first; returns the dropped partitions
+CREATE OR REPLACE FUNCTION execution_history_drop_partitions(p_retention_days INT)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    cutoff DATE := CURRENT_DATE - p_retention_days;
+    partition_name TEXT;
+    day DATE;
+BEGIN
+    FOR partition_name IN
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = 'execution_history' AND child.relname ~ '^execution_history_p[0-9]{8}$'
+        ORDER BY child.relname
+    LOOP
+        day := to_date(right(partition_name, 8), 'YYYYMMDD');
+        CONTINUE WHEN day + 1 > cutoff;
+        PERFORM execution_history_rollup(day, day + 1);
+        EXECUTE format('DROP TABLE %I', partition_name);
+        RETURN NEXT partition_name;
+    END LOOP;
+
+    -- Old rows that landed in the default partition
+    PERFORM execution_history_rollup(MIN(created_at), cutoff) FROM execution_history_default
+        WHERE created_at < cutoff HAVING COUNT(*) > 0;
+    DELETE FROM execution_history_default WHERE created_at < cutoff;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Periodic maintenance: partitions ahead, rollups since the last run (minus
+-- p_lookback, for executions completed late), retention. Returns a summary.
+CREATE OR REPLACE FUNCTION execution_history_maintain(
+    p_days_ahead INT DEFAULT 7,
+    p_retention_days INT DEFAULT 30,
+    p_rollup_retention_days INT DEFAULT NULL,
+    p_lookback INTERVAL DEFAULT INTERVAL '2 hours'
+)
+RETURNS JSONB AS $$
+DECLARE
+    rollup_from TIMESTAMP;
+    created INT;
+    rolled_up INT;
+    dropped JSONB;
+BEGIN
+    -- One maintenance run at a time
+    PERFORM pg_advisory_xact_lock(hashtext('execution_history_maintain'));
+
+    created := execution_history_ensure_partitions(p_days_ahead);
+
+    SELECT MAX(hour) - p_lookback INTO rollup_from FROM execution_history_hourly;
+    IF rollup_from IS NULL THEN
+        SELECT MIN(created_at) INTO rollup_from FROM execution_history;
+    END IF;
+    rolled_up := execution_history_rollup(rollup_from, date_trunc('hour', NOW()::TIMESTAMP) + INTERVAL '1 hour');
+
+    SELECT COALESCE(jsonb_agg(name), '[]'::JSONB) INTO dropped
+    FROM execution_history_drop_partitions(p_retention_days) AS name;
+
+    IF p_rollup_retention_days IS NOT NULL THEN
+        DELETE FROM execution_history_hourly WHERE hour < CURRENT_DATE - p_rollup_retention_days;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'partitions_created', created,
+        'rollup_from', rollup_from,
+        'hours_rolled_up', rolled_up,
+        'partitions_dropped', dropped
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- ====================================================================
+-- PART 4: Move Existing Rows
+-- ====================================================================
+
+-- Step 1: Partitions for every day with existing rows, plus the next week
+DO $$
+BEGIN
+    IF to_regclass('execution_history_unpartitioned') IS NOT NULL THEN
+        PERFORM execution_history_create_partition(day)
+        FROM (SELECT DISTINCT created_at::DATE AS day FROM execution_history_unpartitioned) AS days;
+    END IF;
+    PERFORM execution_history_ensure_partitions(7);
+END $$;
+
+-- Step 2: Copy the rows, then drop the old table
+DO $$
+BEGIN
+    IF to_regclass('execution_history_unpartitioned') IS NOT NULL THEN
+        INSERT INTO execution_history SELECT * FROM execution_history_unpartitioned;
+        DROP TABLE execution_history_unpartitioned;
+    END IF;
+END $$;
+
+-- Step 3: Initial rollups
+SELECT execution_history_rollup(MIN(created_at), date_trunc('hour', NOW()::TIMESTAMP) + INTERVAL '1 hour')
+FROM execution_history;
+
+-- ====================================================================
+-- PART 5: Documentation and Permissions
+-- ====================================================================
+
+COMMENT ON TABLE execution_history IS 'Stores the history of model execution requests and results (partitioned by day on created_at)';
+COMMENT ON COLUMN execution_history.id IS 'Unique execution identifier (UUID)';
+COMMENT ON COLUMN execution_history.asset_id IS 'Reference to the executed asset';
+COMMENT ON COLUMN execution_history.user_id IS 'User who requested the execution';
+COMMENT ON COLUMN execution_history.connector_id IS 'Connector ID from which execution was requested';
+COMMENT ON COLUMN execution_history.status IS 'Execution status: pending, running, success, error, timeout';
+COMMENT ON COLUMN execution_history.input_payload IS 'Input data sent to the model';
+COMMENT ON COLUMN execution_history.output_payload IS 'Output/result from the model';
+COMMENT ON COLUMN execution_history.error_message IS 'Error message if execution failed';
+COMMENT ON COLUMN execution_history.error_code IS 'Error code if execution failed';
+COMMENT ON COLUMN execution_history.http_status_code IS 'HTTP status code from the execution request';
+COMMENT ON COLUMN execution_history.execution_time_ms IS 'Total execution time in milliseconds';
+COMMENT ON COLUMN execution_history.created_at IS 'Timestamp when execution was requested (partition key)';
+COMMENT ON COLUMN execution_history.started_at IS 'Timestamp when execution started';
+COMMENT ON COLUMN execution_history.completed_at IS 'Timestamp when execution completed';
+
+COMMENT ON TABLE execution_history_hourly IS 'Per-asset hourly execution rollups, maintained by execution_history_maintain()';
+COMMENT ON COLUMN execution_history_hourly.hour IS 'Start of the hour (created_at truncated to the hour)';
+COMMENT ON COLUMN execution_history_hourly.errors IS 'Executions with status error or timeout';
+COMMENT ON COLUMN execution_history_hourly.p50_ms IS 'Median execution_time_ms (interpolated)';
+
+GRANT SELECT, INSERT, UPDATE ON execution_history TO ml_assets_user;
+GRANT SELECT ON execution_history_hourly TO ml_assets_user;
+
+COMMIT;
+
+-- Summary
+SELECT '=== EXECUTION HISTORY PARTITIONING COMPLETED ===' as status;
+SELECT
+    'Partitions' as info,
+    COUNT(*) as count
+FROM pg_inherits
+WHERE inhparent = 'execution_history'::regclass;
+SELECT 'Hourly rollups' as info, COUNT(*) as count FROM execution_history_hourly;
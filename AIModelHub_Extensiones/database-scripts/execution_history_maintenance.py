@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Maintenance for the partitioned execution_history table (see
+012_partition_execution_history.sql)
+
+Commands:
+- run:    create the next days' partitions, refresh the hourly rollups
+          since the last run and drop the partitions older than the
+          retention period (each one is rolled up first). Meant for cron,
+          e.g. every 15 minutes; concurrent runs wait for each other.
+- rollup: recompute the rollups of a time range (e.g. after a backfill)
+- status: partitions with their row estimates, and the rollup watermark
+
+All the work is done by the SQL functions of the migration, so pg_cron
+can run the same maintenance without this script. Requires psycopg2.
+
+Usage:
+    python3 execution_history_maintenance.py run --retention-days 30
+    python3 execution_history_maintenance.py rollup --since '2026-10-01' --until '2026-10-02'
+    python3 execution_history_maintenance.py status
+"""
+
+import argparse
+import json
+import os
+
+STATUS_SQL = """
+SELECT child.relname, child.reltuples::BIGINT, pg_get_expr(child.relpartbound, child.oid)
+FROM pg_inherits
+JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+WHERE pg_inherits.inhparent = 'execution_history'::regclass
+ORDER BY child.relname
+"""
+
+def run(cursor, args):
+    cursor.execute(
+        "SELECT execution_history_maintain(%s, %s, %s, %s::INTERVAL)",
+        (args.days_ahead, args.retention_days, args.rollup_retention_days, f'{args.lookback_hours} hours')
+    )
+    summary = cursor.fetchone()[0]
+    print(f"🗓️  Partitions created: {summary['partitions_created']}")
+    print(f"📊 Hourly rollups refreshed: {summary['hours_rolled_up']} (since {summary['rollup_from']})")
+    print(f"🗑️  Partitions dropped: {len(summary['partitions_dropped'])}")
+    for name in summary['partitions_dropped']:
+        print(f"   - {name}")
+    return summary
+
+def rollup(cursor, args):
+    cursor.execute("SELECT execution_history_rollup(%s, %s)", (args.since, args.until))
+    written = cursor.fetchone()[0]
+    print(f"📊 Hourly rollups recomputed: {written}")
+    return {'hours_rolled_up': written}
+
+def status(cursor, args):
+    cursor.execute(STATUS_SQL)
+    partitions = [{'name': name, 'rows_estimate': max(rows, 0), 'bounds': bounds}
+                  for name, rows, bounds in cursor.fetchall()]
+    cursor.execute("SELECT MAX(hour), COUNT(*) FROM execution_history_hourly")
+    watermark, rollups = cursor.fetchone()
+    for partition in partitions:
+        print(f"{partition['name']:<32} {partition['rows_estimate']:>12,}  {partition['bounds']}")
+    print(f"📊 {rollups:,} hourly rollups, latest hour: {watermark}")
+    return {'partitions': partitions, 'rollups': rollups,
+            'latest_rollup_hour': watermark.isoformat() if watermark else None}
+
+COMMANDS = {'run': run, 'rollup': rollup, 'status': status}
+
+def main():
+    parser = argparse.ArgumentParser(description='Partition, retention and rollup maintenance for execution_history')
+    parser.add_argument('command', nargs='?', choices=sorted(COMMANDS), default='run')
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'),
+                        help='PostgreSQL URL (default: DATABASE_URL)')
+    parser.add_argument('--days-ahead', type=int, default=7, help='Daily partitions created in advance')
+    parser.add_argument('--retention-days', type=int, default=30, help='Days of raw executions kept')
+    parser.add_argument('--rollup-retention-days', type=int, help='Days of hourly rollups kept (default: all)')
+    parser.add_argument('--lookback-hours', type=int, default=2,
+                        help='Hours before the latest rollup recomputed on each run (late completions)')
+    parser.add_argument('--since', help='rollup: first hour (timestamp)')
+    parser.add_argument('--until', help='rollup: end of the range, exclusive (timestamp)')
+    parser.add_argument('--json', dest='json_path', help='Also write the result as JSON')
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error('--database-url (or DATABASE_URL) is required')
+    if args.command == 'rollup' and not (args.since and args.until):
+        parser.error('rollup needs --since and --until')
+    if args.retention_days < 1:
+        parser.error('--retention-days must be at least 1')
+
+    import psycopg2  # Only needed once the arguments are valid
+
+    with psycopg2.connect(args.database_url) as connection, connection.cursor() as cursor:
+        result = COMMANDS[args.command](cursor, args)
+    connection.close()
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, default=str)
+        print(f"📄 JSON report: {args.json_path}")
+
+if __name__ == '__main__':
+    main()
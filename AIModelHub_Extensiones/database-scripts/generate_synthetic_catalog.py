@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic model catalog of arbitrary size for scale testing
+
+Every group of model-serving/model_registry.py is grown to --per-group
+models. Each synthetic model is derived from one of its group's five
+templates (round robin): same input schema, task and group, with a varied
+name, description, keywords, algorithm and its own endpoint under the
+template's (e.g. /api/v1/vision/chest-xray-s000042).
+
+Output is streamed (models are generated one at a time):
+- sql: the bulk modes of generate_25_models.py (--mode copy or values)
+- csv: one row per model, with group and template handler, which is also
+       the catalog file the mock server can mount (CATALOG_FILE)
+
+Model i of a group only depends on (--seed, group, i), so the same seed
+always gives the same models, whatever --per-group is.
+
+Usage:
+    python3 generate_synthetic_catalog.py --per-group 2000 --format csv > catalog.csv
+    python3 generate_synthetic_catalog.py --per-group 20000 --mode copy | psql -U ml_assets_user -d ml_assets_db
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'model-serving'))
+
+from generate_25_models import write_copy, write_values
+from model_registry import GROUPS, input_features, models_in_group
+
+CSV_COLUMNS = ['id', 'name', 'group', 'handler', 'endpoint', 'description', 'keywords',
+               'task', 'subtask', 'algorithm', 'input_features']
+
+NAME_PREFIXES = ['Advanced', 'Lightweight', 'Robust', 'Fast', 'Explainable', 'Federated',
+                 'Compact', 'Enterprise', 'Edge', 'Calibrated', 'Distilled', 'Ensemble']
+FOCUSES = ['low latency', 'high recall', 'high precision', 'edge devices', 'batch scoring',
+           'explainability', 'small datasets', 'regulated environments']
+EXTRA_KEYWORDS = ['synthetic', 'benchmark', 'production', 'realtime', 'batch', 'edge',
+                  'explainable', 'federated', 'calibrated', 'distilled']
+
+def synthetic_model(seed, group, index, templates, algorithms):
+    """Model `index` of a group, derived from one of the group's templates"""
+    rng = random.Random(f'{seed}:{group}:{index}')
+    template = templates[index % len(templates)]
+    suffix = f's{index:06d}'
+    major, minor = rng.randint(1, 4), rng.randint(0, 9)
+
+    keywords = [keyword.strip() for keyword in template['keywords'].split(',')]
+    keywords = rng.sample(keywords, rng.randint(2, len(keywords))) + rng.sample(EXTRA_KEYWORDS, 2)
+
+    return {
+        'id': f"{template['id']}-{suffix}",
+        'name': f"{rng.choice(NAME_PREFIXES)} {template['name']} v{major}.{minor} ({suffix})",
+        'group': group,
+        'handler': template['handler'],
+        'endpoint': f"{template['endpoint']}-{suffix}",
+        'description': f"{template['description']} Synthetic variant tuned for {rng.choice(FOCUSES)}.",
+        'keywords': ', '.join(keywords),
+        'task': template['task'],
+        'subtask': template['subtask'],
+        'algorithm': rng.choice(algorithms),
+        'input_features': input_features(template)
+    }
+
+def synthetic_models(per_group, seed=0, groups=None):
+    """Lazily generate per_group models for each group, group by group"""
+    for group in groups or GROUPS:
+        templates = models_in_group(group)
+        algorithms = sorted({template['algorithm'] for template in templates})
+        for index in range(per_group):
+            yield synthetic_model(seed, group, index, templates, algorithms)
+
+def write_csv(models, out):
+    writer = csv.writer(out)
+    writer.writerow(CSV_COLUMNS)
+    for model in models:
+        writer.writerow([
+            json.dumps(model[column], separators=(',', ':')) if column == 'input_features' else model[column]
+            for column in CSV_COLUMNS
+        ])
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream a synthetic model catalog as SQL or CSV')
+    parser.add_argument('--per-group', type=int, default=200, help='Models generated for each group')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--group', action='append', choices=sorted(GROUPS), help='Only this group (repeatable)')
+    parser.add_argument('--format', choices=('sql', 'csv'), default='sql')
+    parser.add_argument('--mode', choices=('copy', 'values'), default='copy', help='SQL loading strategy')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Models per statement in values mode')
+    args = parser.parse_args()
+    if args.per_group < 1 or args.batch_size < 1:
+        parser.error('--per-group and --batch-size must be at least 1')
+
+    models = synthetic_models(args.per_group, args.seed, args.group)
+    if args.format == 'csv':
+        write_csv(models, sys.stdout)
+    elif args.mode == 'values':
+        write_values(models, sys.stdout, args.batch_size)
+    else:
+        write_copy(models, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+"""
+Mock AI Model Server - ASGI Mode
+================================
+
+Sirve el mismo registro de modelos que mock_server_25_models.py sobre
+asyncio: la latencia simulada es `await asyncio.sleep(...)`, de modo que un
+solo proceso mantiene miles de inferencias simuladas concurrentes sin un
+hilo del sistema operativo por request.
+
+Comparte con el servidor Flask las funciones de modelo, el execution log,
+las métricas y los perfiles de latencia (LATENCY_*). Endpoints:
+- POST <endpoint> y <endpoint>/batch (los 25 modelos)
+- POST /api/v1/groups/<grupo>/compare (los 5 modelos de un grupo a la vez)
+- GET  /api/v1/health, /api/v1/metrics, /metrics
+
+Uso:
+    uvicorn asgi_server:app --host 0.0.0.0 --port 8080
+    python3 asgi_server.py
+
+Puerto: 8080
+"""
+
+import asyncio
+import time
+
+import fast_json
+import mock_server_25_models as server
+from metrics import PROMETHEUS_CONTENT_TYPE
+
+JSON_CONTENT_TYPE = 'application/json'
+
+CORS_HEADERS = [
+    (b'access-control-allow-origin', b'*'),
+    (b'access-control-allow-headers', b'Content-Type, Authorization'),
+    (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
+]
+
+async def read_body(receive):
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        more_body = message.get('more_body', False)
+    return b''.join(chunks)
+
+async def send_response(send, status, body, content_type=JSON_CONTENT_TYPE):
+    if not isinstance(body, bytes):
+        body = fast_json.dumps(body) if content_type == JSON_CONTENT_TYPE else body.encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', content_type.encode()), (b'content-length', str(len(body)).encode())] + CORS_HEADERS,
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+async def simulate_latency(handler, batch_size=1):
+    if server.real_model(handler) is not None:
+        return  # Real inference time only
+    delay = server.latency.sample(handler, batch_size)
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+async def predict(model, model_fn, data):
+    cache, key, result = server.lookup_cached(model, data)
+    if result is None:
+        await simulate_latency(model['handler'])
+        batcher = server.BATCHERS.get(model['handler'])
+        if batcher is not None:
+            result = await asyncio.wrap_future(batcher.enqueue(data))
+        else:
+            result = model_fn(data)
+        if cache is not None:
+            cache.put(key, result)
+    return result
+
+async def predict_batch(model, model_fn, inputs):
+    outputs, computed = server.cached_batch(model, model_fn, inputs)
+    if computed:
+        await simulate_latency(model['handler'], computed)
+    return outputs
+
+async def run_model(path, body):
+    """(status, payload) for a POST to a model endpoint"""
+    route = server.resolve_route(path)
+    if route is None:
+        return 404, {'error': f'Unknown model endpoint: {path}'}
+    model, model_fn, is_batch = route
+
+    start = time.time()
+    data = None
+    try:
+        data = fast_json.loads(body)
+        if not is_batch:
+            result = await predict(model, model_fn, data)
+            server.log_execution(model, model['endpoint'], 'success', start, data, result)
+            return 200, result
+
+        response = server.batch_response(model, await predict_batch(model, model_fn, server.batch_inputs(data)))
+        server.log_execution(model, path, 'success', start, data, response)
+        return 200, response
+    except server.BatchRequestError as e:
+        return 400, {'error': str(e)}
+    except Exception as e:
+        server.log_execution(model, path, 'error', start, data, error=str(e))
+        return 500, {'error': str(e)}
+
+async def compare_model(model, model_fn, inputs, is_batch):
+    start = time.time()
+    endpoint = model['endpoint'] + ('/batch' if is_batch else '')
+    try:
+        if is_batch:
+            output = await predict_batch(model, model_fn, inputs)
+        else:
+            output = await predict(model, model_fn, inputs)
+    except Exception as e:
+        server.log_execution(model, endpoint, 'error', start, inputs, error=str(e))
+        return server.compare_entry(model, start, error=str(e))
+    server.log_execution(model, endpoint, 'success', start, inputs, output)
+    return server.compare_entry(model, start, output, is_batch=is_batch)
+
+async def compare_group(group, body):
+    """(status, payload) for POST /api/v1/groups/<group>/compare"""
+    if group not in server.GROUPS:
+        return 404, {'error': f'Unknown model group: {group}'}
+    start = time.time()
+    try:
+        inputs, is_batch = server.compare_inputs(group, fast_json.loads(body))
+    except (server.BatchRequestError, TypeError, ValueError) as e:
+        return 400, {'error': str(e)}
+
+    entries = await asyncio.gather(*(
+        compare_model(model, server.MODEL_FUNCTIONS[model['handler']], inputs, is_batch)
+        for model in server.models_in_group(group)
+    ))
+    return 200, server.compare_response(group, entries, start, inputs, is_batch)
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def app(scope, receive, send):
+    """ASGI entry point"""
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    if scope['type'] != 'http':
+        return
+
+    method = scope['method']
+    path = scope['path']
+    if method == 'OPTIONS':
+        return await send_response(send, 204, b'')
+
+    server.metrics.request_started()
+    try:
+        if method == 'POST' and path.startswith('/api/v1/groups/') and path.endswith('/compare'):
+            status, payload = await compare_group(path.split('/')[4], await read_body(receive))
+            await send_response(send, status, payload)
+        elif method == 'POST' and path.startswith('/api/v1/'):
+            status, payload = await run_model(path, await read_body(receive))
+            await send_response(send, status, payload)
+        elif method == 'GET' and path == '/api/v1/health':
+            await send_response(send, 200, server.health_payload())
+        elif method == 'GET' and path == '/api/v1/metrics':
+            await send_response(send, 200, server.metrics_payload())
+        elif method == 'GET' and path == '/metrics':
+            await send_response(send, 200, server.aggregated_metrics()[0].render_prometheus(), PROMETHEUS_CONTENT_TYPE)
+        else:
+            await send_response(send, 404, {'error': f'Not found: {method} {path}'})
+    finally:
+        server.metrics.request_finished()
+
+if __name__ == '__main__':
+    import uvicorn
+
+    print("=" * 80)
+    print("🤖 AI Model Mock Server - 25 Models Edition (ASGI)")
+    print("=" * 80)
+    print(f"🔥 {len(server.ROUTES)} models served with asyncio latency simulation")
+    print(f"📈 Metrics: http://localhost:8080/api/v1/metrics")
+    print("=" * 80)
+
+    uvicorn.run(app, host='0.0.0.0', port=8080, log_level='warning')
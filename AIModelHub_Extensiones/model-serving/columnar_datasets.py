@@ -0,0 +1,342 @@
+"""
+Columnar Datasets
+=================
+
+Formato columnar en disco para los datasets de validación: en lugar de un
+único blob JSONB (`data`) que hay que parsear entero para leer cualquier
+valor, cada columna es un archivo .npy que se abre con memory-mapping, así
+que leer una columna o un bloque de filas no copia ni parsea el resto.
+
+Estructura, un directorio por dataset (COLUMNAR_DATASETS_DIR/<id>/):
+- manifest.json:   metadatos de validation_datasets (name, task_type,
+                   features_schema, labels_column), número de filas y tipo
+                   de cada columna
+- <col>.npy:       valores (float64, int64 o bool; `array` con su `shape`)
+- <col>.valid.npy: máscara bool de filas con valor (los nulos no se guardan)
+- columnas string: <col>.offsets.npy (int64, filas + 1) y <col>.data.npy
+                   (bytes UTF-8 concatenados), como en Arrow
+
+Los tipos salen de features_schema, también el de la etiqueta si figura en
+él; si no, la columna de etiquetas toma el tipo de todos los valores del
+primer bloque de WRITE_CHUNK_ROWS filas (int64 pasa a float64 si alguno es
+decimal). Un valor que no cabe en el tipo de su columna (p. ej. 3.7 en una
+columna int64) hace fallar la exportación en vez de truncarse. Las columnas
+que no son ni del esquema ni la etiqueta (p. ej. image_id) no se exportan.
+
+La exportación es de una sola pasada y en memoria constante: los .npy se
+escriben con una cabecera de tamaño fijo que se completa al final con el
+número de filas. Al reexportar, el manifest anterior se borra antes de tocar
+ninguna columna y el nuevo se escribe el último, así que un directorio con
+manifest siempre corresponde a una exportación completa.
+
+Uso:
+    python3 columnar_datasets.py export --dataset iris-150 [--file export.jsonl | --database-url URL]
+    python3 columnar_datasets.py import --dataset iris-150 --sql iris-150.sql
+    python3 columnar_datasets.py info --dataset iris-150
+"""
+
+import argparse
+from itertools import islice
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+
+from validation_datasets import database_dataset, iter_database_samples, iter_file_samples, load_datasets
+
+DATASETS_DIR = os.environ.get(
+    'COLUMNAR_DATASETS_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datasets')
+)
+MANIFEST = 'manifest.json'
+WRITE_CHUNK_ROWS = 4096
+
+# features_schema type -> column kind
+SCHEMA_KINDS = {
+    'float': 'float64', 'number': 'float64', 'double': 'float64',
+    'int': 'int64', 'integer': 'int64',
+    'bool': 'bool', 'boolean': 'bool',
+    'array': 'float64',
+}
+
+# Missing values are masked out; these only fill their slot
+FILL_VALUES = {'float64': float('nan'), 'int64': 0, 'bool': False}
+
+_NPY_HEADER_SIZE = 128  # Magic, version, length and the padded header dict
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+def _npy_header(dtype, shape):
+    header = repr({'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                   'fortran_order': False, 'shape': tuple(shape)})
+    space = _NPY_HEADER_SIZE - 10 - 1
+    if len(header) > space:
+        raise ValueError(f'Shape {shape} does not fit in the .npy header')
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', space + 1) + (header.ljust(space) + '\n').encode('latin1')
+
+class NpyWriter:
+    """Appends rows to a .npy file whose length is only known at the end"""
+
+    def __init__(self, path, dtype, item_shape=()):
+        self.dtype = np.dtype(dtype)
+        self.item_shape = tuple(item_shape)
+        self.rows = 0
+        self._file = open(path, 'wb')
+        self._file.write(_npy_header(self.dtype, (0,) + self.item_shape))
+
+    def append(self, values):
+        array = np.asarray(values, dtype=self.dtype).reshape((-1,) + self.item_shape)
+        array.tofile(self._file)
+        self.rows += len(array)
+
+    def close(self):
+        self._file.seek(0)
+        self._file.write(_npy_header(self.dtype, (self.rows,) + self.item_shape))
+        self._file.close()
+
+class ColumnWriter:
+    """One column: values (or string offsets and bytes) plus a validity mask"""
+
+    def __init__(self, directory, name, kind, shape=()):
+        self.name = name
+        self.kind = kind
+        self.shape = list(shape)
+        self.mask = NpyWriter(os.path.join(directory, f'{name}.valid.npy'), 'bool')
+        if kind == 'string':
+            self.offsets = NpyWriter(os.path.join(directory, f'{name}.offsets.npy'), 'int64')
+            self.data = NpyWriter(os.path.join(directory, f'{name}.data.npy'), 'uint8')
+            self.offsets.append([0])
+            self.end = 0
+        else:
+            self.values = NpyWriter(os.path.join(directory, f'{name}.npy'), kind, shape)
+
+    def append(self, column):
+        valid = [value is not None for value in column]
+        self.mask.append(valid)
+        if self.kind == 'string':
+            encoded = [str(value).encode('utf-8') if value is not None else b'' for value in column]
+            self.data.append(np.frombuffer(b''.join(encoded), dtype=np.uint8))
+            self.offsets.append(self.end + np.cumsum([len(value) for value in encoded]))
+            self.end += sum(len(value) for value in encoded)
+            return
+        fill = np.full(self.shape, FILL_VALUES[self.kind]) if self.shape else FILL_VALUES[self.kind]
+        values = [value if ok else fill for value, ok in zip(column, valid)]
+        try:
+            if self.kind == 'int64':
+                values = self._integers(values)
+            self.values.append(values)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f'Column {self.name}: value does not fit {self.kind} ({e})')
+
+    def _integers(self, values):
+        # numpy truncates floats silently when casting to int64
+        exact = np.asarray(values, dtype='float64')
+        integers = exact.astype('int64')
+        mismatch = np.flatnonzero(exact != integers)
+        if len(mismatch):
+            raise ValueError(f'{values[mismatch[0]]!r} is not an integer')
+        return integers
+
+    def close(self):
+        writers = (self.mask, self.offsets, self.data) if self.kind == 'string' else (self.mask, self.values)
+        for writer in writers:
+            writer.close()
+
+    def describe(self):
+        return {'kind': self.kind, 'shape': self.shape} if self.shape else {'kind': self.kind}
+
+def _label_kind(values):
+    """Column kind of the label, from all its non-null values"""
+    values = [value for value in values if value is not None]
+    if not values:
+        return 'string'
+    if all(isinstance(value, bool) for value in values):
+        return 'bool'
+    if all(isinstance(value, (int, float)) for value in values):
+        return 'float64' if any(isinstance(value, float) for value in values) else 'int64'
+    return 'string'
+
+def export_dataset(dataset, samples, directory=DATASETS_DIR):
+    """Write a dataset (metadata dict + iterable of samples) as columns; returns its path"""
+    path = os.path.join(directory, dataset['id'])
+    os.makedirs(path, exist_ok=True)
+    fields = (dataset.get('features_schema') or {}).get('fields', [])
+    label = dataset.get('labels_column')
+    label_field = next((field for field in fields if field['name'] == label), None)
+
+    # The old manifest would describe columns this export is about to rewrite
+    if os.path.exists(os.path.join(path, MANIFEST)):
+        os.remove(os.path.join(path, MANIFEST))
+
+    samples = iter(samples)
+    chunk = list(islice(samples, WRITE_CHUNK_ROWS))
+    columns = [ColumnWriter(path, field['name'], SCHEMA_KINDS.get(field.get('type'), 'string'),
+                            field.get('shape', ()) if field.get('type') == 'array' else ())
+               for field in fields]
+    if label and label_field is None:
+        columns.append(ColumnWriter(path, label, _label_kind([sample.get(label) for sample in chunk])))
+
+    rows = 0
+    while chunk:
+        for column in columns:
+            column.append([sample.get(column.name) for sample in chunk])
+        rows += len(chunk)
+        chunk = list(islice(samples, WRITE_CHUNK_ROWS))
+
+    for column in columns:
+        column.close()
+    manifest = {
+        'id': dataset['id'],
+        'name': dataset.get('name'),
+        'task_type': dataset.get('task_type'),
+        'features_schema': dataset.get('features_schema'),
+        'labels_column': label,
+        'rows': rows,
+        'columns': {column.name: column.describe() for column in columns}
+    }
+    tmp_path = os.path.join(path, f'{MANIFEST}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(path, MANIFEST))  # Written last: marks a complete export
+    return path
+
+# ============================================================================
+# READING
+# ============================================================================
+
+class StringColumn:
+    """Memory-mapped UTF-8 strings; slicing decodes only the rows asked for"""
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, rows):
+        start, stop, _ = rows.indices(len(self))
+        offsets = self.offsets[start:stop + 1]
+        raw = self.data[offsets[0]:offsets[-1]].tobytes() if stop > start else b''
+        base = offsets[0]
+        return [raw[a - base:b - base].decode('utf-8') for a, b in zip(offsets[:-1], offsets[1:])]
+
+class ColumnarDataset:
+    """A dataset exported by export_dataset(), with lazily memory-mapped columns"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.rows = self.manifest['rows']
+        self._columns = {}
+
+    @classmethod
+    def open(cls, dataset_id, directory=DATASETS_DIR):
+        return cls(os.path.join(directory, dataset_id))
+
+    def __len__(self):
+        return self.rows
+
+    def _load(self, name):
+        return np.load(os.path.join(self.path, name), mmap_mode='r')
+
+    def column(self, name):
+        """Values of a column: a read-only memmap, or a StringColumn"""
+        if name not in self._columns:
+            kind = self.manifest['columns'][name]['kind']
+            if kind == 'string':
+                values = StringColumn(self._load(f'{name}.offsets.npy'), self._load(f'{name}.data.npy'))
+            else:
+                values = self._load(f'{name}.npy')
+            self._columns[name] = (values, self._load(f'{name}.valid.npy'))
+        return self._columns[name][0]
+
+    def valid(self, name):
+        """Boolean mask of the rows where a column has a value"""
+        self.column(name)
+        return self._columns[name][1]
+
+    def iter_samples(self, columns=None, chunk_size=WRITE_CHUNK_ROWS):
+        """Rows as dicts (nulls omitted), reading only the given columns"""
+        names = [name for name in (columns or self.manifest['columns']) if name in self.manifest['columns']]
+        for start in range(0, self.rows, chunk_size):
+            rows = slice(start, min(start + chunk_size, self.rows))
+            values = []
+            for name in names:
+                column = self.column(name)
+                chunk = column[rows] if isinstance(column, StringColumn) else column[rows].tolist()
+                values.append((name, chunk, self.valid(name)[rows].tolist()))
+            for i in range(rows.stop - rows.start):
+                yield {name: chunk[i] for name, chunk, valid in values if valid[i]}
+
+# ============================================================================
+# IMPORT (columnar -> validation_datasets)
+# ============================================================================
+
+def _sql_string(value):
+    return "'" + value.replace("'", "''") + "'"
+
+def write_insert_sql(dataset, out):
+    """Stream an upsert of the dataset into validation_datasets to a text file"""
+    manifest = dataset.manifest
+    out.write("INSERT INTO validation_datasets (id, name, task_type, samples, description, "
+              "features_schema, data, labels_column)\nVALUES (\n")
+    out.write(f"    {_sql_string(manifest['id'])},\n    {_sql_string(manifest['name'] or manifest['id'])},\n")
+    out.write(f"    {_sql_string(manifest['task_type'] or 'other')},\n    {manifest['rows']},\n")
+    out.write("    'Imported from the columnar dataset export',\n")
+    out.write(f"    {_sql_string(json.dumps(manifest['features_schema']))}::jsonb,\n")
+    out.write("    '{\"samples\": [")
+    for i, sample in enumerate(dataset.iter_samples()):
+        out.write((',' if i else '') + '\n        ' + json.dumps(sample).replace("'", "''"))
+    out.write("\n    ]}'::jsonb,\n")
+    out.write(f"    {_sql_string(manifest['labels_column'] or '')}\n)\n")
+    out.write("ON CONFLICT (id) DO UPDATE SET\n"
+              "    samples = EXCLUDED.samples,\n"
+              "    features_schema = EXCLUDED.features_schema,\n"
+              "    data = EXCLUDED.data,\n"
+              "    updated_at = CURRENT_TIMESTAMP;\n")
+
+def main():
+    parser = argparse.ArgumentParser(description='Columnar (.npy per column) copies of validation datasets')
+    parser.add_argument('command', choices=('export', 'import', 'info'))
+    parser.add_argument('--dataset', required=True, help='validation_datasets id')
+    parser.add_argument('--dir', default=DATASETS_DIR, help='Root directory of the columnar datasets')
+    parser.add_argument('--file', help='export: read samples from an exported data blob, JSON list or .jsonl')
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'),
+                        help='export: read the dataset from PostgreSQL (needs psycopg2)')
+    parser.add_argument('--sql', help='import: write the upsert here instead of stdout')
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        if args.database_url and not args.file:
+            dataset = database_dataset(args.database_url, args.dataset)
+            samples = iter_database_samples(args.database_url, args.dataset)
+        else:
+            dataset = next((d for d in load_datasets() if d['id'] == args.dataset), None)
+            samples = iter_file_samples(args.file) if args.file else (dataset or {}).get('samples', [])
+        if dataset is None:
+            parser.error(f'Unknown validation dataset: {args.dataset}')
+        if isinstance(dataset.get('features_schema'), str):
+            dataset['features_schema'] = json.loads(dataset['features_schema'])
+        path = export_dataset(dataset, samples, args.dir)
+        print(f"✅ {args.dataset}: {ColumnarDataset(path).rows} rows written to {path}")
+        return
+
+    dataset = ColumnarDataset.open(args.dataset, args.dir)
+    if args.command == 'info':
+        print(json.dumps({key: value for key, value in dataset.manifest.items() if key != 'features_schema'},
+                         indent=2))
+    elif args.sql:
+        with open(args.sql, 'w', encoding='utf-8') as out:
+            write_insert_sql(dataset, out)
+        print(f"✅ {args.dataset}: upsert written to {args.sql}")
+    else:
+        write_insert_sql(dataset, sys.stdout)
+
+if __name__ == '__main__':
+    main()
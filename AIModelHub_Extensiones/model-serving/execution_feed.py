@@ -0,0 +1,139 @@
+"""
+Execution Feed
+==============
+
+Difusión en vivo de las ejecuciones de modelos a los dashboards mediante
+Server-Sent Events (text/event-stream).
+
+- Cada cliente tiene una cola acotada: si no consume a tiempo se descartan
+  sus eventos más antiguos (drop-oldest) y se le avisa con un evento
+  `dropped`, sin frenar nunca a los requests de inferencia.
+- Publicar cuesta O(suscriptores) y no depende del tamaño de la página.
+- Al conectarse, el cliente recibe primero las últimas ejecuciones del
+  execution log.
+
+Con varios workers (serve.py) cada stream muestra las ejecuciones del
+worker que lo atiende.
+
+Con gunicorn (gthread) cada stream abierto ocupa un hilo del worker, así que:
+- un stream se cierra a los EXECUTION_FEED_MAX_SECONDS (25, por debajo del
+  graceful timeout de serve.py) y el EventSource del dashboard se reconecta
+  solo (el reintento se anuncia con `retry:`); al reconectar recibe de nuevo
+  las últimas ejecuciones.
+- cada worker atiende como mucho EXECUTION_FEED_MAX_SUBSCRIBERS streams a la
+  vez (serve.py lo fija en una cuarta parte de sus hilos); los demás reciben
+  un 503 y el dashboard lo vuelve a intentar más tarde.
+"""
+
+from collections import deque
+import json
+import os
+import threading
+import time
+
+DEFAULT_QUEUE_SIZE = 100
+KEEPALIVE_SECONDS = 15
+MAX_STREAM_SECONDS = float(os.environ.get('EXECUTION_FEED_MAX_SECONDS', 25))
+MAX_SUBSCRIBERS = int(os.environ.get('EXECUTION_FEED_MAX_SUBSCRIBERS', 2))
+RECONNECT_MS = 3000
+
+class Subscription:
+    """Bounded, drop-oldest queue of records for one client"""
+
+    def __init__(self, maxlen):
+        self.queue = deque(maxlen=maxlen)
+        self.dropped = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def put(self, record):
+        with self.condition:
+            if len(self.queue) == self.queue.maxlen:
+                self.dropped += 1  # deque evicts the oldest record itself
+            self.queue.append(record)
+            self.condition.notify()
+
+    def drain(self, timeout):
+        """(records, dropped since last drain), waiting up to `timeout` seconds"""
+        with self.condition:
+            if not self.queue and not self.closed:
+                self.condition.wait(timeout)
+            records = list(self.queue)
+            self.queue.clear()
+            dropped, self.dropped = self.dropped, 0
+        return records, dropped
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+class ExecutionFeed:
+    """Fan-out of new execution records to SSE subscribers"""
+
+    def __init__(self, execution_log, queue_size=DEFAULT_QUEUE_SIZE,
+                 max_subscribers=MAX_SUBSCRIBERS, max_seconds=MAX_STREAM_SECONDS):
+        self.execution_log = execution_log
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.max_seconds = max_seconds
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    @property
+    def subscribers(self):
+        return len(self._subscribers)
+
+    def publish(self, record):
+        if not self._subscribers:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.put(record)
+
+    def subscribe(self):
+        """New subscription, or None when max_subscribers are already open"""
+        subscription = Subscription(self.queue_size)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+        subscription.close()
+
+    def open_stream(self, backlog=10):
+        """Generator of SSE messages, or None when this worker serves enough streams"""
+        subscription = self.subscribe()
+        if subscription is None:
+            return None
+        return self._stream(subscription, backlog)
+
+    def _stream(self, subscription, backlog):
+        # Ends after max_seconds (or when the client disconnects)
+        deadline = time.monotonic() + self.max_seconds
+        try:
+            yield f'retry: {RECONNECT_MS}\n\n'
+            for record in reversed(self.execution_log.recent(backlog)):
+                yield format_event('execution', record.to_dict())
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                records, dropped = subscription.drain(min(KEEPALIVE_SECONDS, remaining))
+                if dropped:
+                    yield format_event('dropped', {'dropped': dropped})
+                for record in records:
+                    yield format_event('execution', record.to_dict())
+                if not records and not dropped:
+                    yield ': keep-alive\n\n'
+        finally:
+            # Runs when the WSGI server closes the generator on disconnect
+            self.unsubscribe(subscription)
+
+def format_event(event, data):
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'
@@ -0,0 +1,79 @@
+"""
+Execution Log
+=============
+
+Ring buffer de tamaño fijo con las últimas ejecuciones de los servidores
+mock (mock_server.py y mock_server_25_models.py).
+
+- Inserción y desalojo O(1): el registro más antiguo se sobrescribe.
+- Thread-safe: los servidores Flask atienden requests en varios hilos.
+- Registros compactos (__slots__); el timestamp se formatea al leerlo.
+
+Capacidad configurable con la variable de entorno EXECUTION_LOG_SIZE.
+"""
+
+from datetime import datetime
+import os
+import threading
+import time
+
+DEFAULT_CAPACITY = int(os.environ.get('EXECUTION_LOG_SIZE', 100))
+
+class ExecutionRecord:
+    """One model execution, as shown on the dashboards"""
+
+    __slots__ = ('created', 'model', 'endpoint', 'status', 'duration')
+
+    def __init__(self, created, model, endpoint, status, duration):
+        self.created = created
+        self.model = model
+        self.endpoint = endpoint
+        self.status = status
+        self.duration = duration
+
+    @property
+    def timestamp(self):
+        return datetime.fromtimestamp(self.created).strftime('%Y-%m-%d %H:%M:%S')
+
+    def to_dict(self):
+        return {
+            'timestamp': self.timestamp,
+            'model': self.model,
+            'endpoint': self.endpoint,
+            'status': self.status,
+            'duration': self.duration
+        }
+
+class ExecutionLog:
+    """Fixed-capacity, thread-safe ring buffer of ExecutionRecord"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("Execution log capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0  # Executions recorded since startup, including evicted ones
+        self._entries = [None] * capacity
+        self._lock = threading.Lock()
+
+    def record(self, model, endpoint, status, start_time):
+        """Append an execution that started at start_time (time.time())"""
+        now = time.time()
+        entry = ExecutionRecord(now, model, endpoint, status, round((now - start_time) * 1000, 2))
+        with self._lock:
+            self._entries[self.total % self.capacity] = entry
+            self.total += 1
+        return entry
+
+    def recent(self, limit=10):
+        """Newest-first list of up to `limit` records"""
+        with self._lock:
+            count = min(limit, self.total, self.capacity)
+            end = self.total
+            return [self._entries[(end - 1 - i) % self.capacity] for i in range(count)]
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def __iter__(self):
+        """Oldest-first snapshot of the buffered records"""
+        return iter(self.recent(self.capacity)[::-1])
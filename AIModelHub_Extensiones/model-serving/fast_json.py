@@ -0,0 +1,99 @@
+"""
+Fast JSON
+=========
+
+Serialización JSON rápida para las respuestas de los servidores mock.
+
+- Usa orjson si está instalado (codifica directamente a bytes, en C) y la
+  librería estándar `json` si no; JSON_PROVIDER=stdlib fuerza la segunda.
+- La salida es la misma que la de Flask por defecto: claves ordenadas y sin
+  espacios.
+- fragment(): bloques constantes de una respuesta (p. ej. `health_ranges`
+  del BMI Calculator) que se codifican una sola vez al arrancar. Con
+  orjson >= 3.9 son orjson.Fragment; con json se insertan ya codificados
+  tras serializar el resto; con orjson < 3.9 se deja el valor tal cual,
+  porque codificarlo en C cuesta menos que insertarlo.
+- FastJSONProvider conecta todo con Flask (`app.json`), de modo que jsonify()
+  y request.get_json() usan esta ruta sin cambiar los handlers.
+
+Microbenchmark: python3 json_benchmark.py
+"""
+
+import json
+import os
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if os.environ.get('JSON_PROVIDER') == 'stdlib':
+    orjson = None
+
+BACKEND = 'orjson' if orjson is not None else 'stdlib'
+
+def _encode_constant(value):
+    return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+class SplicedFragment:
+    """Pre-encoded value for the stdlib encoder, spliced in after encoding"""
+
+    __slots__ = ('raw', 'token', 'placeholder')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.token = f'\x00fragment:{id(self)}'
+        self.placeholder = json.dumps(self.token)  # The token as it appears once encoded
+
+def fragment(value):
+    """Encode a constant JSON value once, for use inside responses"""
+    if orjson is None:
+        return SplicedFragment(_encode_constant(value))
+    if hasattr(orjson, 'Fragment'):
+        return orjson.Fragment(_encode_constant(value))
+    return value
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj):
+        """Compact, key-sorted JSON as bytes"""
+        # Sets, dates, decimals, dataclasses... are encoded as Flask would
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=_ORJSON_OPTIONS)
+
+    def loads(data):
+        return orjson.loads(data)
+else:
+    def dumps(obj):
+        """Compact, key-sorted JSON as bytes"""
+        spliced = []
+
+        def default(o):
+            if isinstance(o, SplicedFragment):
+                spliced.append(o)
+                return o.token
+            return DefaultJSONProvider.default(o)
+
+        text = json.dumps(obj, default=default, sort_keys=True, separators=(',', ':'))
+        for f in spliced:
+            text = text.replace(f.placeholder, f.raw, 1)
+        return text.encode('utf-8')
+
+    def loads(data):
+        return json.loads(data)
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by dumps()/loads() above"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes straight to the response (no str round trip)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
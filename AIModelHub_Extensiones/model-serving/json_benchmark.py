@@ -0,0 +1,89 @@
+"""
+JSON Benchmark
+==============
+
+Microbenchmark del costo de JSON por request (ver fast_json.py): compara el
+proveedor JSON por defecto de Flask con FastJSONProvider, primero solo la
+codificación de la respuesta y luego el request completo (parseo del body,
+handler y respuesta) contra el test client de Flask, sin latencia simulada.
+
+Uso:
+    python3 json_benchmark.py [--iterations 20000]
+"""
+
+import argparse
+import os
+import time
+
+os.environ['LATENCY_SCALE'] = '0'  # Measure JSON overhead, not simulated latency
+os.environ['MICRO_BATCHING'] = '0'
+os.environ['RESPONSE_CACHE'] = '0'
+
+from flask.json.provider import DefaultJSONProvider
+
+import fast_json
+from fast_json import FastJSONProvider
+import mock_server
+import mock_server_25_models
+
+# (label, app, endpoint, request body)
+CASES = [
+    ('fraud: transaction', mock_server_25_models.app, '/api/v1/fraud/transaction',
+     {'amount': 1250.0, 'merchant': 'electronics', 'location': 'international'}),
+    ('health: bmi (25 models)', mock_server_25_models.app, '/api/v1/health/bmi',
+     {'weight_kg': 82.5, 'height_m': 1.78}),
+    ('health: bmi (health_ranges fragment)', mock_server.app, '/api/v1/calculate-bmi',
+     {'weight_kg': 82.5, 'height_m': 1.78}),
+]
+
+def per_call_us(fn, iterations, repeat=3):
+    """Best-of-`repeat` mean time per call, in microseconds"""
+    fn()  # Warm up
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1e6
+
+def bench_encoding(app, endpoint, body, iterations):
+    """Microseconds to turn the handler's result into a response"""
+    result = app.test_client().post(endpoint, json=body).get_json()
+    fast_result = dict(result)
+    if 'health_ranges' in result:
+        fast_result['health_ranges'] = mock_server.BMI_HEALTH_RANGES  # As bmi_calculator returns it
+    with app.test_request_context(endpoint, method='POST', json=body):
+        flask_provider, fast_provider = DefaultJSONProvider(app), FastJSONProvider(app)
+        return {
+            'flask': per_call_us(lambda: flask_provider.response(result), iterations),
+            'fast': per_call_us(lambda: fast_provider.response(fast_result), iterations),
+        }
+
+def bench_request(app, endpoint, body, iterations):
+    """Microseconds for a full POST through the Flask test client"""
+    client = app.test_client()
+    fast_provider = app.json
+    timings = {}
+    for name, provider in (('flask', DefaultJSONProvider(app)), ('fast', fast_provider)):
+        app.json = provider
+        timings[name] = per_call_us(lambda: client.post(endpoint, json=body), iterations)
+    app.json = fast_provider
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-request JSON cost: Flask default vs fast_json')
+    parser.add_argument('--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"JSON backend: {fast_json.BACKEND}")
+    print(f"{'case':<40} {'stage':<10} {'flask µs':>10} {'fast µs':>10} {'saved µs':>10}")
+    for label, app, endpoint, body in CASES:
+        encoding = bench_encoding(app, endpoint, body, args.iterations)
+        full = bench_request(app, endpoint, body, max(args.iterations // 10, 1))
+        for stage, timings in (('encode', encoding), ('request', full)):
+            saved = timings['flask'] - timings['fast']
+            print(f"{label:<40} {stage:<10} {timings['flask']:>10.1f} {timings['fast']:>10.1f} {saved:>10.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""
+Latency Simulation
+==================
+
+Perfiles de latencia configurables y reproducibles para los modelos mock.
+
+Cada modelo tiene un perfil (distribución) y su propio generador aleatorio
+derivado de la semilla global, por lo que dos ejecuciones con la misma
+semilla ven exactamente la misma secuencia de latencias por modelo.
+
+Distribuciones:
+- uniform:   {"distribution": "uniform", "low": 0.2, "high": 0.5}
+- lognormal: {"distribution": "lognormal", "median": 0.3, "sigma": 0.4, "max": 2.0}
+- replay:    {"distribution": "replay", "samples_ms": [312, 298, ...]}
+             (tiempos reales de execution_history, reproducidos en orden)
+
+Variables de entorno:
+- LATENCY_SCALE:        factor global (0 = sin sleeps, para pruebas de throughput)
+- LATENCY_SEED:         semilla para secuencias deterministas
+- LATENCY_PROFILES:     ruta a un fichero JSON {"scale", "seed", "models":
+                        {clave: perfil}}, o ese mismo JSON en línea
+- LATENCY_REPLAY_FILE:  CSV exportado de execution_history con las columnas
+                        asset_id (o endpoint/model) y execution_time_ms
+"""
+
+import csv
+import json
+import math
+import os
+import random
+import threading
+import time
+
+# Simulated latency of a batch grows sub-linearly with its size, like a
+# real model amortizing its fixed cost over the rows of one forward pass
+BATCH_LATENCY_EXPONENT = 0.3
+
+# ============================================================================
+# DISTRIBUTIONS
+# ============================================================================
+
+class UniformLatency:
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def sample(self, rng):
+        return rng.uniform(self.low, self.high)
+
+class LognormalLatency:
+    def __init__(self, median, sigma, max=None):
+        self.mu = math.log(median)
+        self.sigma = sigma
+        self.max = max
+
+    def sample(self, rng):
+        value = rng.lognormvariate(self.mu, self.sigma)
+        return min(value, self.max) if self.max is not None else value
+
+class ReplayLatency:
+    """Replays recorded latencies (seconds) in order, wrapping around"""
+
+    def __init__(self, samples):
+        if not samples:
+            raise ValueError("Replay profile needs at least one recorded latency")
+        self.samples = list(samples)
+        self.position = 0
+
+    def sample(self, rng):
+        value = self.samples[self.position]
+        self.position = (self.position + 1) % len(self.samples)
+        return value
+
+def make_profile(spec):
+    """Build a latency profile from its JSON description"""
+    kind = spec.get('distribution', 'uniform')
+    if kind == 'uniform':
+        return UniformLatency(spec['low'], spec['high'])
+    if kind == 'lognormal':
+        return LognormalLatency(spec['median'], spec['sigma'], spec.get('max'))
+    if kind == 'replay':
+        return ReplayLatency([ms / 1000 for ms in spec['samples_ms']])
+    raise ValueError(f"Unknown latency distribution: {kind}")
+
+def load_profiles(value):
+    """LATENCY_PROFILES config: inline JSON when it starts with '{', else a file path"""
+    if value.lstrip().startswith('{'):
+        return json.loads(value)
+    with open(value) as f:
+        return json.load(f)
+
+def load_replay_file(path):
+    """{key: [seconds, ...]} from a CSV export of execution_history"""
+    timings = {}
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        key_column = next((c for c in ('asset_id', 'endpoint', 'model') if c in reader.fieldnames), None)
+        if key_column is None or 'execution_time_ms' not in reader.fieldnames:
+            raise ValueError(f"{path} needs an asset_id/endpoint/model column and execution_time_ms")
+        for row in reader:
+            if row['execution_time_ms']:
+                timings.setdefault(row[key_column], []).append(float(row['execution_time_ms']) / 1000)
+    return timings
+
+# ============================================================================
+# SIMULATOR
+# ============================================================================
+
+class LatencySimulator:
+    """Per-model latency profiles with a global scale and seed"""
+
+    def __init__(self, scale=1.0, seed=None, batch_exponent=BATCH_LATENCY_EXPONENT):
+        if scale < 0:
+            raise ValueError("Latency scale cannot be negative")
+        self.scale = scale
+        self.seed = seed
+        self.batch_exponent = batch_exponent
+        self._models = {}
+
+    def set_profile(self, key, profile):
+        # Seeding each model separately keeps its sequence independent of
+        # how requests to other models interleave with it
+        rng = random.Random(f'{self.seed}:{key}') if self.seed is not None else random.Random()
+        self._models[key] = (profile, rng, threading.Lock())
+
+    def sample(self, key, batch_size=1):
+        """Simulated latency in seconds for one call (of `batch_size` records)"""
+        if self.scale == 0:
+            return 0.0
+        profile, rng, lock = self._models[key]
+        with lock:
+            value = profile.sample(rng)
+        return value * self.scale * batch_size ** self.batch_exponent
+
+    def sleep(self, key, batch_size=1):
+        delay = self.sample(key, batch_size)
+        if delay > 0:
+            time.sleep(delay)
+
+    def describe(self):
+        return {
+            'scale': self.scale,
+            'seed': self.seed,
+            'models': {key: type(profile).__name__ for key, (profile, _, _) in self._models.items()}
+        }
+
+    @classmethod
+    def from_env(cls, defaults, aliases=None):
+        """Build a simulator from the LATENCY_* environment variables
+
+        `defaults` maps each model key to its (low, high) uniform range;
+        `aliases` optionally maps a key to other names (endpoint, asset id)
+        that profile and replay files may use for the same model.
+        """
+        config = load_profiles(os.environ['LATENCY_PROFILES']) if os.environ.get('LATENCY_PROFILES') else {}
+
+        scale = float(os.environ.get('LATENCY_SCALE', config.get('scale', 1.0)))
+        seed = os.environ.get('LATENCY_SEED', config.get('seed'))
+        simulator = cls(scale=scale, seed=seed)
+
+        overrides = config.get('models', {})
+        replay = load_replay_file(os.environ['LATENCY_REPLAY_FILE']) if os.environ.get('LATENCY_REPLAY_FILE') else {}
+        aliases = aliases or {}
+        for key, (low, high) in defaults.items():
+            names = [key] + list(aliases.get(key, ()))
+            spec = next((overrides[name] for name in names if name in overrides), None)
+            recorded = next((replay[name] for name in names if name in replay), None)
+            if spec is not None:
+                profile = make_profile(spec)
+            elif recorded:
+                profile = ReplayLatency(recorded)
+            else:
+                profile = UniformLatency(low, high)
+            simulator.set_profile(key, profile)
+        return simulator
@@ -0,0 +1,302 @@
+"""
+Load Generator
+==============
+
+Genera carga contra el servidor de 25 modelos desde la línea de comandos y
+reporta, por modelo, throughput, latencias p50/p95/p99 y tasa de errores en
+JSON y/o CSV, para seguir regresiones entre versiones.
+
+- Modelos: la lista `models` de database-scripts/generate_25_models.py (la
+  misma que se inserta en el catálogo); --group / --model filtran.
+- Inputs: filas de validation_datasets (ver validation_datasets.py) cuyas
+  columnas cubren el esquema del modelo; si ningún dataset sirve, un input
+  de ejemplo construido a partir del esquema.
+- Cada hilo reutiliza su propia conexión HTTP keep-alive.
+- Dos modos por modelo:
+    --concurrency N  lazo cerrado: N clientes, cada uno envía el siguiente
+                     request al recibir la respuesta anterior.
+    --rps R          lazo abierto: los requests se programan a R por segundo
+                     (con hasta --concurrency en vuelo) y la latencia se mide
+                     desde la hora programada, así que un servidor saturado
+                     no esconde su cola (coordinated omission).
+
+Uso:
+    python3 load_generator.py --concurrency 16 --duration 10 --json results.json
+    python3 load_generator.py --group flora --rps 200 --csv flora.csv
+"""
+
+import argparse
+import csv
+from datetime import datetime
+import http.client
+import itertools
+import json
+import math
+import os
+import queue
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'database-scripts'))
+
+from generate_25_models import models as CATALOG_MODELS
+from validation_datasets import load_datasets, model_inputs
+
+CSV_COLUMNS = ['id', 'name', 'endpoint', 'inputs', 'requests', 'errors', 'error_rate',
+               'throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms', 'mean_ms', 'max_ms']
+
+# ============================================================================
+# INPUTS
+# ============================================================================
+
+def schema_example(fields):
+    """Helper to build one request body from an input schema"""
+    example = {}
+    for field in fields:
+        kind = field.get('type')
+        if kind == 'float':
+            low, high = field.get('min'), field.get('max')
+            example[field['name']] = round((low + high) / 2, 3) if low is not None and high is not None else 1.0
+        elif kind == 'int':
+            example[field['name']] = 1
+        elif kind == 'array':
+            example[field['name']] = []
+        else:
+            example[field['name']] = f"sample {field['name']}"
+    return example
+
+def inputs_for(model, datasets):
+    """(source, request bodies) for a model: first matching dataset, or the schema"""
+    fields = model['input_features']['fields']
+    for dataset in datasets:
+        rows = model_inputs(dataset, fields)
+        if rows:
+            return dataset['id'], rows
+    return 'schema', [schema_example(fields)]
+
+# ============================================================================
+# LOAD
+# ============================================================================
+
+def percentile(sorted_values, q):
+    """Nearest-rank q-percentile (0..100) of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+class Client:
+    """One keep-alive HTTP connection, reopened after errors"""
+
+    def __init__(self, base_url, timeout):
+        url = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self._connect = lambda: connection_class(url.hostname, url.port, timeout=timeout)
+        self.prefix = url.path.rstrip('/')
+        self.connection = self._connect()
+
+    def post(self, endpoint, body):
+        """HTTP status of a POST (the response is read so the connection can be reused)"""
+        return self._post(endpoint, body)[0]
+
+    def post_json(self, endpoint, payload):
+        """(status, decoded JSON response) of a POST with a JSON body"""
+        status, body = self._post(endpoint, json.dumps(payload).encode('utf-8'))
+        return status, json.loads(body)
+
+    def _post(self, endpoint, body):
+        try:
+            self.connection.request('POST', self.prefix + endpoint, body=body,
+                                    headers={'Content-Type': 'application/json'})
+            response = self.connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            self.connection = self._connect()
+            raise
+
+    def close(self):
+        self.connection.close()
+
+class ModelRun:
+    """Latencies and errors of one model's run, filled by the worker threads"""
+
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms, status):
+        with self._lock:
+            self.latencies.append(latency_ms)
+            key = str(status)
+            self.statuses[key] = self.statuses.get(key, 0) + 1
+            if not isinstance(status, int) or status >= 400:
+                self.errors += 1
+
+def send(client, endpoint, body, run, started):
+    try:
+        status = client.post(endpoint, body)
+    except (OSError, http.client.HTTPException) as e:
+        status = type(e).__name__
+    run.record((time.perf_counter() - started) * 1000, status)
+
+def closed_loop(client, endpoint, next_body, run, deadline):
+    while time.perf_counter() < deadline:
+        send(client, endpoint, next_body(), run, time.perf_counter())
+
+def open_loop(client, endpoint, next_body, run, schedule):
+    while True:
+        scheduled = schedule.get()
+        if scheduled is None:
+            return
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        send(client, endpoint, next_body(), run, scheduled)
+
+def run_model(base_url, model, source, bodies, args):
+    """Drive one endpoint for args.duration seconds and summarize the run"""
+    encoded = [json.dumps(body).encode('utf-8') for body in bodies]
+    cycle = itertools.cycle(encoded)
+    lock = threading.Lock()
+
+    def next_body():
+        with lock:
+            return next(cycle)
+
+    clients = [Client(base_url, args.timeout) for _ in range(args.concurrency)]
+    for client in clients:
+        for body in encoded[:args.warmup]:  # Open the connection and warm the server
+            try:
+                client.post(model['endpoint'], body)
+            except (OSError, http.client.HTTPException):
+                pass
+
+    run = ModelRun()
+    schedule = queue.SimpleQueue()
+    start = time.perf_counter()
+    deadline = start + args.duration
+    if args.rps:
+        threads = [threading.Thread(target=open_loop, args=(c, model['endpoint'], next_body, run, schedule))
+                   for c in clients]
+    else:
+        threads = [threading.Thread(target=closed_loop, args=(c, model['endpoint'], next_body, run, deadline))
+                   for c in clients]
+    for thread in threads:
+        thread.start()
+    if args.rps:
+        for i in range(int(args.rps * args.duration)):
+            schedule.put(start + i / args.rps)
+        for _ in threads:
+            schedule.put(None)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        client.close()
+
+    latencies = sorted(run.latencies)
+    count = len(latencies)
+    return {
+        'id': model['id'],
+        'name': model['name'],
+        'endpoint': model['endpoint'],
+        'inputs': source,
+        'requests': count,
+        'errors': run.errors,
+        'error_rate': round(run.errors / count, 4) if count else None,
+        'throughput_rps': round(count / elapsed, 2) if elapsed else None,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'mean_ms': sum(latencies) / count if count else None,
+        'max_ms': latencies[-1] if count else None,
+        'statuses': run.statuses
+    }
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def _round(value):
+    return round(value, 2) if isinstance(value, float) else value
+
+def write_json(path, report):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+def write_csv(path, results):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+
+def print_row(result):
+    def ms(key):
+        return f"{result[key]:>8.1f}" if result[key] is not None else f"{'-':>8}"
+    print(f"{result['name']:<32} {result['requests']:>8} {result['errors']:>7} "
+          f"{result['throughput_rps'] or 0:>9.1f} {ms('p50_ms')} {ms('p95_ms')} {ms('p99_ms')}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the 25-model server endpoint by endpoint')
+    parser.add_argument('--url', default=os.environ.get('MODEL_SERVER_URL', 'http://localhost:8080'))
+    parser.add_argument('--group', action='append', help='Only models of this group (repeatable)')
+    parser.add_argument('--model', action='append', help='Only this model id or endpoint (repeatable)')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Connections per model (closed loop), or max in flight with --rps')
+    parser.add_argument('--rps', type=float, help='Target requests per second per model (open loop)')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds per model')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed requests per connection before each run')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Socket timeout in seconds')
+    parser.add_argument('--datasets', default=None, help='validation_datasets SQL script to take inputs from')
+    parser.add_argument('--json', dest='json_path', help='Write the report as JSON')
+    parser.add_argument('--csv', dest='csv_path', help='Write one CSV row per model')
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+
+    selected = [
+        model for model in CATALOG_MODELS
+        if (not args.group or model['id'].split('-')[1] in args.group)
+        and (not args.model or model['id'] in args.model or model['endpoint'] in args.model)
+    ]
+    if not selected:
+        parser.error('No model matches --group/--model')
+    datasets = load_datasets(args.datasets) if args.datasets else load_datasets()
+
+    mode = f"{args.rps:g} rps (max {args.concurrency} in flight)" if args.rps else f"{args.concurrency} connections"
+    print("=" * 80)
+    print(f"🔥 Load test: {len(selected)} models at {args.url}, {mode}, {args.duration:g} s each")
+    print("=" * 80)
+    print(f"{'model':<32} {'requests':>8} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+
+    results = []
+    for model in selected:
+        source, bodies = inputs_for(model, datasets)
+        result = run_model(args.url, model, source, bodies, args)
+        result = {key: _round(value) for key, value in result.items()}
+        results.append(result)
+        print_row(result)
+
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'url': args.url,
+        'mode': 'open' if args.rps else 'closed',
+        'concurrency': args.concurrency,
+        'target_rps': args.rps,
+        'duration_s': args.duration,
+        'results': results
+    }
+    if args.json_path:
+        write_json(args.json_path, report)
+        print(f"📄 JSON report: {args.json_path}")
+    if args.csv_path:
+        write_csv(args.csv_path, results)
+        print(f"📄 CSV report: {args.csv_path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+"""
+Metrics
+=======
+
+Telemetría en memoria constante para los servidores mock: por cada endpoint
+un contador de éxitos/errores y un histograma de latencia con buckets
+logarítmicos (8 buckets por duplicación, ~9% de error relativo), del que se
+obtienen p50/p90/p95/p99 sin guardar ejecuciones individuales.
+
+Los límites de los buckets son fijos, así que dos histogramas se pueden
+sumar (p. ej. los de varios workers). render_prometheus() exporta los mismos
+contadores en el formato de texto de Prometheus, usando un bucket por
+duplicación (0.1 ms * 2^k) como límites `le`.
+"""
+
+from datetime import datetime
+import math
+import threading
+import time
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram, in milliseconds"""
+
+    MIN_MS = 0.1             # Upper bound of the first bucket
+    BUCKETS_PER_DOUBLING = 8
+    NUM_BUCKETS = 8 * 22     # Up to ~420 s; slower requests land in the last bucket
+
+    __slots__ = ('counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    @classmethod
+    def bucket_index(cls, value_ms):
+        if value_ms <= cls.MIN_MS:
+            return 0
+        index = math.ceil(math.log2(value_ms / cls.MIN_MS) * cls.BUCKETS_PER_DOUBLING)
+        return min(index, cls.NUM_BUCKETS - 1)
+
+    @classmethod
+    def upper_bound(cls, index):
+        """Inclusive upper bound (ms) of bucket `index`"""
+        return cls.MIN_MS * 2 ** (index / cls.BUCKETS_PER_DOUBLING)
+
+    def observe(self, value_ms):
+        self.counts[self.bucket_index(value_ms)] += 1
+        self.count += 1
+        self.sum += value_ms
+        if value_ms < self.min:
+            self.min = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other):
+        """Add another histogram's observations into this one"""
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        """Estimated q-quantile (0..1), or None without observations"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                upper = self.upper_bound(i)
+                estimate = upper if i == 0 else math.sqrt(self.upper_bound(i - 1) * upper)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def to_dict(self):
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean': round(self.sum / self.count, 2),
+            'min': round(self.min, 2),
+            'max': round(self.max, 2),
+            'p50': round(self.quantile(0.50), 2),
+            'p90': round(self.quantile(0.90), 2),
+            'p95': round(self.quantile(0.95), 2),
+            'p99': round(self.quantile(0.99), 2)
+        }
+
+    def export_state(self):
+        """JSON-serializable state (sparse bucket counts)"""
+        return {
+            'buckets': {str(i): n for i, n in enumerate(self.counts) if n},
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        histogram = cls()
+        for i, n in state['buckets'].items():
+            histogram.counts[int(i)] = n
+        histogram.count = state['count']
+        histogram.sum = state['sum']
+        histogram.min = state['min'] if state['min'] is not None else math.inf
+        histogram.max = state['max']
+        return histogram
+
+    def cumulative_counts(self, step=BUCKETS_PER_DOUBLING):
+        """(upper bound ms, cumulative count) every `step` buckets"""
+        result = []
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if i % step == 0:
+                result.append((self.upper_bound(i), seen))
+        return result
+
+class EndpointMetrics:
+    """Counters and latency histogram of one endpoint"""
+
+    __slots__ = ('endpoint', 'model', 'group', 'success', 'errors', 'latency', 'lock')
+
+    def __init__(self, endpoint, model, group):
+        self.endpoint = endpoint
+        self.model = model
+        self.group = group
+        self.success = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+        self.lock = threading.Lock()
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                'endpoint': self.endpoint,
+                'model': self.model,
+                'group': self.group,
+                'requests': self.success + self.errors,
+                'success': self.success,
+                'errors': self.errors,
+                'latency_ms': self.latency.to_dict()
+            }
+
+class MetricsRegistry:
+    """Per-endpoint metrics for a server process"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.in_flight = 0
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def request_started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def endpoint(self, endpoint, model, group=''):
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            with self._lock:
+                stats = self._endpoints.setdefault(endpoint, EndpointMetrics(endpoint, model, group))
+        return stats
+
+    def observe(self, endpoint, model, group, status, duration_ms):
+        """Record one execution of `endpoint`"""
+        stats = self.endpoint(endpoint, model, group)
+        with stats.lock:
+            if status == 'success':
+                stats.success += 1
+            else:
+                stats.errors += 1
+            stats.latency.observe(duration_ms)
+
+    def export_state(self):
+        """Raw counters, for aggregating several worker processes"""
+        endpoints = {}
+        for stats in list(self._endpoints.values()):
+            with stats.lock:
+                endpoints[stats.endpoint] = {
+                    'model': stats.model,
+                    'group': stats.group,
+                    'success': stats.success,
+                    'errors': stats.errors,
+                    'latency': stats.latency.export_state()
+                }
+        return {'started': self.started, 'in_flight': self.in_flight, 'endpoints': endpoints}
+
+    def merge_state(self, state, include_in_flight=True):
+        """Add counters exported by another registry into this one"""
+        self.started = min(self.started, state['started'])
+        if include_in_flight:
+            self.in_flight += state['in_flight']
+        for endpoint, exported in state['endpoints'].items():
+            stats = self.endpoint(endpoint, exported['model'], exported['group'])
+            with stats.lock:
+                stats.success += exported['success']
+                stats.errors += exported['errors']
+                stats.latency.merge(LatencyHistogram.from_state(exported['latency']))
+
+    def snapshot(self):
+        """JSON-serializable view of every endpoint's metrics"""
+        endpoints = [stats.to_dict() for stats in list(self._endpoints.values())]
+        return {
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'total_requests': sum(e['requests'] for e in endpoints),
+            'total_errors': sum(e['errors'] for e in endpoints),
+            'in_flight': self.in_flight,
+            'endpoints': sorted(endpoints, key=lambda e: e['endpoint']),
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def render_prometheus(self):
+        """Prometheus text exposition (format 0.0.4) of the current counters"""
+        lines = [
+            '# HELP model_server_requests_total Model executions, by outcome.',
+            '# TYPE model_server_requests_total counter',
+        ]
+        histograms = []
+        errors = []
+        for stats in sorted(list(self._endpoints.values()), key=lambda e: e.endpoint):
+            labels = _labels(model=stats.model, group=stats.group, endpoint=stats.endpoint)
+            with stats.lock:
+                success, failed = stats.success, stats.errors
+                buckets = stats.latency.cumulative_counts()
+                count, total_ms = stats.latency.count, stats.latency.sum
+            lines.append(f'model_server_requests_total{{{labels},status="success"}} {success}')
+            lines.append(f'model_server_requests_total{{{labels},status="error"}} {failed}')
+            errors.append(f'model_server_request_errors_total{{{labels}}} {failed}')
+            for upper_ms, cumulative in buckets:
+                histograms.append(f'model_server_request_duration_seconds_bucket{{{labels},le="{upper_ms / 1000:g}"}} {cumulative}')
+            histograms.append(f'model_server_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            histograms.append(f'model_server_request_duration_seconds_sum{{{labels}}} {total_ms / 1000:.6f}')
+            histograms.append(f'model_server_request_duration_seconds_count{{{labels}}} {count}')
+
+        lines += [
+            '# HELP model_server_request_errors_total Model executions that failed.',
+            '# TYPE model_server_request_errors_total counter',
+        ] + errors + [
+            '# HELP model_server_request_duration_seconds Model execution latency.',
+            '# TYPE model_server_request_duration_seconds histogram',
+        ] + histograms + [
+            '# HELP model_server_requests_in_flight Requests currently being served.',
+            '# TYPE model_server_requests_in_flight gauge',
+            f'model_server_requests_in_flight {self.in_flight}',
+            '# HELP model_server_uptime_seconds Seconds since the server started.',
+            '# TYPE model_server_uptime_seconds gauge',
+            f'model_server_uptime_seconds {time.time() - self.started:.1f}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(**labels):
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items())
@@ -0,0 +1,112 @@
+"""
+Micro Batching
+==============
+
+Agrupa dinámicamente los requests de un solo registro que llegan a la vez
+para el mismo modelo (p. ej. los del ExecutionService del EDC) y los evalúa
+con una sola llamada vectorizada.
+
+- El primer request abre un batch; el batch se cierra al llegar a
+  MICRO_BATCH_MAX_SIZE registros o al pasar MICRO_BATCH_MAX_WAIT_MS.
+- Cada request espera su propio resultado (concurrent.futures.Future), así
+  que sirve tanto para hilos (Flask/gunicorn) como para asyncio
+  (asyncio.wrap_future en asgi_server.py).
+- Si la llamada vectorizada falla, cada registro se reintenta por separado
+  para que solo falle el request con datos inválidos.
+
+Variables de entorno: MICRO_BATCHING (0 = desactivado),
+MICRO_BATCH_MAX_SIZE (64), MICRO_BATCH_MAX_WAIT_MS (5).
+"""
+
+from concurrent.futures import Future
+import os
+import queue
+import threading
+import time
+
+ENABLED = os.environ.get('MICRO_BATCHING', '1') != '0'
+DEFAULT_MAX_BATCH_SIZE = int(os.environ.get('MICRO_BATCH_MAX_SIZE', 64))
+DEFAULT_MAX_WAIT_MS = float(os.environ.get('MICRO_BATCH_MAX_WAIT_MS', 5))
+
+class RecordError(Exception):
+    """A record the batch function answered with {'error': ...}"""
+
+def _failed(output):
+    return isinstance(output, dict) and set(output) == {'error'}
+
+class MicroBatcher:
+    """Coalesces concurrent single-record calls into batch_fn(list) calls"""
+
+    def __init__(self, batch_fn, max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                 max_wait_ms=DEFAULT_MAX_WAIT_MS, name='micro-batcher'):
+        if max_batch_size < 1:
+            raise ValueError("Micro-batch size must be at least 1")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.name = name
+        self.batches = 0
+        self.records = 0
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, data):
+        """Future with the output for one input record"""
+        if self._thread is None:
+            self._start()
+        future = Future()
+        self._queue.put((data, future))
+        return future
+
+    def submit(self, data):
+        """Output for one input record (blocks until its batch has run)"""
+        return self.enqueue(data).result()
+
+    def _start(self):
+        # Started on first use so forked workers each get their own thread
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())  # Take what is already queued
+                except queue.Empty:
+                    break
+            self._execute(batch)
+
+    def _execute(self, batch):
+        self.batches += 1
+        self.records += len(batch)
+        try:
+            outputs = self.batch_fn([data for data, _ in batch])
+        except Exception:
+            outputs = None
+
+        for i, (data, future) in enumerate(batch):
+            try:
+                output = outputs[i] if outputs is not None else self.batch_fn([data])[0]
+                if _failed(output):
+                    raise RecordError(output['error'])
+                future.set_result(output)
+            except Exception as e:
+                future.set_exception(e)
+
+    def describe(self):
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+            'batches': self.batches,
+            'records': self.records,
+            'mean_batch_size': round(self.records / self.batches, 2) if self.batches else None
+        }
@@ -14,18 +14,67 @@ Features:
 Puerto: 8080
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from datetime import datetime
 import time
 import random
 import json
 
+from execution_log import ExecutionLog
+from fast_json import FastJSONProvider, fragment
+from execution_feed import ExecutionFeed
+from execution_history import ExecutionHistory
+from latency import LatencySimulator
+from metrics import MetricsRegistry, PROMETHEUS_CONTENT_TYPE
+from shared_metrics import SharedMetrics
+from static_page import StaticPage
+import micro_batching
+from micro_batching import MicroBatcher
+from model_store import ModelStore
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)  # orjson when installed (see fast_json.py)
 CORS(app)  # Enable CORS for all routes
 
-# In-memory execution log
-execution_log = []
+# In-memory execution log (bounded ring buffer)
+execution_log = ExecutionLog()
+execution_feed = ExecutionFeed(execution_log)
+metrics = MetricsRegistry()
+# Set when running several worker processes (serve.py)
+shared_metrics = SharedMetrics.from_env(metrics, execution_log)
+# Full executions written to execution_history in batches (EXECUTION_HISTORY_URL)
+execution_history = ExecutionHistory.from_env()
+
+# execution_history.asset_id references assets(id): endpoints with a seeded
+# HttpData asset (000_init_database_complete.sql). The speech and BMI
+# endpoints have none, so their executions are not persisted
+HISTORY_ASSET_IDS = {
+    '/api/v1/predict': 'asset-user2-iris-classifier',
+    '/api/v1/sentiment': 'asset-user1-sentiment-api',
+    '/api/v1/classify-image': 'asset-user2-image-api',
+    '/api/v1/detect-fraud': 'asset-user1-fraud-api'
+}
+
+# Simulated latency per model (seconds); see latency.py for LATENCY_* overrides
+latency = LatencySimulator.from_env({
+    'iris_classifier': (0.5, 1.5),
+    'sentiment_analyzer': (0.3, 1.0),
+    'image_classifier': (1.0, 2.0),
+    'fraud_detector': (0.5, 1.2),
+    'speech_recognizer': (1.5, 3.0),
+    'bmi_calculator': (0.2, 0.6)
+})
+
+# Real scikit-learn iris model, loaded on first use and hot-reloaded (see
+# model_store.py); concurrent iris requests are scored together (see
+# micro_batching.py), always with the current model version
+model_store = ModelStore()
+model_store.register('iris_classifier', 'Iris Classifier')
+iris_batcher = None
+if micro_batching.ENABLED:
+    iris_batcher = MicroBatcher(lambda inputs: model_store.get('iris_classifier').predict_batch(inputs),
+                                name='batcher-iris')
 
 # ============================================================================
 # MODEL DEFINITIONS
@@ -33,7 +82,12 @@ execution_log = []
 
 def iris_classifier(data):
     """Simula clasificación de flores Iris"""
-    time.sleep(random.uniform(0.5, 1.5))  # Simular procesamiento
+    iris_model = model_store.get_optional('iris_classifier')
+    if iris_model is not None:
+        # Inferencia real, sin latencia simulada
+        return iris_batcher.submit(data) if iris_batcher else iris_model.predict(data)
+    
+    latency.sleep('iris_classifier')  # Simular procesamiento
     
     # Extraer features
     sepal_length = data.get('sepal_length', 5.0)
@@ -71,7 +125,7 @@ def iris_classifier(data):
 
 def sentiment_analyzer(data):
     """Simula análisis de sentimiento"""
-    time.sleep(random.uniform(0.3, 1.0))
+    latency.sleep('sentiment_analyzer')
     
     text = data.get('text', '')
     
@@ -107,7 +161,7 @@ def sentiment_analyzer(data):
 
 def image_classifier(data):
     """Simula clasificación de imágenes médicas (Chest X-Ray)"""
-    time.sleep(random.uniform(1.0, 2.0))  # Más lento, simula procesamiento pesado
+    latency.sleep('image_classifier')  # Más lento, simula procesamiento pesado
     
     # Datos de entrada esperados
     image_data = data.get('image_base64', '')
@@ -145,7 +199,7 @@ def image_classifier(data):
 
 def fraud_detector(data):
     """Simula detección de fraude en transacciones"""
-    time.sleep(random.uniform(0.5, 1.2))
+    latency.sleep('fraud_detector')
     
     # Datos de entrada esperados
     amount = data.get('transaction_amount', 100.0)
@@ -197,7 +251,7 @@ def fraud_detector(data):
 
 def speech_recognizer(data):
     """Simula reconocimiento automático de voz (ASR)"""
-    time.sleep(random.uniform(1.5, 3.0))  # Simula procesamiento de audio
+    latency.sleep('speech_recognizer')  # Simula procesamiento de audio
     
     # Datos de entrada esperados
     audio_duration = data.get('audio_duration_seconds', 5.0)
@@ -250,9 +304,17 @@ def speech_recognizer(data):
         'processing_time_ms': round(random.uniform(1500, 3000), 2)
     }
 
+# Same for every response: encoded once, spliced in as bytes
+BMI_HEALTH_RANGES = fragment({
+    'underweight': '< 18.5',
+    'normal': '18.5 - 24.9',
+    'overweight': '25 - 29.9',
+    'obese': '>= 30'
+})
+
 def bmi_calculator(data):
     """Calcula el Índice de Masa Corporal (BMI/IMC) y proporciona clasificación"""
-    time.sleep(random.uniform(0.2, 0.6))  # Procesamiento rápido
+    latency.sleep('bmi_calculator')  # Procesamiento rápido
     
     # Datos de entrada esperados
     weight_kg = data.get('weight_kg', 70.0)
@@ -301,12 +363,7 @@ def bmi_calculator(data):
             'weight_kg': weight_kg,
             'height_m': height_m
         },
-        'health_ranges': {
-            'underweight': '< 18.5',
-            'normal': '18.5 - 24.9',
-            'overweight': '25 - 29.9',
-            'obese': '>= 30'
-        },
+        'health_ranges': BMI_HEALTH_RANGES,
         'calculation': f'{weight_kg} / ({height_m}²) = {round(bmi, 2)}'
     }
 
@@ -314,296 +371,357 @@ def bmi_calculator(data):
 # API ENDPOINTS
 # ============================================================================
 
-@app.route('/')
-def home():
-    """Dashboard HTML"""
-    html = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>🤖 AI Model Server - Mock Dashboard</title>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1">
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body {
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: #333;
-                min-height: 100vh;
-                padding: 20px;
-            }
-            .container {
-                max-width: 1200px;
-                margin: 0 auto;
-            }
-            .header {
-                background: white;
-                padding: 30px;
-                border-radius: 15px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                margin-bottom: 30px;
-                text-align: center;
-            }
-            .header h1 {
-                color: #667eea;
-                font-size: 2.5rem;
-                margin-bottom: 10px;
-            }
-            .header .status {
-                display: inline-block;
-                background: #10b981;
-                color: white;
-                padding: 8px 20px;
-                border-radius: 20px;
-                font-weight: 600;
-                margin-top: 10px;
-            }
-            .header .status::before {
-                content: '●';
-                margin-right: 8px;
-                animation: pulse 2s infinite;
-            }
-            @keyframes pulse {
-                0%, 100% { opacity: 1; }
-                50% { opacity: 0.5; }
-            }
-            .stats {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                gap: 20px;
-                margin-bottom: 30px;
-            }
-            .stat-card {
-                background: white;
-                padding: 25px;
-                border-radius: 15px;
-                box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-                text-align: center;
-            }
-            .stat-card .number {
-                font-size: 2.5rem;
-                font-weight: bold;
-                color: #667eea;
-                margin: 10px 0;
-            }
-            .stat-card .label {
-                color: #666;
-                font-size: 0.9rem;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }
-            .models-section {
-                background: white;
-                padding: 30px;
-                border-radius: 15px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                margin-bottom: 30px;
-            }
-            .models-section h2 {
-                color: #667eea;
-                margin-bottom: 20px;
-                font-size: 1.8rem;
-            }
-            .model-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                gap: 20px;
-            }
-            .model-card {
-                border: 2px solid #e5e7eb;
-                padding: 20px;
-                border-radius: 10px;
-                transition: all 0.3s;
-            }
-            .model-card:hover {
-                border-color: #667eea;
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.2);
-                transform: translateY(-2px);
-            }
-            .model-card h3 {
-                color: #333;
-                margin-bottom: 10px;
-            }
-            .model-card .endpoint {
-                background: #f3f4f6;
-                padding: 8px 12px;
-                border-radius: 5px;
-                font-family: 'Courier New', monospace;
-                font-size: 0.85rem;
-                color: #667eea;
-                margin: 10px 0;
-                word-break: break-all;
-            }
-            .model-card .method {
-                display: inline-block;
-                background: #10b981;
-                color: white;
-                padding: 4px 10px;
-                border-radius: 5px;
-                font-size: 0.8rem;
-                font-weight: 600;
-                margin-right: 10px;
-            }
-            .log-section {
-                background: white;
-                padding: 30px;
-                border-radius: 15px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-            }
-            .log-section h2 {
-                color: #667eea;
-                margin-bottom: 20px;
-                font-size: 1.8rem;
-            }
-            .log-entry {
-                border-left: 4px solid #667eea;
-                background: #f9fafb;
-                padding: 15px;
-                margin-bottom: 15px;
-                border-radius: 5px;
-                font-size: 0.9rem;
-            }
-            .log-entry .timestamp {
-                color: #666;
-                font-size: 0.85rem;
-                margin-bottom: 5px;
-            }
-            .log-entry .status-success {
-                color: #10b981;
-                font-weight: 600;
-            }
-            .log-entry .status-error {
-                color: #ef4444;
-                font-weight: 600;
-            }
-            .refresh-btn {
-                background: #667eea;
-                color: white;
-                border: none;
-                padding: 12px 30px;
-                border-radius: 8px;
-                font-size: 1rem;
-                font-weight: 600;
-                cursor: pointer;
-                margin-top: 20px;
-                transition: background 0.3s;
-            }
-            .refresh-btn:hover {
-                background: #5568d3;
-            }
-            .empty-log {
-                text-align: center;
-                color: #999;
-                padding: 40px;
-                font-style: italic;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🤖 AI Model Server</h1>
-                <p style="color: #666; margin: 10px 0;">Mock Server for Model Execution Testing</p>
-                <div class="status">ONLINE</div>
+def log_execution(model, endpoint, status, start_time, data=None, output=None, error=None):
+    """Helper to log executions and update the endpoint's metrics
+
+    With EXECUTION_HISTORY_URL set, executions of the endpoints in
+    HISTORY_ASSET_IDS are also queued for execution_history.
+    """
+    entry = execution_log.record(model, endpoint, status, start_time)
+    execution_feed.publish(entry)
+    metrics.observe(endpoint, model, '', status, entry.duration)
+    asset_id = HISTORY_ASSET_IDS.get(endpoint)
+    if execution_history is not None and asset_id is not None:
+        execution_history.record(asset_id, status, start_time, data if data is not None else {},
+                                 output, error, 200 if status == 'success' else 500)
+
+DASHBOARD_PAGE = StaticPage("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>🤖 AI Model Server - Mock Dashboard</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: #333;
+            min-height: 100vh;
+            padding: 20px;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+        }
+        .header {
+            background: white;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+            margin-bottom: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            color: #667eea;
+            font-size: 2.5rem;
+            margin-bottom: 10px;
+        }
+        .header .status {
+            display: inline-block;
+            background: #10b981;
+            color: white;
+            padding: 8px 20px;
+            border-radius: 20px;
+            font-weight: 600;
+            margin-top: 10px;
+        }
+        .header .status::before {
+            content: '●';
+            margin-right: 8px;
+            animation: pulse 2s infinite;
+        }
+        @keyframes pulse {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.5; }
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .stat-card {
+            background: white;
+            padding: 25px;
+            border-radius: 15px;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+            text-align: center;
+        }
+        .stat-card .number {
+            font-size: 2.5rem;
+            font-weight: bold;
+            color: #667eea;
+            margin: 10px 0;
+        }
+        .stat-card .label {
+            color: #666;
+            font-size: 0.9rem;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        .models-section {
+            background: white;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+            margin-bottom: 30px;
+        }
+        .models-section h2 {
+            color: #667eea;
+            margin-bottom: 20px;
+            font-size: 1.8rem;
+        }
+        .model-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 20px;
+        }
+        .model-card {
+            border: 2px solid #e5e7eb;
+            padding: 20px;
+            border-radius: 10px;
+            transition: all 0.3s;
+        }
+        .model-card:hover {
+            border-color: #667eea;
+            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.2);
+            transform: translateY(-2px);
+        }
+        .model-card h3 {
+            color: #333;
+            margin-bottom: 10px;
+        }
+        .model-card .endpoint {
+            background: #f3f4f6;
+            padding: 8px 12px;
+            border-radius: 5px;
+            font-family: 'Courier New', monospace;
+            font-size: 0.85rem;
+            color: #667eea;
+            margin: 10px 0;
+            word-break: break-all;
+        }
+        .model-card .method {
+            display: inline-block;
+            background: #10b981;
+            color: white;
+            padding: 4px 10px;
+            border-radius: 5px;
+            font-size: 0.8rem;
+            font-weight: 600;
+            margin-right: 10px;
+        }
+        .log-section {
+            background: white;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+        }
+        .log-section h2 {
+            color: #667eea;
+            margin-bottom: 20px;
+            font-size: 1.8rem;
+        }
+        .log-entry {
+            border-left: 4px solid #667eea;
+            background: #f9fafb;
+            padding: 15px;
+            margin-bottom: 15px;
+            border-radius: 5px;
+            font-size: 0.9rem;
+        }
+        .log-entry .timestamp {
+            color: #666;
+            font-size: 0.85rem;
+            margin-bottom: 5px;
+        }
+        .log-entry .status-success {
+            color: #10b981;
+            font-weight: 600;
+        }
+        .log-entry .status-error {
+            color: #ef4444;
+            font-weight: 600;
+        }
+        .refresh-btn {
+            background: #667eea;
+            color: white;
+            border: none;
+            padding: 12px 30px;
+            border-radius: 8px;
+            font-size: 1rem;
+            font-weight: 600;
+            cursor: pointer;
+            margin-top: 20px;
+            transition: background 0.3s;
+        }
+        .refresh-btn:hover {
+            background: #5568d3;
+        }
+        .empty-log {
+            text-align: center;
+            color: #999;
+            padding: 40px;
+            font-style: italic;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🤖 AI Model Server</h1>
+            <p style="color: #666; margin: 10px 0;">Mock Server for Model Execution Testing</p>
+            <div class="status">ONLINE</div>
+        </div>
+        
+        <div class="stats">
+            <div class="stat-card">
+                <div class="label">Total Requests</div>
+                <div class="number" id="totalRequests">–</div>
             </div>
-            
-            <div class="stats">
-                <div class="stat-card">
-                    <div class="label">Total Requests</div>
-                    <div class="number" id="totalRequests">{{ total_requests }}</div>
-                </div>
-                <div class="stat-card">
-                    <div class="label">Available Models</div>
-                    <div class="number">4</div>
-                </div>
-                <div class="stat-card">
-                    <div class="label">Server Port</div>
-                    <div class="number">8080</div>
-                </div>
+            <div class="stat-card">
+                <div class="label">Available Models</div>
+                <div class="number">4</div>
             </div>
-            
-            <div class="models-section">
-                <h2>📊 Available Models</h2>
-                <div class="model-grid">
-                    <div class="model-card">
-                        <h3>🌸 Iris Classifier</h3>
-                        <p style="color: #666; margin: 10px 0;">Classifies iris flowers into species based on measurements</p>
-                        <div class="endpoint">POST /api/v1/predict</div>
-                        <div style="margin-top: 10px;">
-                            <span class="method">POST</span>
-                            <small style="color: #666;">Requires: sepal_length, sepal_width, petal_length, petal_width</small>
-                        </div>
+            <div class="stat-card">
+                <div class="label">Server Port</div>
+                <div class="number">8080</div>
+            </div>
+        </div>
+        
+        <div class="models-section">
+            <h2>📊 Available Models</h2>
+            <div class="model-grid">
+                <div class="model-card">
+                    <h3>🌸 Iris Classifier</h3>
+                    <p style="color: #666; margin: 10px 0;">Classifies iris flowers into species based on measurements</p>
+                    <div class="endpoint">POST /api/v1/predict</div>
+                    <div style="margin-top: 10px;">
+                        <span class="method">POST</span>
+                        <small style="color: #666;">Requires: sepal_length, sepal_width, petal_length, petal_width</small>
                     </div>
-                    
-                    <div class="model-card">
-                        <h3>💭 Sentiment Analyzer</h3>
-                        <p style="color: #666; margin: 10px 0;">Analyzes text sentiment (positive, negative, neutral)</p>
-                        <div class="endpoint">POST /api/v1/sentiment</div>
-                        <div style="margin-top: 10px;">
-                            <span class="method">POST</span>
-                            <small style="color: #666;">Requires: text</small>
-                        </div>
+                </div>
+                
+                <div class="model-card">
+                    <h3>💭 Sentiment Analyzer</h3>
+                    <p style="color: #666; margin: 10px 0;">Analyzes text sentiment (positive, negative, neutral)</p>
+                    <div class="endpoint">POST /api/v1/sentiment</div>
+                    <div style="margin-top: 10px;">
+                        <span class="method">POST</span>
+                        <small style="color: #666;">Requires: text</small>
                     </div>
-                    
-                    <div class="model-card">
-                        <h3>🖼️ Image Classifier</h3>
-                        <p style="color: #666; margin: 10px 0;">Classifies images into categories</p>
-                        <div class="endpoint">POST /api/v1/classify-image</div>
-                        <div style="margin-top: 10px;">
-                            <span class="method">POST</span>
-                            <small style="color: #666;">Requires: image_data or image_url</small>
-                        </div>
+                </div>
+                
+                <div class="model-card">
+                    <h3>🖼️ Image Classifier</h3>
+                    <p style="color: #666; margin: 10px 0;">Classifies images into categories</p>
+                    <div class="endpoint">POST /api/v1/classify-image</div>
+                    <div style="margin-top: 10px;">
+                        <span class="method">POST</span>
+                        <small style="color: #666;">Requires: image_data or image_url</small>
                     </div>
-                    
-                    <div class="model-card">
-                        <h3>⚖️ BMI Calculator</h3>
-                        <p style="color: #666; margin: 10px 0;">Calculates Body Mass Index and provides health classification</p>
-                        <div class="endpoint">POST /api/v1/calculate-bmi</div>
-                        <div style="margin-top: 10px;">
-                            <span class="method">POST</span>
-                            <small style="color: #666;">Requires: weight_kg, height_m</small>
-                        </div>
+                </div>
+                
+                <div class="model-card">
+                    <h3>⚖️ BMI Calculator</h3>
+                    <p style="color: #666; margin: 10px 0;">Calculates Body Mass Index and provides health classification</p>
+                    <div class="endpoint">POST /api/v1/calculate-bmi</div>
+                    <div style="margin-top: 10px;">
+                        <span class="method">POST</span>
+                        <small style="color: #666;">Requires: weight_kg, height_m</small>
                     </div>
                 </div>
             </div>
-            
-            <div class="log-section">
-                <h2>📝 Recent Executions</h2>
-                <div id="logContainer">
-                    {% if execution_log %}
-                        {% for log in execution_log[-10:][::-1] %}
-                        <div class="log-entry">
-                            <div class="timestamp">{{ log.timestamp }}</div>
-                            <div>
-                                <span class="status-{{ log.status }}">{{ log.status.upper() }}</span>
-                                <strong>{{ log.model }}</strong> - {{ log.endpoint }}
-                            </div>
-                            <div style="margin-top: 5px; color: #666;">
-                                Duration: {{ log.duration }}ms
-                            </div>
-                        </div>
-                        {% endfor %}
-                    {% else %}
-                        <div class="empty-log">
-                            No executions yet. Try calling one of the model endpoints!
-                        </div>
-                    {% endif %}
+        </div>
+        
+        <div class="log-section">
+            <h2>📝 Recent Executions</h2>
+            <div id="logContainer">
+                <div class="empty-log">
+                    No executions yet. Try calling one of the model endpoints!
                 </div>
-                <button class="refresh-btn" onclick="location.reload()">🔄 Refresh</button>
             </div>
+            <button class="refresh-btn" onclick="refreshStats()">🔄 Refresh</button>
         </div>
-        
-        <script>
-            // Auto-refresh every 5 seconds
-            setTimeout(() => location.reload(), 5000);
-        </script>
-    </body>
-    </html>
-    """
-    return render_template_string(html, 
-                                  execution_log=execution_log,
-                                  total_requests=len(execution_log))
+    </div>
+    
+    <script>
+        // The page itself is static (and cached): executions are pushed over
+        // server-sent events and only the request counter is polled
+        function logEntry(log) {
+            const entry = document.createElement('div');
+            entry.className = 'log-entry';
+            entry.innerHTML = '<div class="timestamp"></div><div><span></span> <strong></strong> - <span></span></div>' +
+                '<div style="margin-top: 5px; color: #666;"></div>';
+            entry.children[0].textContent = log.timestamp;
+            const status = entry.children[1].children[0];
+            status.className = 'status-' + log.status;
+            status.textContent = log.status.toUpperCase();
+            entry.children[1].children[1].textContent = log.model;
+            entry.children[1].children[2].textContent = log.endpoint;
+            entry.children[2].textContent = 'Duration: ' + log.duration + 'ms';
+            return entry;
+        }
+
+        async function refreshStats() {
+            try {
+                const response = await fetch('/api/v1/dashboard/stats', { cache: 'no-store' });
+                const stats = await response.json();
+                document.getElementById('totalRequests').textContent = stats.total_requests;
+            } catch (e) {
+                // Server restarting; keep the last value
+            }
+        }
+
+        const logContainer = document.getElementById('logContainer');
+        function connectFeed() {
+            const feed = new EventSource('/api/v1/executions/stream');
+            // Every (re)connection starts by replaying the latest executions
+            feed.addEventListener('open', () => logContainer.replaceChildren());
+            feed.addEventListener('execution', (event) => {
+                logContainer.prepend(logEntry(JSON.parse(event.data)));
+                while (logContainer.children.length > 10) {
+                    logContainer.lastElementChild.remove();
+                }
+            });
+            // The server ends streams periodically (EventSource reconnects by
+            // itself) and refuses them when busy (503: retry later)
+            feed.addEventListener('error', () => {
+                if (feed.readyState === EventSource.CLOSED) {
+                    setTimeout(connectFeed, 10000);
+                }
+            });
+        }
+        connectFeed();
+
+        refreshStats();
+        setInterval(() => { if (!document.hidden) refreshStats(); }, 5000);
+        document.addEventListener('visibilitychange', () => { if (!document.hidden) refreshStats(); });
+    </script>
+</body>
+</html>
+""")
+
+@app.route('/')
+def home():
+    """Dashboard HTML"""
+    return DASHBOARD_PAGE.response(request)
+
+@app.route('/api/v1/dashboard/stats', methods=['GET'])
+def dashboard_stats():
+    """Live counters polled by the dashboard"""
+    return jsonify({'total_requests': aggregated_metrics()[1]}), 200
+
+@app.route('/api/v1/executions/stream', methods=['GET'])
+def execution_stream():
+    """Server-sent events with each new execution (see execution_feed.py)"""
+    stream = execution_feed.open_stream()
+    if stream is None:
+        return jsonify({'error': 'Too many execution streams on this worker'}), 503, {'Retry-After': '10'}
+    return Response(stream, mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/v1/predict', methods=['POST'])
 def predict_iris():
@@ -615,24 +733,13 @@ def predict_iris():
         result = iris_classifier(data)
         
         # Log execution
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Iris Classifier',
-            'endpoint': '/api/v1/predict',
-            'status': 'success',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Iris Classifier', '/api/v1/predict', 'success', start_time, data, result)
         
         return jsonify(result), 200
     
     except Exception as e:
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Iris Classifier',
-            'endpoint': '/api/v1/predict',
-            'status': 'error',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Iris Classifier', '/api/v1/predict', 'error', start_time,
+                      request.get_json(silent=True), error=str(e))
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/v1/sentiment', methods=['POST'])
@@ -644,24 +751,13 @@ def analyze_sentiment():
         data = request.get_json()
         result = sentiment_analyzer(data)
         
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Sentiment Analyzer',
-            'endpoint': '/api/v1/sentiment',
-            'status': 'success',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Sentiment Analyzer', '/api/v1/sentiment', 'success', start_time, data, result)
         
         return jsonify(result), 200
     
     except Exception as e:
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Sentiment Analyzer',
-            'endpoint': '/api/v1/sentiment',
-            'status': 'error',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Sentiment Analyzer', '/api/v1/sentiment', 'error', start_time,
+                      request.get_json(silent=True), error=str(e))
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/v1/classify-image', methods=['POST'])
@@ -673,24 +769,13 @@ def classify_image():
         data = request.get_json()
         result = image_classifier(data)
         
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Chest X-Ray Classifier',
-            'endpoint': '/api/v1/classify-image',
-            'status': 'success',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Chest X-Ray Classifier', '/api/v1/classify-image', 'success', start_time, data, result)
         
         return jsonify(result), 200
     
     except Exception as e:
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Chest X-Ray Classifier',
-            'endpoint': '/api/v1/classify-image',
-            'status': 'error',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Chest X-Ray Classifier', '/api/v1/classify-image', 'error', start_time,
+                      request.get_json(silent=True), error=str(e))
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/v1/detect-fraud', methods=['POST'])
@@ -712,24 +797,13 @@ def detect_fraud():
         data = request.get_json()
         result = fraud_detector(data)
         
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Fraud Detector',
-            'endpoint': '/api/v1/detect-fraud',
-            'status': 'success',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Fraud Detector', '/api/v1/detect-fraud', 'success', start_time, data, result)
         
         return jsonify(result), 200
     
     except Exception as e:
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Fraud Detector',
-            'endpoint': '/api/v1/detect-fraud',
-            'status': 'error',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Fraud Detector', '/api/v1/detect-fraud', 'error', start_time,
+                      request.get_json(silent=True), error=str(e))
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/v1/transcribe-audio', methods=['POST'])
@@ -752,24 +826,13 @@ def transcribe_audio():
         data = request.get_json()
         result = speech_recognizer(data)
         
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Multilingual ASR',
-            'endpoint': '/api/v1/transcribe-audio',
-            'status': 'success',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Multilingual ASR', '/api/v1/transcribe-audio', 'success', start_time, data, result)
         
         return jsonify(result), 200
     
     except Exception as e:
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'Multilingual ASR',
-            'endpoint': '/api/v1/transcribe-audio',
-            'status': 'error',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('Multilingual ASR', '/api/v1/transcribe-audio', 'error', start_time,
+                      request.get_json(silent=True), error=str(e))
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/v1/calculate-bmi', methods=['POST'])
@@ -790,24 +853,13 @@ def calculate_bmi():
         data = request.get_json()
         result = bmi_calculator(data)
         
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'BMI Calculator',
-            'endpoint': '/api/v1/calculate-bmi',
-            'status': 'success',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('BMI Calculator', '/api/v1/calculate-bmi', 'success', start_time, data, result)
         
         return jsonify(result), 200
     
     except Exception as e:
-        execution_log.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'model': 'BMI Calculator',
-            'endpoint': '/api/v1/calculate-bmi',
-            'status': 'error',
-            'duration': round((time.time() - start_time) * 1000, 2)
-        })
+        log_execution('BMI Calculator', '/api/v1/calculate-bmi', 'error', start_time,
+                      request.get_json(silent=True), error=str(e))
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/v1/health', methods=['GET'])
@@ -816,10 +868,37 @@ def health():
     return jsonify({
         'status': 'healthy',
         'models': ['iris-classifier', 'sentiment-analyzer', 'image-classifier', 'bmi-calculator'],
-        'total_requests': len(execution_log),
+        'total_requests': aggregated_metrics()[1],
         'timestamp': datetime.now().isoformat()
     }), 200
 
+@app.route('/api/v1/metrics', methods=['GET'])
+def metrics_snapshot():
+    """Per-endpoint request counters and latency percentiles"""
+    snapshot = aggregated_metrics()[0].snapshot()
+    if execution_history is not None:
+        snapshot['execution_history'] = execution_history.describe()
+    return jsonify(snapshot), 200
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus scrape endpoint, rendered from the aggregated counters"""
+    return Response(aggregated_metrics()[0].render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+def aggregated_metrics():
+    """Helper returning (metrics, total executions) across all workers"""
+    if shared_metrics is None:
+        return metrics, execution_log.total
+    return shared_metrics.aggregate()
+
+@app.before_request
+def track_request_start():
+    metrics.request_started()
+
+@app.teardown_request
+def track_request_end(exc=None):
+    metrics.request_finished()
+
 if __name__ == '__main__':
     print("=" * 70)
     print("🤖 AI Model Mock Server Starting...")
@@ -831,6 +910,8 @@ if __name__ == '__main__':
     print(f"   - POST http://localhost:8080/api/v1/classify-image (Image Classifier)")
     print(f"   - POST http://localhost:8080/api/v1/calculate-bmi (BMI Calculator) ⭐ NEW")
     print(f"   - GET  http://localhost:8080/api/v1/health (Health Check)")
+    print(f"   - GET  http://localhost:8080/api/v1/metrics (Latency & Error Metrics)")
+    print(f"   - GET  http://localhost:8080/metrics (Prometheus)")
     print("=" * 70)
     print("✨ Server ready for model execution testing!")
     print("=" * 70)
@@ -14,17 +14,67 @@ Cada grupo comparte el mismo esquema de input para benchmarking comparativo.
 Puerto: 8080
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import os
 import time
 import random
 import json
 
+from model_registry import GROUPS, MODELS, load_catalog, models_in_group
+from execution_log import ExecutionLog
+from fast_json import FastJSONProvider
+from execution_feed import ExecutionFeed
+from execution_history import ExecutionHistory
+from latency import LatencySimulator
+from metrics import MetricsRegistry, PROMETHEUS_CONTENT_TYPE
+from shared_metrics import SharedMetrics
+from static_page import StaticPage
+import micro_batching
+from micro_batching import MicroBatcher
+from model_store import ModelStore
+import response_cache
+from response_cache import ResponseCache, canonical_key
+from validation_datasets import load_datasets, model_inputs
+import vectorized_models
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)  # orjson when installed (see fast_json.py)
 CORS(app)
 
-execution_log = []
+execution_log = ExecutionLog()
+execution_feed = ExecutionFeed(execution_log)
+# Full executions written to execution_history in batches (EXECUTION_HISTORY_URL)
+execution_history = ExecutionHistory.from_env()
+metrics = MetricsRegistry()
+# Set when running several worker processes (serve.py)
+shared_metrics = SharedMetrics.from_env(metrics, execution_log)
+
+# Simulated latency per model; defaults come from the registry ranges and
+# can be replaced with LATENCY_* profiles (see latency.py)
+latency = LatencySimulator.from_env(
+    {model['handler']: model['latency'] for model in MODELS},
+    aliases={model['handler']: (model['endpoint'], model['id']) for model in MODELS}
+)
+
+# Real scikit-learn models (see model_store.py), loaded on first use and
+# hot-reloaded when their artifact changes; handler -> artifact name
+model_store = ModelStore()
+model_store.register('iris_classifier', 'Iris Classifier')
+REAL_MODELS = {handler: handler for handler in ('iris_classifier',) if model_store.available(handler)}
+
+def real_model(handler):
+    """Helper returning the real model serving a handler, or None"""
+    name = REAL_MODELS.get(handler)
+    return model_store.get_optional(name) if name else None
+
+def simulate_latency(model, batch_size=1):
+    """Helper to sleep the simulated latency, unless a real model serves the call"""
+    if real_model(model['handler']) is None:
+        latency.sleep(model['handler'], batch_size)
 
 # ============================================================================
 # GRUPO 1: COMPUTER VISION - MEDICAL IMAGING
@@ -33,7 +83,6 @@ execution_log = []
 
 def chest_xray_classifier(data):
     """Chest X-Ray Classifier - Classifies chest X-rays"""
-    time.sleep(random.uniform(0.8, 1.5))
     conditions = ['Normal', 'Pneumonia', 'COVID-19', 'Tuberculosis', 'Lung Cancer']
     predicted = random.choice(conditions)
     confidence = random.uniform(0.75, 0.95)
@@ -47,7 +96,6 @@ def chest_xray_classifier(data):
 
 def pneumonia_detector(data):
     """Pneumonia Detection API - Detects pneumonia in lung images"""
-    time.sleep(random.uniform(0.7, 1.4))
     result = random.choice(['No_Pneumonia', 'Bacterial_Pneumonia', 'Viral_Pneumonia'])
     confidence = random.uniform(0.78, 0.96)
     
@@ -61,7 +109,6 @@ def pneumonia_detector(data):
 
 def covid19_screener(data):
     """COVID-19 Screening API - Screens for COVID-19 from medical images"""
-    time.sleep(random.uniform(0.9, 1.6))
     result = random.choice(['Negative', 'Positive', 'Probable'])
     confidence = random.uniform(0.72, 0.94)
     
@@ -75,7 +122,6 @@ def covid19_screener(data):
 
 def lung_nodule_detector(data):
     """Lung Nodule Detector API - Detects and classifies lung nodules"""
-    time.sleep(random.uniform(1.0, 1.7))
     has_nodule = random.choice([True, False])
     nodule_type = random.choice(['Benign', 'Malignant', 'Indeterminate']) if has_nodule else 'None'
     confidence = random.uniform(0.76, 0.93)
@@ -91,7 +137,6 @@ def lung_nodule_detector(data):
 
 def tuberculosis_classifier(data):
     """Tuberculosis Classifier API - Classifies TB presence"""
-    time.sleep(random.uniform(0.8, 1.5))
     result = random.choice(['Normal', 'TB_Active', 'TB_Latent', 'TB_Suspected'])
     confidence = random.uniform(0.74, 0.92)
     
@@ -110,7 +155,6 @@ def tuberculosis_classifier(data):
 
 def ecommerce_sentiment(data):
     """E-commerce Review Sentiment API - Analyzes product reviews"""
-    time.sleep(random.uniform(0.3, 0.8))
     text = data.get('text', '')
     
     positive_words = ['good', 'great', 'excellent', 'love', 'amazing']
@@ -139,7 +183,6 @@ def ecommerce_sentiment(data):
 
 def twitter_sentiment(data):
     """Twitter Sentiment Analyzer API - Analyzes social media sentiment"""
-    time.sleep(random.uniform(0.2, 0.7))
     sentiments = ['positive', 'negative', 'neutral']
     sentiment = random.choice(sentiments)
     confidence = random.uniform(0.68, 0.92)
@@ -154,7 +197,6 @@ def twitter_sentiment(data):
 
 def product_review_classifier(data):
     """Product Review Classifier API - Classifies product reviews"""
-    time.sleep(random.uniform(0.3, 0.9))
     sentiment = random.choice(['very_positive', 'positive', 'neutral', 'negative', 'very_negative'])
     confidence = random.uniform(0.71, 0.94)
     
@@ -168,7 +210,6 @@ def product_review_classifier(data):
 
 def customer_feedback_analyzer(data):
     """Customer Feedback Analyzer API - Analyzes customer feedback"""
-    time.sleep(random.uniform(0.4, 0.9))
     sentiment = random.choice(['satisfied', 'dissatisfied', 'neutral'])
     confidence = random.uniform(0.69, 0.93)
     
@@ -183,7 +224,6 @@ def customer_feedback_analyzer(data):
 
 def social_media_sentiment(data):
     """Social Media Sentiment API - General social media sentiment"""
-    time.sleep(random.uniform(0.3, 0.8))
     sentiment = random.choice(['positive', 'negative', 'neutral', 'mixed'])
     confidence = random.uniform(0.70, 0.91)
     
@@ -203,7 +243,6 @@ def social_media_sentiment(data):
 
 def bmi_calculator(data):
     """BMI Calculator - Calculates Body Mass Index"""
-    time.sleep(random.uniform(0.2, 0.5))
     weight_kg = data.get('weight_kg', 70.0)
     height_m = data.get('height_m', 1.75)
     
@@ -229,7 +268,6 @@ def bmi_calculator(data):
 
 def body_fat_estimator(data):
     """Body Fat Percentage Estimator API - Estimates body fat percentage"""
-    time.sleep(random.uniform(0.3, 0.6))
     weight_kg = data.get('weight_kg', 70.0)
     height_m = data.get('height_m', 1.75)
     
@@ -247,7 +285,6 @@ def body_fat_estimator(data):
 
 def bmr_calculator(data):
     """Basal Metabolic Rate Calculator API - Calculates daily calorie needs"""
-    time.sleep(random.uniform(0.2, 0.5))
     weight_kg = data.get('weight_kg', 70.0)
     height_m = data.get('height_m', 1.75)
     
@@ -268,7 +305,6 @@ def bmr_calculator(data):
 
 def ideal_weight_predictor(data):
     """Ideal Weight Predictor API - Predicts ideal weight"""
-    time.sleep(random.uniform(0.3, 0.6))
     height_m = data.get('height_m', 1.75)
     
     # Hamwi formula (male)
@@ -285,7 +321,6 @@ def ideal_weight_predictor(data):
 
 def health_risk_assessor(data):
     """Health Risk Assessor API - Assesses health risks"""
-    time.sleep(random.uniform(0.4, 0.7))
     weight_kg = data.get('weight_kg', 70.0)
     height_m = data.get('height_m', 1.75)
     
@@ -316,7 +351,10 @@ def health_risk_assessor(data):
 
 def iris_classifier(data):
     """Iris Species Classifier API - Classifies iris flowers"""
-    time.sleep(random.uniform(0.4, 0.9))
+    iris_model = real_model('iris_classifier')
+    if iris_model is not None:
+        return iris_model.predict(data)
+    
     petal_length = data.get('petal_length', 4.0)
     
     if petal_length < 2.5:
@@ -337,7 +375,6 @@ def iris_classifier(data):
 
 def flower_type_classifier(data):
     """Flower Type Classifier API - Classifies flower types"""
-    time.sleep(random.uniform(0.5, 1.0))
     flowers = ['Rose', 'Tulip', 'Sunflower', 'Daisy', 'Lily']
     prediction = random.choice(flowers)
     confidence = random.uniform(0.82, 0.96)
@@ -352,7 +389,6 @@ def flower_type_classifier(data):
 
 def plant_species_identifier(data):
     """Plant Species Identifier API - Identifies plant species"""
-    time.sleep(random.uniform(0.6, 1.1))
     species = ['Ficus', 'Monstera', 'Pothos', 'Snake Plant', 'Peace Lily']
     prediction = random.choice(species)
     confidence = random.uniform(0.79, 0.94)
@@ -367,7 +403,6 @@ def plant_species_identifier(data):
 
 def botanical_classifier(data):
     """Botanical Classifier API - Botanical classification"""
-    time.sleep(random.uniform(0.5, 1.0))
     families = ['Rosaceae', 'Asteraceae', 'Fabaceae', 'Lamiaceae', 'Solanaceae']
     prediction = random.choice(families)
     confidence = random.uniform(0.81, 0.95)
@@ -382,7 +417,6 @@ def botanical_classifier(data):
 
 def flora_recognition(data):
     """Flora Recognition API - General flora recognition"""
-    time.sleep(random.uniform(0.5, 1.0))
     categories = ['Flowering Plant', 'Conifer', 'Fern', 'Succulent', 'Grass']
     prediction = random.choice(categories)
     confidence = random.uniform(0.83, 0.97)
@@ -402,7 +436,6 @@ def flora_recognition(data):
 
 def fraud_detector(data):
     """Real-Time Transaction Fraud Detector API"""
-    time.sleep(random.uniform(0.5, 1.0))
     amount = data.get('amount', 100.0)
     
     fraud_score = 0.0
@@ -424,7 +457,6 @@ def fraud_detector(data):
 
 def credit_card_fraud(data):
     """Credit Card Fraud Detector API"""
-    time.sleep(random.uniform(0.5, 1.1))
     amount = data.get('amount', 100.0)
     
     fraud_score = random.uniform(0.1, 0.9)
@@ -441,7 +473,6 @@ def credit_card_fraud(data):
 
 def payment_anomaly_detector(data):
     """Payment Anomaly Detector API"""
-    time.sleep(random.uniform(0.4, 0.9))
     amount = data.get('amount', 100.0)
     
     anomaly_score = random.uniform(0.0, 1.0)
@@ -457,7 +488,6 @@ def payment_anomaly_detector(data):
 
 def transaction_risk_scorer(data):
     """Transaction Risk Scorer API"""
-    time.sleep(random.uniform(0.5, 1.0))
     amount = data.get('amount', 100.0)
     
     risk_score = random.uniform(0, 100)
@@ -474,7 +504,6 @@ def transaction_risk_scorer(data):
 
 def financial_fraud_classifier(data):
     """Financial Fraud Classifier API"""
-    time.sleep(random.uniform(0.6, 1.2))
     
     fraud_types = ['Card Fraud', 'Identity Theft', 'Account Takeover', 'Legitimate', 'Suspicious']
     prediction = random.choice(fraud_types)
@@ -489,605 +518,640 @@ def financial_fraud_classifier(data):
     }
 
 # ============================================================================
-# API ENDPOINTS - 25 MODELS
+# API ENDPOINTS - MODEL REGISTRY DISPATCH
 # ============================================================================
 
-# Grupo 1: Computer Vision
-@app.route('/api/v1/vision/chest-xray', methods=['POST'])
-def api_chest_xray():
-    start = time.time()
-    try:
-        result = chest_xray_classifier(request.get_json())
-        log_execution('Chest X-Ray Classifier', '/api/v1/vision/chest-xray', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Chest X-Ray Classifier', '/api/v1/vision/chest-xray', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/vision/pneumonia', methods=['POST'])
-def api_pneumonia():
-    start = time.time()
-    try:
-        result = pneumonia_detector(request.get_json())
-        log_execution('Pneumonia Detector', '/api/v1/vision/pneumonia', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Pneumonia Detector', '/api/v1/vision/pneumonia', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/vision/covid19', methods=['POST'])
-def api_covid19():
-    start = time.time()
-    try:
-        result = covid19_screener(request.get_json())
-        log_execution('COVID-19 Screener', '/api/v1/vision/covid19', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('COVID-19 Screener', '/api/v1/vision/covid19', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/vision/lung-nodule', methods=['POST'])
-def api_lung_nodule():
-    start = time.time()
-    try:
-        result = lung_nodule_detector(request.get_json())
-        log_execution('Lung Nodule Detector', '/api/v1/vision/lung-nodule', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Lung Nodule Detector', '/api/v1/vision/lung-nodule', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/vision/tuberculosis', methods=['POST'])
-def api_tuberculosis():
-    start = time.time()
-    try:
-        result = tuberculosis_classifier(request.get_json())
-        log_execution('Tuberculosis Classifier', '/api/v1/vision/tuberculosis', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Tuberculosis Classifier', '/api/v1/vision/tuberculosis', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-# Grupo 2: NLP Sentiment
-@app.route('/api/v1/nlp/ecommerce-sentiment', methods=['POST'])
-def api_ecommerce_sentiment():
-    start = time.time()
-    try:
-        result = ecommerce_sentiment(request.get_json())
-        log_execution('E-commerce Sentiment', '/api/v1/nlp/ecommerce-sentiment', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('E-commerce Sentiment', '/api/v1/nlp/ecommerce-sentiment', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/nlp/twitter-sentiment', methods=['POST'])
-def api_twitter_sentiment():
-    start = time.time()
-    try:
-        result = twitter_sentiment(request.get_json())
-        log_execution('Twitter Sentiment', '/api/v1/nlp/twitter-sentiment', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Twitter Sentiment', '/api/v1/nlp/twitter-sentiment', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/nlp/product-review', methods=['POST'])
-def api_product_review():
-    start = time.time()
-    try:
-        result = product_review_classifier(request.get_json())
-        log_execution('Product Review Classifier', '/api/v1/nlp/product-review', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Product Review Classifier', '/api/v1/nlp/product-review', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/nlp/customer-feedback', methods=['POST'])
-def api_customer_feedback():
-    start = time.time()
-    try:
-        result = customer_feedback_analyzer(request.get_json())
-        log_execution('Customer Feedback Analyzer', '/api/v1/nlp/customer-feedback', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Customer Feedback Analyzer', '/api/v1/nlp/customer-feedback', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/nlp/social-media', methods=['POST'])
-def api_social_media():
-    start = time.time()
-    try:
-        result = social_media_sentiment(request.get_json())
-        log_execution('Social Media Sentiment', '/api/v1/nlp/social-media', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Social Media Sentiment', '/api/v1/nlp/social-media', 'error', start)
-        return jsonify({'error': str(e)}), 500
+MODEL_FUNCTIONS = {fn.__name__: fn for fn in (
+    chest_xray_classifier, pneumonia_detector, covid19_screener,
+    lung_nodule_detector, tuberculosis_classifier,
+    ecommerce_sentiment, twitter_sentiment, product_review_classifier,
+    customer_feedback_analyzer, social_media_sentiment,
+    bmi_calculator, body_fat_estimator, bmr_calculator,
+    ideal_weight_predictor, health_risk_assessor,
+    iris_classifier, flower_type_classifier, plant_species_identifier,
+    botanical_classifier, flora_recognition,
+    fraud_detector, credit_card_fraud, payment_anomaly_detector,
+    transaction_risk_scorer, financial_fraud_classifier,
+)}
+
+# endpoint -> (model entry, model function), resolved once at startup
+ROUTES = {model['endpoint']: (model, MODEL_FUNCTIONS[model['handler']]) for model in MODELS}
+
+# Models of a generated catalog (CATALOG_FILE, a CSV written by
+# database-scripts/generate_synthetic_catalog.py), each served by its
+# template's handler. They share the dict lookup above: no Flask rule per model.
+# A catalog never replaces a built-in endpoint (load_catalog raises instead)
+CATALOG_FILE = os.environ.get('CATALOG_FILE')
+if CATALOG_FILE:
+    ROUTES.update((model['endpoint'], (model, MODEL_FUNCTIONS[model['handler']]))
+                  for model in load_catalog(CATALOG_FILE, reserved=ROUTES))
+
+MAX_BATCH_SIZE = 1000
+
+def run_batch(model, model_fn, inputs):
+    """Run a model over a list of inputs, isolating per-record errors
+
+    Real scikit-learn models score the batch with predict_proba; if a record
+    is invalid, each record is scored by the real model on its own, so only
+    that one fails (a loaded model never falls back to the mock rules).
+    Models with a NumPy implementation score the batch column-wise; batches
+    they cannot handle fall back to the scalar per-record path.
+    """
+    loaded = real_model(model['handler'])
+    if loaded is not None:
+        try:
+            return loaded.predict_batch(inputs)
+        except Exception:
+            pass
+        outputs = []
+        for data in inputs:
+            try:
+                outputs.append(loaded.predict(data))
+            except Exception as e:
+                outputs.append({'error': str(e)})
+        return outputs
+
+    if model['handler'] in vectorized_models.BATCH_MODELS:
+        try:
+            return vectorized_models.score_batch(model['handler'], inputs)
+        except (TypeError, ValueError, AttributeError, FloatingPointError):
+            pass
+
+    outputs = []
+    for data in inputs:
+        try:
+            outputs.append(model_fn(data))
+        except Exception as e:
+            outputs.append({'error': str(e)})
+    return outputs
+
+# Single-record calls to models with a batch implementation are coalesced
+# across concurrent requests into one run_batch call (see micro_batching.py)
+BATCHERS = {
+    model['handler']: MicroBatcher(partial(run_batch, model, MODEL_FUNCTIONS[model['handler']]),
+                                   name=f"batcher-{model['handler']}")
+    for model in MODELS
+    if micro_batching.ENABLED
+    and (model['handler'] in REAL_MODELS or model['handler'] in vectorized_models.BATCH_MODELS)
+}
+
+def call_model(model, model_fn, data):
+    """Helper to score one record, through the model's micro-batcher if it has one"""
+    batcher = BATCHERS.get(model['handler'])
+    return batcher.submit(data) if batcher is not None else model_fn(data)
+
+# Response caches of the deterministic models, by handler (see response_cache.py)
+RESPONSE_CACHES = {
+    model['handler']: ResponseCache()
+    for model in MODELS
+    if model.get('cacheable') and response_cache.ENABLED
+}
+
+def lookup_cached(model, data):
+    """Helper returning (cache, key, cached result) for one record"""
+    cache = RESPONSE_CACHES.get(model['handler'])
+    if cache is None:
+        return None, None, None
+    key = canonical_key(data)
+    return cache, key, cache.get(key)
+
+def cached_batch(model, model_fn, inputs):
+    """Run a batch through the model's response cache
+
+    Returns (outputs, computed): only cache misses reach the model, and
+    `computed` says how many did, for the simulated latency.
+    """
+    cache = RESPONSE_CACHES.get(model['handler'])
+    if cache is None:
+        return run_batch(model, model_fn, inputs), len(inputs)
+    keys = [canonical_key(data) for data in inputs]
+    outputs = [cache.get(key) for key in keys]
+    missing = [i for i, output in enumerate(outputs) if output is None]
+    if missing:
+        computed = run_batch(model, model_fn, [inputs[i] for i in missing])
+        for i, output in zip(missing, computed):
+            outputs[i] = output
+            if 'error' not in output:
+                cache.put(keys[i], output)
+    return outputs, len(missing)
+
+class BatchRequestError(ValueError):
+    """Malformed batch request body (answered with HTTP 400)"""
+
+def resolve_route(path):
+    """(model, model function, is_batch) for a request path, or None"""
+    is_batch = path.endswith('/batch')
+    route = ROUTES.get(path[:-len('/batch')] if is_batch else path)
+    return route + (is_batch,) if route else None
+
+def batch_inputs(data):
+    """Validate a batch request body and return its list of inputs"""
+    inputs = data.get('inputs') if isinstance(data, dict) else data
+    if not isinstance(inputs, list) or not inputs:
+        raise BatchRequestError('Batch requests need a non-empty "inputs" list')
+    if len(inputs) > MAX_BATCH_SIZE:
+        raise BatchRequestError(f'Batch size {len(inputs)} exceeds the limit of {MAX_BATCH_SIZE}')
+    return inputs
+
+def batch_response(model, outputs):
+    return {
+        'model': model['name'],
+        'batch_size': len(outputs),
+        'outputs': outputs
+    }
 
-# Grupo 3: Health Regression
-@app.route('/api/v1/health/bmi', methods=['POST'])
-def api_bmi():
-    start = time.time()
-    try:
-        result = bmi_calculator(request.get_json())
-        log_execution('BMI Calculator', '/api/v1/health/bmi', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('BMI Calculator', '/api/v1/health/bmi', 'error', start)
-        return jsonify({'error': str(e)}), 500
+def predict(model, model_fn, data):
+    """Helper to score one record: response cache, simulated latency, micro-batcher"""
+    cache, key, result = lookup_cached(model, data)
+    if result is None:
+        simulate_latency(model)
+        result = call_model(model, model_fn, data)
+        if cache is not None:
+            cache.put(key, result)
+    return result
+
+def predict_batch(model, model_fn, inputs):
+    """Helper to score a batch, sleeping only for the records not in the cache"""
+    outputs, computed = cached_batch(model, model_fn, inputs)
+    if computed:
+        simulate_latency(model, computed)
+    return outputs
+
+@app.route('/api/v1/<path:model_path>', methods=['POST'])
+def api_model(model_path):
+    """Single dispatch path for every registered model
+
+    POST <endpoint> scores one record; POST <endpoint>/batch accepts
+    {"inputs": [...]} (or a bare JSON list) and returns one output per input.
+    """
+    path = request.path
+    route = resolve_route(path)
+    if route is None:
+        return jsonify({'error': f'Unknown model endpoint: {path}'}), 404
+    model, model_fn, is_batch = route
 
-@app.route('/api/v1/health/body-fat', methods=['POST'])
-def api_body_fat():
     start = time.time()
+    data = None
     try:
-        result = body_fat_estimator(request.get_json())
-        log_execution('Body Fat Estimator', '/api/v1/health/body-fat', 'success', start)
-        return jsonify(result), 200
+        data = request.get_json()
+        if not is_batch:
+            result = predict(model, model_fn, data)
+            log_execution(model, model['endpoint'], 'success', start, data, result)
+            return jsonify(result), 200
+
+        response = batch_response(model, predict_batch(model, model_fn, batch_inputs(data)))
+        log_execution(model, path, 'success', start, data, response)
+        return jsonify(response), 200
+    except BatchRequestError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        log_execution('Body Fat Estimator', '/api/v1/health/body-fat', 'error', start)
+        log_execution(model, path, 'error', start, data, error=str(e))
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/v1/health/bmr', methods=['POST'])
-def api_bmr():
-    start = time.time()
-    try:
-        result = bmr_calculator(request.get_json())
-        log_execution('BMR Calculator', '/api/v1/health/bmr', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('BMR Calculator', '/api/v1/health/bmr', 'error', start)
-        return jsonify({'error': str(e)}), 500
+def log_execution(model, endpoint, status, start_time, data=None, output=None, error=None):
+    """Helper to log executions and update the endpoint's metrics
 
-@app.route('/api/v1/health/ideal-weight', methods=['POST'])
-def api_ideal_weight():
-    start = time.time()
-    try:
-        result = ideal_weight_predictor(request.get_json())
-        log_execution('Ideal Weight Predictor', '/api/v1/health/ideal-weight', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Ideal Weight Predictor', '/api/v1/health/ideal-weight', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/v1/health/risk-assessment', methods=['POST'])
-def api_health_risk():
-    start = time.time()
-    try:
-        result = health_risk_assessor(request.get_json())
-        log_execution('Health Risk Assessor', '/api/v1/health/risk-assessment', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Health Risk Assessor', '/api/v1/health/risk-assessment', 'error', start)
-        return jsonify({'error': str(e)}), 500
+    With EXECUTION_HISTORY_URL set, the request and its output are also
+    queued for execution_history (written in batches, off the request path).
+    """
+    entry = execution_log.record(model['name'], endpoint, status, start_time)
+    execution_feed.publish(entry)
+    metrics.observe(endpoint, model['name'], model['group'], status, entry.duration)
+    if execution_history is not None:
+        execution_history.record(model['id'], status, start_time, data if data is not None else {},
+                                 output, error, 200 if status == 'success' else 500)
 
-# Grupo 4: Tabular Classification
-@app.route('/api/v1/classification/iris', methods=['POST'])
-def api_iris():
-    start = time.time()
-    try:
-        result = iris_classifier(request.get_json())
-        log_execution('Iris Classifier', '/api/v1/classification/iris', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Iris Classifier', '/api/v1/classification/iris', 'error', start)
-        return jsonify({'error': str(e)}), 500
+# ============================================================================
+# GROUP COMPARISON
+# ============================================================================
 
-@app.route('/api/v1/classification/flower', methods=['POST'])
-def api_flower():
-    start = time.time()
-    try:
-        result = flower_type_classifier(request.get_json())
-        log_execution('Flower Type Classifier', '/api/v1/classification/flower', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Flower Type Classifier', '/api/v1/classification/flower', 'error', start)
-        return jsonify({'error': str(e)}), 500
+# Runs the models of a /compare request side by side; sized for several
+# concurrent comparisons of 5 models each (the work is mostly sleeping)
+COMPARE_POOL = ThreadPoolExecutor(max_workers=int(os.environ.get('COMPARE_WORKERS', 64)),
+                                  thread_name_prefix='compare')
 
-@app.route('/api/v1/classification/plant', methods=['POST'])
-def api_plant():
-    start = time.time()
-    try:
-        result = plant_species_identifier(request.get_json())
-        log_execution('Plant Species Identifier', '/api/v1/classification/plant', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Plant Species Identifier', '/api/v1/classification/plant', 'error', start)
-        return jsonify({'error': str(e)}), 500
+_datasets = None
 
-@app.route('/api/v1/classification/botanical', methods=['POST'])
-def api_botanical():
-    start = time.time()
-    try:
-        result = botanical_classifier(request.get_json())
-        log_execution('Botanical Classifier', '/api/v1/classification/botanical', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Botanical Classifier', '/api/v1/classification/botanical', 'error', start)
-        return jsonify({'error': str(e)}), 500
+def validation_dataset(dataset_id):
+    """Helper returning a validation dataset by id, read once from the SQL script"""
+    global _datasets
+    if _datasets is None:
+        _datasets = {dataset['id']: dataset for dataset in load_datasets()}
+    return _datasets.get(dataset_id)
 
-@app.route('/api/v1/classification/flora', methods=['POST'])
-def api_flora():
-    start = time.time()
-    try:
-        result = flora_recognition(request.get_json())
-        log_execution('Flora Recognition', '/api/v1/classification/flora', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Flora Recognition', '/api/v1/classification/flora', 'error', start)
-        return jsonify({'error': str(e)}), 500
+def compare_inputs(group, data):
+    """(inputs, is_batch) of a /compare request body
 
-# Grupo 5: Fraud Detection
-@app.route('/api/v1/fraud/transaction', methods=['POST'])
-def api_fraud_transaction():
-    start = time.time()
-    try:
-        result = fraud_detector(request.get_json())
-        log_execution('Fraud Detector', '/api/v1/fraud/transaction', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Fraud Detector', '/api/v1/fraud/transaction', 'error', start)
-        return jsonify({'error': str(e)}), 500
+    The body is either one record, {"inputs": [...]} like a batch request,
+    or {"dataset": <validation dataset id>, "offset": 0, "limit": 10}.
+    """
+    if isinstance(data, dict) and 'dataset' in data:
+        dataset = validation_dataset(data['dataset'])
+        if dataset is None:
+            raise BatchRequestError(f"Unknown validation dataset: {data['dataset']}")
+        rows = model_inputs(dataset, GROUPS[group]['fields'])
+        if rows is None:
+            raise BatchRequestError(f"Dataset {dataset['id']} does not match the {group} input schema")
+        offset = int(data.get('offset', 0))
+        limit = int(data.get('limit', MAX_BATCH_SIZE))
+        if offset < 0 or limit < 1:
+            raise BatchRequestError('"offset" must be 0 or more and "limit" at least 1')
+        return batch_inputs(rows[offset:offset + limit]), True
+    if isinstance(data, list) or (isinstance(data, dict) and 'inputs' in data):
+        return batch_inputs(data), True
+    return data, False
+
+def compare_entry(model, start, output=None, error=None, is_batch=False):
+    """One model's part of a /compare response, with its own timing"""
+    entry = {
+        'id': model['id'],
+        'model': model['name'],
+        'endpoint': model['endpoint'],
+        'status': 'error' if error is not None else 'success',
+        'duration_ms': round((time.time() - start) * 1000, 2)
+    }
+    if error is not None:
+        entry['error'] = error
+    elif is_batch:
+        entry['outputs'] = output
+    else:
+        entry['output'] = output
+    return entry
 
-@app.route('/api/v1/fraud/credit-card', methods=['POST'])
-def api_credit_card():
-    start = time.time()
-    try:
-        result = credit_card_fraud(request.get_json())
-        log_execution('Credit Card Fraud', '/api/v1/fraud/credit-card', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Credit Card Fraud', '/api/v1/fraud/credit-card', 'error', start)
-        return jsonify({'error': str(e)}), 500
+def compare_response(group, entries, start, inputs, is_batch):
+    return {
+        'group': group,
+        'title': GROUPS[group]['title'],
+        'batch_size': len(inputs) if is_batch else None,
+        'wall_time_ms': round((time.time() - start) * 1000, 2),
+        'sum_of_model_times_ms': round(sum(entry['duration_ms'] for entry in entries), 2),
+        'results': entries
+    }
 
-@app.route('/api/v1/fraud/anomaly', methods=['POST'])
-def api_anomaly():
+def compare_model(model, model_fn, inputs, is_batch):
+    """Score the shared input with one model of the group"""
     start = time.time()
+    endpoint = model['endpoint'] + ('/batch' if is_batch else '')
     try:
-        result = payment_anomaly_detector(request.get_json())
-        log_execution('Payment Anomaly Detector', '/api/v1/fraud/anomaly', 'success', start)
-        return jsonify(result), 200
+        output = predict_batch(model, model_fn, inputs) if is_batch else predict(model, model_fn, inputs)
     except Exception as e:
-        log_execution('Payment Anomaly Detector', '/api/v1/fraud/anomaly', 'error', start)
-        return jsonify({'error': str(e)}), 500
+        log_execution(model, endpoint, 'error', start, inputs, error=str(e))
+        return compare_entry(model, start, error=str(e))
+    log_execution(model, endpoint, 'success', start, inputs, output)
+    return compare_entry(model, start, output, is_batch=is_batch)
 
-@app.route('/api/v1/fraud/risk-scorer', methods=['POST'])
-def api_risk_scorer():
-    start = time.time()
-    try:
-        result = transaction_risk_scorer(request.get_json())
-        log_execution('Transaction Risk Scorer', '/api/v1/fraud/risk-scorer', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Transaction Risk Scorer', '/api/v1/fraud/risk-scorer', 'error', start)
-        return jsonify({'error': str(e)}), 500
+@app.route('/api/v1/groups/<group>/compare', methods=['POST'])
+def compare_group(group):
+    """Run every model of a group on the same input, concurrently
 
-@app.route('/api/v1/fraud/classifier', methods=['POST'])
-def api_fraud_classifier():
+    Takes as long as the slowest model rather than the sum of all five.
+    """
+    if group not in GROUPS:
+        return jsonify({'error': f'Unknown model group: {group}'}), 404
     start = time.time()
     try:
-        result = financial_fraud_classifier(request.get_json())
-        log_execution('Financial Fraud Classifier', '/api/v1/fraud/classifier', 'success', start)
-        return jsonify(result), 200
-    except Exception as e:
-        log_execution('Financial Fraud Classifier', '/api/v1/fraud/classifier', 'error', start)
-        return jsonify({'error': str(e)}), 500
-
-def log_execution(model, endpoint, status, start_time):
-    """Helper to log executions"""
-    execution_log.append({
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'model': model,
-        'endpoint': endpoint,
-        'status': status,
-        'duration': round((time.time() - start_time) * 1000, 2)
-    })
-    # Keep only last 100 executions
-    if len(execution_log) > 100:
-        execution_log.pop(0)
-
-@app.route('/')
-def dashboard():
-    """Dashboard showing all 25 models"""
-    html = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>🤖 AI Model Server - 25 Models Dashboard</title>
-        <meta charset="utf-8">
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body {
-                font-family: system-ui, -apple-system, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 20px;
-                color: #333;
-            }
-            .container { max-width: 1400px; margin: 0 auto; }
-            .header {
-                background: white;
-                padding: 30px;
-                border-radius: 15px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                margin-bottom: 30px;
-                text-align: center;
-            }
-            .header h1 { color: #667eea; font-size: 2.5rem; }
-            .status {
-                display: inline-block;
-                background: #10b981;
-                color: white;
-                padding: 8px 20px;
-                border-radius: 20px;
-                font-weight: 600;
-                margin-top: 10px;
-            }
-            .stats {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 20px;
-                margin-bottom: 30px;
-            }
-            .stat-card {
-                background: white;
-                padding: 20px;
-                border-radius: 10px;
-                text-align: center;
-                box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            }
-            .stat-card .number {
-                font-size: 2rem;
-                font-weight: bold;
-                color: #667eea;
-            }
-            .groups-section {
-                background: white;
-                padding: 30px;
-                border-radius: 15px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-            }
-            .group {
-                margin-bottom: 40px;
-            }
-            .group h2 {
-                color: #667eea;
-                margin-bottom: 15px;
-                padding-bottom: 10px;
-                border-bottom: 2px solid #e5e7eb;
-            }
-            .models-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-                gap: 15px;
-                margin-top: 15px;
-            }
-            .model-card {
-                border: 2px solid #e5e7eb;
-                padding: 15px;
-                border-radius: 8px;
-                transition: all 0.3s;
-            }
-            .model-card:hover {
-                border-color: #667eea;
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102,126,234,0.2);
-            }
-            .model-card h3 {
-                font-size: 1rem;
-                margin-bottom: 8px;
-                color: #333;
-            }
-            .endpoint {
-                background: #f3f4f6;
-                padding: 6px 10px;
-                border-radius: 5px;
-                font-family: monospace;
-                font-size: 0.75rem;
-                color: #667eea;
-                margin-top: 8px;
-                word-break: break-all;
-            }
-            .refresh-btn {
-                background: #667eea;
-                color: white;
-                border: none;
-                padding: 12px 30px;
-                border-radius: 8px;
-                font-size: 1rem;
-                cursor: pointer;
-                margin-top: 20px;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🤖 AI Model Server</h1>
-                <p style="color: #666;">25 Mock Models for Benchmarking</p>
-                <div class="status">● ONLINE</div>
+        inputs, is_batch = compare_inputs(group, request.get_json())
+    except (BatchRequestError, TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+
+    futures = [
+        COMPARE_POOL.submit(compare_model, model, MODEL_FUNCTIONS[model['handler']], inputs, is_batch)
+        for model in models_in_group(group)
+    ]
+    entries = [future.result() for future in futures]
+    return jsonify(compare_response(group, entries, start, inputs, is_batch)), 200
+
+DASHBOARD_GROUPS = {
+    group_id: {
+        'title': group['title'],
+        'icon': group['icon'],
+        'inputs': ', '.join(field['name'] for field in group['fields']),
+        'models': models_in_group(group_id),
+    }
+    for group_id, group in GROUPS.items()
+}
+
+DASHBOARD_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>🤖 AI Model Server - 25 Models Dashboard</title>
+    <meta charset="utf-8">
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: system-ui, -apple-system, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 20px;
+            color: #333;
+        }
+        .container { max-width: 1400px; margin: 0 auto; }
+        .header {
+            background: white;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+            margin-bottom: 30px;
+            text-align: center;
+        }
+        .header h1 { color: #667eea; font-size: 2.5rem; }
+        .status {
+            display: inline-block;
+            background: #10b981;
+            color: white;
+            padding: 8px 20px;
+            border-radius: 20px;
+            font-weight: 600;
+            margin-top: 10px;
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .stat-card {
+            background: white;
+            padding: 20px;
+            border-radius: 10px;
+            text-align: center;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+        }
+        .stat-card .number {
+            font-size: 2rem;
+            font-weight: bold;
+            color: #667eea;
+        }
+        .groups-section {
+            background: white;
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+        }
+        .group {
+            margin-bottom: 40px;
+        }
+        .group h2 {
+            color: #667eea;
+            margin-bottom: 15px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #e5e7eb;
+        }
+        .models-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
+            gap: 15px;
+            margin-top: 15px;
+        }
+        .model-card {
+            border: 2px solid #e5e7eb;
+            padding: 15px;
+            border-radius: 8px;
+            transition: all 0.3s;
+        }
+        .model-card:hover {
+            border-color: #667eea;
+            transform: translateY(-2px);
+            box-shadow: 0 5px 15px rgba(102,126,234,0.2);
+        }
+        .model-card h3 {
+            font-size: 1rem;
+            margin-bottom: 8px;
+            color: #333;
+        }
+        .endpoint {
+            background: #f3f4f6;
+            padding: 6px 10px;
+            border-radius: 5px;
+            font-family: monospace;
+            font-size: 0.75rem;
+            color: #667eea;
+            margin-top: 8px;
+            word-break: break-all;
+        }
+        .refresh-btn {
+            background: #667eea;
+            color: white;
+            border: none;
+            padding: 12px 30px;
+            border-radius: 8px;
+            font-size: 1rem;
+            cursor: pointer;
+            margin-top: 20px;
+        }
+        .log-section {
+            background: white;
+            padding: 20px 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+            margin-bottom: 30px;
+        }
+        .log-section h2 {
+            color: #667eea;
+            margin-bottom: 10px;
+        }
+        .log-entry {
+            display: grid;
+            grid-template-columns: 160px 80px 1fr 1fr 90px;
+            gap: 10px;
+            padding: 6px 0;
+            border-bottom: 1px solid #f3f4f6;
+            font-size: 0.85rem;
+        }
+        .log-entry .endpoint-path { font-family: monospace; color: #667eea; }
+        .status-success { color: #10b981; font-weight: 600; }
+        .status-error { color: #ef4444; font-weight: 600; }
+        .empty-log { color: #999; font-style: italic; padding: 10px 0; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🤖 AI Model Server</h1>
+            <p style="color: #666;">25 Mock Models for Benchmarking</p>
+            <div class="status">● ONLINE</div>
+        </div>
+        
+        <div class="stats">
+            <div class="stat-card">
+                <div class="number">{{ total_models }}</div>
+                <div style="color: #666; font-size: 0.9rem;">Available Models</div>
             </div>
-            
-            <div class="stats">
-                <div class="stat-card">
-                    <div class="number">25</div>
-                    <div style="color: #666; font-size: 0.9rem;">Available Models</div>
-                </div>
-                <div class="stat-card">
-                    <div class="number">5</div>
-                    <div style="color: #666; font-size: 0.9rem;">Model Groups</div>
-                </div>
-                <div class="stat-card">
-                    <div class="number">{{ total_requests }}</div>
-                    <div style="color: #666; font-size: 0.9rem;">Total Requests</div>
-                </div>
-                <div class="stat-card">
-                    <div class="number">8080</div>
-                    <div style="color: #666; font-size: 0.9rem;">Server Port</div>
-                </div>
+            <div class="stat-card">
+                <div class="number">{{ groups|length }}</div>
+                <div style="color: #666; font-size: 0.9rem;">Model Groups</div>
             </div>
-            
-            <div class="groups-section">
-                <div class="group">
-                    <h2>👁️ Group 1: Medical Imaging (Computer Vision)</h2>
-                    <p style="color: #666; margin-bottom: 10px;">Input: image_url, image_size</p>
-                    <div class="models-grid">
-                        <div class="model-card">
-                            <h3>Chest X-Ray Classifier</h3>
-                            <div class="endpoint">POST /api/v1/vision/chest-xray</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Pneumonia Detector</h3>
-                            <div class="endpoint">POST /api/v1/vision/pneumonia</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>COVID-19 Screener</h3>
-                            <div class="endpoint">POST /api/v1/vision/covid19</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Lung Nodule Detector</h3>
-                            <div class="endpoint">POST /api/v1/vision/lung-nodule</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Tuberculosis Classifier</h3>
-                            <div class="endpoint">POST /api/v1/vision/tuberculosis</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="group">
-                    <h2>💭 Group 2: Sentiment Analysis (NLP)</h2>
-                    <p style="color: #666; margin-bottom: 10px;">Input: text</p>
-                    <div class="models-grid">
-                        <div class="model-card">
-                            <h3>E-commerce Sentiment</h3>
-                            <div class="endpoint">POST /api/v1/nlp/ecommerce-sentiment</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Twitter Sentiment</h3>
-                            <div class="endpoint">POST /api/v1/nlp/twitter-sentiment</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Product Review Classifier</h3>
-                            <div class="endpoint">POST /api/v1/nlp/product-review</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Customer Feedback Analyzer</h3>
-                            <div class="endpoint">POST /api/v1/nlp/customer-feedback</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Social Media Sentiment</h3>
-                            <div class="endpoint">POST /api/v1/nlp/social-media</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="group">
-                    <h2>⚖️ Group 3: Health Metrics (Regression)</h2>
-                    <p style="color: #666; margin-bottom: 10px;">Input: weight_kg, height_m</p>
-                    <div class="models-grid">
-                        <div class="model-card">
-                            <h3>BMI Calculator</h3>
-                            <div class="endpoint">POST /api/v1/health/bmi</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Body Fat Estimator</h3>
-                            <div class="endpoint">POST /api/v1/health/body-fat</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>BMR Calculator</h3>
-                            <div class="endpoint">POST /api/v1/health/bmr</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Ideal Weight Predictor</h3>
-                            <div class="endpoint">POST /api/v1/health/ideal-weight</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Health Risk Assessor</h3>
-                            <div class="endpoint">POST /api/v1/health/risk-assessment</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="group">
-                    <h2>🌸 Group 4: Flora Classification (Tabular)</h2>
-                    <p style="color: #666; margin-bottom: 10px;">Input: sepal_length, sepal_width, petal_length, petal_width</p>
-                    <div class="models-grid">
-                        <div class="model-card">
-                            <h3>Iris Classifier</h3>
-                            <div class="endpoint">POST /api/v1/classification/iris</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Flower Type Classifier</h3>
-                            <div class="endpoint">POST /api/v1/classification/flower</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Plant Species Identifier</h3>
-                            <div class="endpoint">POST /api/v1/classification/plant</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Botanical Classifier</h3>
-                            <div class="endpoint">POST /api/v1/classification/botanical</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Flora Recognition</h3>
-                            <div class="endpoint">POST /api/v1/classification/flora</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="group">
-                    <h2>🔒 Group 5: Fraud Detection (Transactional)</h2>
-                    <p style="color: #666; margin-bottom: 10px;">Input: amount, merchant_category, location, timestamp</p>
-                    <div class="models-grid">
-                        <div class="model-card">
-                            <h3>Fraud Detector</h3>
-                            <div class="endpoint">POST /api/v1/fraud/transaction</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Credit Card Fraud</h3>
-                            <div class="endpoint">POST /api/v1/fraud/credit-card</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Payment Anomaly Detector</h3>
-                            <div class="endpoint">POST /api/v1/fraud/anomaly</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Transaction Risk Scorer</h3>
-                            <div class="endpoint">POST /api/v1/fraud/risk-scorer</div>
-                        </div>
-                        <div class="model-card">
-                            <h3>Financial Fraud Classifier</h3>
-                            <div class="endpoint">POST /api/v1/fraud/classifier</div>
-                        </div>
+            <div class="stat-card">
+                <div class="number" id="totalRequests">–</div>
+                <div style="color: #666; font-size: 0.9rem;">Total Requests</div>
+            </div>
+            <div class="stat-card">
+                <div class="number">8080</div>
+                <div style="color: #666; font-size: 0.9rem;">Server Port</div>
+            </div>
+        </div>
+
+        <div class="log-section">
+            <h2>📝 Live Executions</h2>
+            <div id="logContainer">
+                <div class="empty-log">Waiting for model executions...</div>
+            </div>
+        </div>
+        
+        <div class="groups-section">
+            {% for group_id, group in groups.items() %}
+            <div class="group">
+                <h2>{{ group.icon }} Group {{ loop.index }}: {{ group.title }}</h2>
+                <p style="color: #666; margin-bottom: 10px;">Input: {{ group.inputs }}</p>
+                <div class="models-grid">
+                    {% for model in group.models %}
+                    <div class="model-card">
+                        <h3>{{ model.name }}</h3>
+                        <div class="endpoint">POST {{ model.endpoint }}</div>
                     </div>
+                    {% endfor %}
                 </div>
-                
-                <button class="refresh-btn" onclick="location.reload()">🔄 Refresh Dashboard</button>
             </div>
+            {% endfor %}
+            
+            <button class="refresh-btn" onclick="refreshStats()">🔄 Refresh Dashboard</button>
         </div>
-        <script>
-            setTimeout(() => location.reload(), 10000);
-        </script>
-    </body>
-    </html>
-    """
-    return render_template_string(html, total_requests=len(execution_log))
+    </div>
+    <script>
+        // The page itself is static (and cached): executions are pushed over
+        // server-sent events and only the request counter is polled
+        async function refreshStats() {
+            try {
+                const response = await fetch('/api/v1/dashboard/stats', { cache: 'no-store' });
+                const stats = await response.json();
+                document.getElementById('totalRequests').textContent = stats.total_requests;
+            } catch (e) {
+                // Server restarting; keep the last value
+            }
+        }
+
+        function logEntry(log) {
+            const entry = document.createElement('div');
+            entry.className = 'log-entry';
+            const cells = [log.timestamp, log.status.toUpperCase(), log.model, log.endpoint, log.duration + ' ms'];
+            const classes = ['', 'status-' + log.status, '', 'endpoint-path', ''];
+            cells.forEach((text, i) => {
+                const cell = document.createElement('span');
+                cell.className = classes[i];
+                cell.textContent = text;
+                entry.appendChild(cell);
+            });
+            return entry;
+        }
+
+        const logContainer = document.getElementById('logContainer');
+        function connectFeed() {
+            const feed = new EventSource('/api/v1/executions/stream');
+            // Every (re)connection starts by replaying the latest executions
+            feed.addEventListener('open', () => logContainer.replaceChildren());
+            feed.addEventListener('execution', (event) => {
+                logContainer.prepend(logEntry(JSON.parse(event.data)));
+                while (logContainer.children.length > 10) {
+                    logContainer.lastElementChild.remove();
+                }
+            });
+            // The server ends streams periodically (EventSource reconnects by
+            // itself) and refuses them when busy (503: retry later)
+            feed.addEventListener('error', () => {
+                if (feed.readyState === EventSource.CLOSED) {
+                    setTimeout(connectFeed, 10000);
+                }
+            });
+        }
+        connectFeed();
+
+        refreshStats();
+        setInterval(() => { if (!document.hidden) refreshStats(); }, 10000);
+        document.addEventListener('visibilitychange', () => { if (!document.hidden) refreshStats(); });
+    </script>
+</body>
+</html>
+"""
+
+# Rendered once: the model catalog does not change while the server runs
+DASHBOARD_PAGE = StaticPage(app.jinja_env.from_string(DASHBOARD_TEMPLATE).render(
+    groups=DASHBOARD_GROUPS,
+    total_models=len(ROUTES)
+))
+
+@app.route('/')
+def dashboard():
+    """Dashboard showing all 25 models"""
+    return DASHBOARD_PAGE.response(request)
+
+@app.route('/api/v1/dashboard/stats', methods=['GET'])
+def dashboard_stats():
+    """Live counters polled by the dashboard"""
+    return jsonify({'total_requests': aggregated_metrics()[1]}), 200
+
+@app.route('/api/v1/executions/stream', methods=['GET'])
+def execution_stream():
+    """Server-sent events with each new execution (see execution_feed.py)"""
+    stream = execution_feed.open_stream()
+    if stream is None:
+        return jsonify({'error': 'Too many execution streams on this worker'}), 503, {'Retry-After': '10'}
+    return Response(stream, mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/v1/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return jsonify(health_payload()), 200
+
+def health_payload():
+    return {
         'status': 'healthy',
-        'models': 25,
-        'groups': 5,
-        'total_requests': len(execution_log),
+        'models': len(ROUTES),
+        'groups': len(GROUPS),
+        'total_requests': aggregated_metrics()[1],
         'timestamp': datetime.now().isoformat()
-    }), 200
+    }
+
+@app.route('/api/v1/metrics', methods=['GET'])
+def metrics_snapshot():
+    """Per-endpoint request counters and latency percentiles"""
+    return jsonify(metrics_payload()), 200
+
+def metrics_payload():
+    """Helper building the metrics snapshot shared with asgi_server.py"""
+    snapshot = aggregated_metrics()[0].snapshot()
+    snapshot['micro_batching'] = {handler: batcher.describe() for handler, batcher in BATCHERS.items()}
+    snapshot['model_store'] = model_store.describe()
+    snapshot['response_cache'] = {handler: cache.describe() for handler, cache in RESPONSE_CACHES.items()}
+    if execution_history is not None:
+        snapshot['execution_history'] = execution_history.describe()
+    return snapshot
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus scrape endpoint, rendered from the aggregated counters"""
+    return Response(aggregated_metrics()[0].render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+def aggregated_metrics():
+    """Helper returning (metrics, total executions) across all workers"""
+    if shared_metrics is None:
+        return metrics, execution_log.total
+    return shared_metrics.aggregate()
+
+@app.before_request
+def track_request_start():
+    metrics.request_started()
+
+@app.teardown_request
+def track_request_end(exc=None):
+    metrics.request_finished()
 
 if __name__ == '__main__':
     print("=" * 80)
     print("🤖 AI Model Mock Server - 25 Models Edition")
     print("=" * 80)
     print(f"📊 Dashboard: http://localhost:8080")
+    print(f"📈 Metrics:   http://localhost:8080/api/v1/metrics (Prometheus: /metrics)")
     print(f"🔥 25 Models Ready for Benchmarking!")
     print(f"")
     print(f"📁 Model Groups:")
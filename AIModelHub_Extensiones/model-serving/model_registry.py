@@ -0,0 +1,496 @@
+"""
+Model Registry - 25 Models Edition
+==================================
+
+Fuente única de verdad para los 25 modelos mock: endpoint, función del
+servidor, nombre, grupo, esquema de input, rango de latencia simulada
+(segundos), si sus respuestas se pueden cachear ("cacheable", solo modelos
+deterministas), el campo numérico de la salida que puntúa benchmark_runner.py
+en regresión ("prediction_key") y metadatos del catálogo.
+
+La leen tanto mock_server_25_models.py (despacho de rutas) como
+database-scripts/generate_25_models.py (SQL del catálogo), por lo que no
+importa Flask ni ninguna otra dependencia.
+
+load_catalog() lee además un catálogo generado (CSV de
+database-scripts/generate_synthetic_catalog.py): cada modelo se sirve con
+el comportamiento de su plantilla (columna `handler`).
+"""
+
+import csv
+
+# ============================================================================
+# INPUT SCHEMAS (compartidos por grupo)
+# ============================================================================
+
+IMAGE_FIELDS = [
+    {"name": "image_url", "type": "string", "required": True, "description": "URL to chest X-ray image"},
+    {"name": "image_size", "type": "string", "required": False, "description": "Target image size (e.g., 512x512)"}
+]
+
+HEALTH_FIELDS = [
+    {"name": "weight_kg", "type": "float", "required": True, "description": "Body weight in kilograms"},
+    {"name": "height_m", "type": "float", "required": True, "description": "Height in meters"}
+]
+
+IRIS_FIELDS = [
+    {"name": "sepal_length", "type": "float", "required": True, "description": "Sepal length in cm"},
+    {"name": "sepal_width", "type": "float", "required": True, "description": "Sepal width in cm"},
+    {"name": "petal_length", "type": "float", "required": True, "description": "Petal length in cm"},
+    {"name": "petal_width", "type": "float", "required": True, "description": "Petal width in cm"}
+]
+
+TRANSACTION_FIELDS = [
+    {"name": "amount", "type": "float", "required": True, "description": "Transaction amount in currency units"},
+    {"name": "merchant_category", "type": "string", "required": True, "description": "Merchant category code"},
+    {"name": "location", "type": "string", "required": True, "description": "Transaction location"},
+    {"name": "timestamp", "type": "string", "required": True, "description": "Transaction timestamp ISO format"}
+]
+
+def _text_fields(description):
+    return [{"name": "text", "type": "string", "required": True, "description": description}]
+
+# ============================================================================
+# GROUPS
+# ============================================================================
+
+GROUPS = {
+    'vision': {
+        'title': 'Medical Imaging (Computer Vision)',
+        'icon': '👁️',
+        'fields': IMAGE_FIELDS,
+    },
+    'nlp': {
+        'title': 'Sentiment Analysis (NLP)',
+        'icon': '💭',
+        'fields': _text_fields("Text to analyze"),
+    },
+    'health': {
+        'title': 'Health Metrics (Regression)',
+        'icon': '⚖️',
+        'fields': HEALTH_FIELDS,
+    },
+    'flora': {
+        'title': 'Flora Classification (Tabular)',
+        'icon': '🌸',
+        'fields': IRIS_FIELDS,
+    },
+    'fraud': {
+        'title': 'Fraud Detection (Transactional)',
+        'icon': '🔒',
+        'fields': TRANSACTION_FIELDS,
+    },
+}
+
+
+# ============================================================================
+# MODELS
+# ============================================================================
+
+MODELS = [
+    # Group 1: Medical Imaging (Vision - X-Ray Analysis)
+    {
+        "id": "asset-vision-chest-xray",
+        "name": "Chest X-Ray Classifier",
+        "group": "vision",
+        "endpoint": "/api/v1/vision/chest-xray",
+        "handler": "chest_xray_classifier",
+        "latency": (0.8, 1.5),
+        "description": "Deep learning model for chest X-ray pathology detection using ResNet50. Classifies images into normal or abnormal categories.",
+        "keywords": "medical, xray, chest, vision, radiology, diagnostic",
+        "task": "Classification - Computer Vision",
+        "subtask": "Medical Image Analysis",
+        "algorithm": "Convolutional Neural Network",
+    },
+    {
+        "id": "asset-vision-pneumonia",
+        "name": "Pneumonia Detector",
+        "group": "vision",
+        "endpoint": "/api/v1/vision/pneumonia",
+        "handler": "pneumonia_detector",
+        "latency": (0.7, 1.4),
+        "description": "Specialized CNN model for detecting pneumonia in chest X-rays. Trained on large medical imaging dataset.",
+        "keywords": "pneumonia, medical, xray, detection, vision, respiratory",
+        "task": "Classification - Computer Vision",
+        "subtask": "Medical Image Analysis",
+        "algorithm": "Deep Convolutional Neural Network",
+    },
+    {
+        "id": "asset-vision-covid19",
+        "name": "COVID-19 X-Ray Detector",
+        "group": "vision",
+        "endpoint": "/api/v1/vision/covid19",
+        "handler": "covid19_screener",
+        "latency": (0.9, 1.6),
+        "description": "AI model for detecting COVID-19 signs in chest radiographs. Uses transfer learning on medical data.",
+        "keywords": "covid19, pandemic, medical, xray, vision, coronavirus",
+        "task": "Classification - Computer Vision",
+        "subtask": "Medical Image Analysis",
+        "algorithm": "Transfer Learning CNN",
+    },
+    {
+        "id": "asset-vision-lung-nodule",
+        "name": "Lung Nodule Detector",
+        "group": "vision",
+        "endpoint": "/api/v1/vision/lung-nodule",
+        "handler": "lung_nodule_detector",
+        "latency": (1.0, 1.7),
+        "description": "Computer vision model for detecting lung nodules in X-ray images. Early cancer detection aid.",
+        "keywords": "lung, nodule, cancer, medical, xray, vision, oncology",
+        "task": "Classification - Computer Vision",
+        "subtask": "Medical Image Analysis",
+        "algorithm": "Region-based CNN",
+    },
+    {
+        "id": "asset-vision-tuberculosis",
+        "name": "Tuberculosis Detector",
+        "group": "vision",
+        "endpoint": "/api/v1/vision/tuberculosis",
+        "handler": "tuberculosis_classifier",
+        "latency": (0.8, 1.5),
+        "description": "ML model for TB detection in chest X-rays. Supports global health screening programs.",
+        "keywords": "tuberculosis, tb, medical, xray, vision, infectious-disease",
+        "task": "Classification - Computer Vision",
+        "subtask": "Medical Image Analysis",
+        "algorithm": "Ensemble CNN",
+    },
+
+    # Group 2: Sentiment Analysis (NLP - Text Classification)
+    {
+        "id": "asset-nlp-ecommerce",
+        "name": "E-commerce Sentiment Analyzer",
+        "group": "nlp",
+        "endpoint": "/api/v1/nlp/ecommerce-sentiment",
+        "handler": "ecommerce_sentiment",
+        "latency": (0.3, 0.8),
+        "description": "NLP model trained on e-commerce product reviews. Classifies customer sentiment as positive, negative, or neutral.",
+        "keywords": "sentiment, nlp, ecommerce, reviews, text, customer-feedback",
+        "task": "Classification - Natural Language Processing",
+        "subtask": "Sentiment Analysis",
+        "algorithm": "BERT Fine-tuned",
+        "fields": _text_fields("Product review or feedback text"),
+    },
+    {
+        "id": "asset-nlp-twitter",
+        "name": "Twitter Sentiment Analyzer",
+        "group": "nlp",
+        "endpoint": "/api/v1/nlp/twitter-sentiment",
+        "handler": "twitter_sentiment",
+        "latency": (0.2, 0.7),
+        "description": "Sentiment analysis model optimized for social media posts. Handles abbreviations, emojis, and slang.",
+        "keywords": "sentiment, twitter, social-media, nlp, text, opinion-mining",
+        "task": "Classification - Natural Language Processing",
+        "subtask": "Sentiment Analysis",
+        "algorithm": "RoBERTa Fine-tuned",
+        "fields": _text_fields("Social media post or tweet text"),
+    },
+    {
+        "id": "asset-nlp-product-review",
+        "name": "Product Review Analyzer",
+        "group": "nlp",
+        "endpoint": "/api/v1/nlp/product-review",
+        "handler": "product_review_classifier",
+        "latency": (0.3, 0.9),
+        "description": "Advanced NLP model for product review sentiment and aspect extraction. Multi-label classification.",
+        "keywords": "product, review, sentiment, nlp, text, consumer-insights",
+        "task": "Classification - Natural Language Processing",
+        "subtask": "Sentiment Analysis",
+        "algorithm": "DistilBERT",
+        "fields": _text_fields("Product review text"),
+    },
+    {
+        "id": "asset-nlp-customer-feedback",
+        "name": "Customer Feedback Analyzer",
+        "group": "nlp",
+        "endpoint": "/api/v1/nlp/customer-feedback",
+        "handler": "customer_feedback_analyzer",
+        "latency": (0.4, 0.9),
+        "description": "Enterprise-grade sentiment analysis for customer service feedback and support tickets.",
+        "keywords": "customer-service, feedback, sentiment, nlp, text, support",
+        "task": "Classification - Natural Language Processing",
+        "subtask": "Sentiment Analysis",
+        "algorithm": "LSTM with Attention",
+        "fields": _text_fields("Customer feedback or support ticket text"),
+    },
+    {
+        "id": "asset-nlp-social-media",
+        "name": "Social Media Sentiment Analyzer",
+        "group": "nlp",
+        "endpoint": "/api/v1/nlp/social-media",
+        "handler": "social_media_sentiment",
+        "latency": (0.3, 0.8),
+        "description": "General-purpose sentiment analysis for social media content. Multi-platform support.",
+        "keywords": "social-media, sentiment, nlp, text, opinion, brand-monitoring",
+        "task": "Classification - Natural Language Processing",
+        "subtask": "Sentiment Analysis",
+        "algorithm": "XLNet",
+        "fields": _text_fields("Social media post or comment"),
+    },
+
+    # Group 3: Health Metrics (Regression - Body Measurements)
+    {
+        "id": "asset-health-bmi",
+        "name": "BMI Calculator",
+        "group": "health",
+        "endpoint": "/api/v1/health/bmi",
+        "handler": "bmi_calculator",
+        "latency": (0.2, 0.5),
+        "cacheable": True,  # Pure function of the input (see response_cache.py)
+        "prediction_key": "bmi",  # Numeric output scored by benchmark_runner.py
+        "description": "Body Mass Index calculator using standard WHO formula. Provides health category classification.",
+        "keywords": "bmi, health, fitness, body-metrics, wellness, nutrition",
+        "task": "Regression",
+        "subtask": "Health Metrics",
+        "algorithm": "Linear Regression",
+    },
+    {
+        "id": "asset-health-bodyfat",
+        "name": "Body Fat Estimator",
+        "group": "health",
+        "endpoint": "/api/v1/health/body-fat",
+        "handler": "body_fat_estimator",
+        "latency": (0.3, 0.6),
+        "cacheable": True,
+        "prediction_key": "body_fat_percentage",
+        "description": "ML model for estimating body fat percentage using anthropometric measurements.",
+        "keywords": "bodyfat, health, fitness, body-composition, wellness",
+        "task": "Regression",
+        "subtask": "Health Metrics",
+        "algorithm": "Random Forest Regressor",
+    },
+    {
+        "id": "asset-health-bmr",
+        "name": "BMR Calculator",
+        "group": "health",
+        "endpoint": "/api/v1/health/bmr",
+        "handler": "bmr_calculator",
+        "latency": (0.2, 0.5),
+        "cacheable": True,
+        "prediction_key": "bmr_calories",
+        "description": "Basal Metabolic Rate calculator using Mifflin-St Jeor equation. Calorie needs estimation.",
+        "keywords": "bmr, metabolism, health, fitness, nutrition, calories",
+        "task": "Regression",
+        "subtask": "Health Metrics",
+        "algorithm": "Polynomial Regression",
+    },
+    {
+        "id": "asset-health-ideal-weight",
+        "name": "Ideal Weight Predictor",
+        "group": "health",
+        "endpoint": "/api/v1/health/ideal-weight",
+        "handler": "ideal_weight_predictor",
+        "latency": (0.3, 0.6),
+        "cacheable": True,
+        "prediction_key": "ideal_weight_kg",
+        "description": "Predicts ideal body weight range based on height and body frame using multiple health formulas.",
+        "keywords": "ideal-weight, health, fitness, wellness, body-goals",
+        "task": "Regression",
+        "subtask": "Health Metrics",
+        "algorithm": "Ensemble Regressor",
+        "fields": [
+            {"name": "weight_kg", "type": "float", "required": True, "description": "Current body weight in kilograms"},
+            {"name": "height_m", "type": "float", "required": True, "description": "Height in meters"}
+        ],
+    },
+    {
+        "id": "asset-health-risk",
+        "name": "Health Risk Scorer",
+        "group": "health",
+        "endpoint": "/api/v1/health/risk-assessment",
+        "handler": "health_risk_assessor",
+        "latency": (0.4, 0.7),
+        "cacheable": True,
+        "prediction_key": "risk_score",
+        "description": "Calculates health risk score based on BMI and related metrics. Preventive health assessment.",
+        "keywords": "health-risk, assessment, wellness, prevention, body-metrics",
+        "task": "Regression",
+        "subtask": "Health Metrics",
+        "algorithm": "Gradient Boosting Regressor",
+    },
+
+    # Group 4: Flora Classification (Tabular - Iris Dataset Style)
+    {
+        "id": "asset-flora-iris",
+        "name": "Iris Flower Classifier",
+        "group": "flora",
+        "endpoint": "/api/v1/classification/iris",
+        "handler": "iris_classifier",
+        "latency": (0.4, 0.9),
+        "description": "Classic iris species classifier using petal and sepal measurements. Trained on Fisher's iris dataset.",
+        "keywords": "iris, flower, classification, botanical, species-identification",
+        "task": "Classification - Tabular",
+        "subtask": "Flora Identification",
+        "algorithm": "Support Vector Machine",
+    },
+    {
+        "id": "asset-flora-flower",
+        "name": "Flower Classifier",
+        "group": "flora",
+        "endpoint": "/api/v1/classification/flower",
+        "handler": "flower_type_classifier",
+        "latency": (0.5, 1.0),
+        "description": "General flower species classifier based on morphological features. Multi-species support.",
+        "keywords": "flower, classification, botanical, species, morphology",
+        "task": "Classification - Tabular",
+        "subtask": "Flora Identification",
+        "algorithm": "Decision Tree",
+    },
+    {
+        "id": "asset-flora-plant",
+        "name": "Plant Classifier",
+        "group": "flora",
+        "endpoint": "/api/v1/classification/plant",
+        "handler": "plant_species_identifier",
+        "latency": (0.6, 1.1),
+        "description": "Plant species identification model using leaf and flower measurements. Botanical taxonomy support.",
+        "keywords": "plant, botanical, classification, species, taxonomy",
+        "task": "Classification - Tabular",
+        "subtask": "Flora Identification",
+        "algorithm": "K-Nearest Neighbors",
+    },
+    {
+        "id": "asset-flora-botanical",
+        "name": "Botanical Classifier",
+        "group": "flora",
+        "endpoint": "/api/v1/classification/botanical",
+        "handler": "botanical_classifier",
+        "latency": (0.5, 1.0),
+        "description": "Advanced botanical classification model for scientific plant identification and research.",
+        "keywords": "botanical, classification, scientific, plant-research, taxonomy",
+        "task": "Classification - Tabular",
+        "subtask": "Flora Identification",
+        "algorithm": "Random Forest",
+    },
+    {
+        "id": "asset-flora-recognition",
+        "name": "Flora Recognition System",
+        "group": "flora",
+        "endpoint": "/api/v1/classification/flora",
+        "handler": "flora_recognition",
+        "latency": (0.5, 1.0),
+        "description": "Comprehensive flora recognition using morphological features. Educational and research applications.",
+        "keywords": "flora, recognition, botanical, education, biodiversity",
+        "task": "Classification - Tabular",
+        "subtask": "Flora Identification",
+        "algorithm": "Gradient Boosting Classifier",
+    },
+
+    # Group 5: Fraud Detection (Classification - Transactional Data)
+    {
+        "id": "asset-fraud-transaction",
+        "name": "Transaction Fraud Checker",
+        "group": "fraud",
+        "endpoint": "/api/v1/fraud/transaction",
+        "handler": "fraud_detector",
+        "latency": (0.5, 1.0),
+        "description": "Real-time fraud detection for financial transactions. Analyzes patterns and flags suspicious activity.",
+        "keywords": "fraud, transaction, finance, security, anomaly-detection",
+        "task": "Classification - Tabular",
+        "subtask": "Fraud Detection",
+        "algorithm": "XGBoost",
+    },
+    {
+        "id": "asset-fraud-creditcard",
+        "name": "Credit Card Fraud Detector",
+        "group": "fraud",
+        "endpoint": "/api/v1/fraud/credit-card",
+        "handler": "credit_card_fraud",
+        "latency": (0.5, 1.1),
+        "description": "Specialized fraud detection for credit card transactions. High accuracy and low false positive rate.",
+        "keywords": "creditcard, fraud, payment, security, banking",
+        "task": "Classification - Tabular",
+        "subtask": "Fraud Detection",
+        "algorithm": "Neural Network",
+    },
+    {
+        "id": "asset-fraud-anomaly",
+        "name": "Transaction Anomaly Detector",
+        "group": "fraud",
+        "endpoint": "/api/v1/fraud/anomaly",
+        "handler": "payment_anomaly_detector",
+        "latency": (0.4, 0.9),
+        "description": "ML model for detecting anomalous transaction patterns. Unsupervised learning approach.",
+        "keywords": "anomaly, fraud, transaction, outlier-detection, security",
+        "task": "Classification - Tabular",
+        "subtask": "Fraud Detection",
+        "algorithm": "Isolation Forest",
+    },
+    {
+        "id": "asset-fraud-risk-scorer",
+        "name": "Fraud Risk Scorer",
+        "group": "fraud",
+        "endpoint": "/api/v1/fraud/risk-scorer",
+        "handler": "transaction_risk_scorer",
+        "latency": (0.5, 1.0),
+        "description": "Assigns fraud risk scores to transactions for manual review pipeline. Configurable thresholds.",
+        "keywords": "fraud, risk-score, transaction, assessment, security",
+        "task": "Classification - Tabular",
+        "subtask": "Fraud Detection",
+        "algorithm": "Logistic Regression",
+    },
+    {
+        "id": "asset-fraud-classifier",
+        "name": "Binary Fraud Classifier",
+        "group": "fraud",
+        "endpoint": "/api/v1/fraud/classifier",
+        "handler": "financial_fraud_classifier",
+        "latency": (0.6, 1.2),
+        "description": "Simple binary classifier for fraud vs legitimate transactions. High-speed inference.",
+        "keywords": "fraud, binary-classification, transaction, finance, security",
+        "task": "Classification - Tabular",
+        "subtask": "Fraud Detection",
+        "algorithm": "LightGBM",
+    },
+]
+
+MODELS_BY_ENDPOINT = {model["endpoint"]: model for model in MODELS}
+MODELS_BY_HANDLER = {model["handler"]: model for model in MODELS}
+
+
+def input_features(model):
+    """Input schema for a model: its own fields, or its group's shared ones"""
+    fields = model.get("fields") or GROUPS[model["group"]]["fields"]
+    return {"fields": fields}
+
+
+def models_in_group(group):
+    """Models of a group, in catalog order"""
+    return [model for model in MODELS if model["group"] == group]
+
+
+def load_catalog(path, reserved=()):
+    """Models of a generated catalog CSV, served with their template's behavior
+
+    Only the fields the server needs are kept (csv.reader by column index is
+    noticeably faster than DictReader), so 50k entries load in well under a
+    second. A row whose handler is unknown, or whose endpoint is outside
+    /api/v1/, clashes with the server's own routes, is already in `reserved`
+    (the built-in endpoints) or repeats an earlier row, raises ValueError
+    naming its line.
+    """
+    seen = set(reserved)
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = csv.reader(f)
+        header = next(rows)
+        id_col, name_col, handler_col, endpoint_col = (
+            header.index(column) for column in ("id", "name", "handler", "endpoint"))
+        for line, row in enumerate(rows, start=2):
+            template = MODELS_BY_HANDLER.get(row[handler_col])
+            if template is None:
+                raise ValueError(f"{path}, line {line}: unknown handler {row[handler_col]!r}")
+            endpoint = row[endpoint_col]
+            if (not endpoint.startswith("/api/v1/") or endpoint.endswith("/batch")
+                    or endpoint.startswith("/api/v1/groups/")):
+                raise ValueError(f"{path}, line {line}: endpoint {endpoint!r} is not a free /api/v1/ model path")
+            if endpoint in seen:
+                raise ValueError(f"{path}, line {line}: endpoint {endpoint!r} is already served")
+            seen.add(endpoint)
+            yield {
+                "id": row[id_col],
+                "name": row[name_col],
+                "group": template["group"],
+                "endpoint": endpoint,
+                "handler": template["handler"],
+                "latency": template["latency"],
+                "cacheable": template.get("cacheable", False),
+            }
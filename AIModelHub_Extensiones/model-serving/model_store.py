@@ -0,0 +1,193 @@
+"""
+Model Store
+===========
+
+Ciclo de vida de los artefactos reales de models/ (ver sklearn_models.py).
+
+- Carga perezosa: un modelo se carga en el primer request que lo usa.
+- LRU con presupuesto de memoria (MODEL_STORE_BUDGET_MB): al superarlo se
+  descargan los modelos usados hace más tiempo. El tamaño de cada modelo se
+  estima con el de su artefacto.
+- Hot reload: un hilo revisa models/ cada MODEL_STORE_WATCH_INTERVAL
+  segundos; si el .pkl o su metadata cambian, carga la nueva versión y la
+  intercambia de forma atómica. Los requests en curso terminan con la
+  versión que ya tenían; si la nueva versión no carga, se sigue sirviendo la
+  anterior.
+
+Para publicar una versión nueva sin lecturas a medias, escribir el archivo
+con otro nombre y renombrarlo (mv) sobre el anterior.
+
+SERVE_REAL_MODELS=0 desactiva los modelos reales (se usan los simulados).
+"""
+
+from collections import OrderedDict
+import os
+import threading
+import time
+
+from sklearn_models import MODELS_DIR, SklearnClassifier
+
+ENABLED = os.environ.get('SERVE_REAL_MODELS', '1') != '0'
+DEFAULT_BUDGET_MB = float(os.environ.get('MODEL_STORE_BUDGET_MB', 512))
+DEFAULT_WATCH_INTERVAL = float(os.environ.get('MODEL_STORE_WATCH_INTERVAL', 2.0))
+
+class StoredModel:
+    """A loaded model version and the artifact signature it came from"""
+
+    __slots__ = ('model', 'signature', 'size')
+
+    def __init__(self, model, signature, size):
+        self.model = model
+        self.signature = signature
+        self.size = size
+
+class ModelStore:
+    """Lazily loaded, LRU-bounded, hot-reloading set of real models"""
+
+    def __init__(self, directory=MODELS_DIR, budget_mb=DEFAULT_BUDGET_MB,
+                 watch_interval=DEFAULT_WATCH_INTERVAL, enabled=ENABLED):
+        self.directory = directory
+        self.budget = budget_mb * 1024 * 1024
+        self.watch_interval = watch_interval
+        self.enabled = enabled
+        self.loads = 0
+        self.reloads = 0
+        self.evictions = 0
+        self._labels = {}
+        self._loaded = OrderedDict()  # name -> StoredModel, least recently used first
+        self._failed = {}             # name -> (signature, error) of the last failed load
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._watcher = None
+
+    def register(self, name, label=None):
+        """Declare an artifact (models/<name>.pkl) the servers may ask for"""
+        self._labels[name] = label
+
+    def available(self, name):
+        return self.enabled and os.path.exists(self._artifact_path(name))
+
+    def _artifact_path(self, name):
+        return os.path.join(self.directory, f'{name}.pkl')
+
+    def _signature(self, name):
+        """(mtime, size) of the artifact and its metadata; changes on redeploy"""
+        paths = (self._artifact_path(name), os.path.join(self.directory, f'{name}_metadata.json'))
+        return tuple((st.st_mtime_ns, st.st_size) for st in map(os.stat, paths))
+
+    def get(self, name):
+        """Current version of a model, loading it on first use"""
+        stored = self._loaded.get(name)
+        if stored is not None:
+            with self._lock:
+                if name in self._loaded:
+                    self._loaded.move_to_end(name)
+            return stored.model
+
+        with self._load_lock:
+            stored = self._loaded.get(name)
+            if stored is None:
+                stored = self._load(name)
+                self._install(name, stored)
+                self.loads += 1
+        self._start_watcher()
+        return stored.model
+
+    def get_optional(self, name):
+        """The model, or None when it is disabled or cannot be loaded here
+
+        A failed load is remembered until the artifact changes, so a broken
+        or incompatible artifact costs one attempt, not one per request.
+        """
+        if not self.available(name):
+            return None
+        if name in self._loaded:
+            return self.get(name)  # A failed reload keeps the loaded version
+        failed = self._failed.get(name)
+        if failed is not None:
+            try:
+                if self._signature(name) == failed[0]:
+                    return None
+            except OSError:
+                return None
+        try:
+            return self.get(name)
+        except Exception as e:  # scikit-learn missing, incompatible pickle, bad metadata
+            self._remember_failure(name, e)
+            return None
+
+    def _remember_failure(self, name, error, fallback='using the simulated model'):
+        try:
+            signature = self._signature(name)
+        except OSError:
+            signature = None
+        self._failed[name] = (signature, error)
+        reason = str(error).splitlines()[0] if str(error) else type(error).__name__
+        print(f"⚠️  {name}: {fallback} ({reason})")
+
+    def _load(self, name):
+        signature = self._signature(name)
+        model = SklearnClassifier.load(name, self._labels.get(name), self.directory)
+        self._failed.pop(name, None)
+        return StoredModel(model, signature, os.path.getsize(self._artifact_path(name)))
+
+    def _install(self, name, stored):
+        with self._lock:
+            self._loaded[name] = stored
+            self._loaded.move_to_end(name)
+            used = sum(s.size for s in self._loaded.values())
+            # Evict least recently used models, never the one just installed
+            while used > self.budget and len(self._loaded) > 1:
+                _, evicted = self._loaded.popitem(last=False)
+                used -= evicted.size
+                self.evictions += 1
+
+    # ========================================================================
+    # HOT RELOAD
+    # ========================================================================
+
+    def _start_watcher(self):
+        if self._watcher is not None or self.watch_interval <= 0:
+            return
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch, name='model-store-watcher', daemon=True)
+                self._watcher.start()
+
+    def _watch(self):
+        while True:
+            time.sleep(self.watch_interval)
+            self.check_for_updates()
+
+    def check_for_updates(self):
+        """Reload every loaded model whose artifact changed on disk"""
+        for name, stored in list(self._loaded.items()):
+            try:
+                signature = self._signature(name)
+                failed = self._failed.get(name)
+                if signature == stored.signature or (failed and failed[0] == signature):
+                    continue
+                with self._load_lock:
+                    fresh = self._load(name)
+            except Exception as e:
+                self._remember_failure(name, e, 'keeping the loaded version')
+                continue
+            with self._lock:
+                if name not in self._loaded:
+                    continue  # Evicted meanwhile; the next get() loads the new version
+            self._install(name, fresh)
+            self.reloads += 1
+            print(f"🔄 {name}: reloaded new model version")
+
+    def describe(self):
+        loaded = list(self._loaded.items())
+        return {
+            'enabled': self.enabled,
+            'loaded': [name for name, _ in loaded],
+            'memory_mb': round(sum(s.size for _, s in loaded) / 1024 / 1024, 2),
+            'budget_mb': self.budget / 1024 / 1024,
+            'loads': self.loads,
+            'reloads': self.reloads,
+            'evictions': self.evictions,
+            'failed': {name: str(error).splitlines()[0] for name, (_, error) in self._failed.items()}
+        }
@@ -4,14 +4,18 @@ Shows how to use the model with documented variables
 """
 import pickle
 import json
+import os
 import numpy as np
 
+# Paths relative to this script, so it runs from any working directory
+MODELS_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Load model
-with open('iris_classifier.pkl', 'rb') as f:
+with open(os.path.join(MODELS_DIR, 'iris_classifier.pkl'), 'rb') as f:
     model = pickle.load(f)
 
 # Load metadata
-with open('iris_classifier_metadata.json', 'r') as f:
+with open(os.path.join(MODELS_DIR, 'iris_classifier_metadata.json'), 'r') as f:
     metadata = json.load(f)
 
 print("=" * 60)
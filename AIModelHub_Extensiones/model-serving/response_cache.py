@@ -0,0 +1,107 @@
+"""
+Response Cache
+==============
+
+Caché de respuestas para modelos deterministas (los que el registro marca
+con "cacheable": True). Los benchmarks repiten las mismas filas de
+validación, así que una entrada ya vista se responde sin latencia simulada
+ni cálculo.
+
+- Clave: hash SHA-1 del JSON canónico de la entrada (claves ordenadas, sin
+  espacios), así {"a": 1, "b": 2} y {"b": 2, "a": 1} comparten entrada.
+- Desalojo LRU por número de entradas y por tamaño total (bytes del JSON de
+  las respuestas), y expiración por TTL.
+- Contadores de hits, misses, desalojos y expiraciones por modelo.
+
+Los modelos no marcados (resultados aleatorios) nunca pasan por la caché.
+
+Desactivada por defecto: load_generator.py y benchmark_runner.py repiten las
+mismas entradas, y con la caché activa medirían la caché y no los modelos.
+Se activa explícitamente con RESPONSE_CACHE=1.
+
+Variables de entorno: RESPONSE_CACHE (1 = activada, 0 por defecto),
+RESPONSE_CACHE_MAX_ENTRIES (10000), RESPONSE_CACHE_MAX_MB (32, por modelo),
+RESPONSE_CACHE_TTL (segundos, 300; 0 = sin expiración).
+"""
+
+from collections import OrderedDict
+import hashlib
+import os
+import threading
+import time
+
+import fast_json
+
+ENABLED = os.environ.get('RESPONSE_CACHE', '0') == '1'
+DEFAULT_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 10000))
+DEFAULT_MAX_MB = float(os.environ.get('RESPONSE_CACHE_MAX_MB', 32))
+DEFAULT_TTL = float(os.environ.get('RESPONSE_CACHE_TTL', 300))
+
+def canonical_key(data):
+    """Stable hash of a JSON input, independent of key order and whitespace"""
+    return hashlib.sha1(fast_json.dumps(data)).hexdigest()  # Sorted keys, compact
+
+class ResponseCache:
+    """LRU + TTL cache of one model's responses"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_mb=DEFAULT_MAX_MB, ttl=DEFAULT_TTL):
+        self.max_entries = max_entries
+        self.max_bytes = max_mb * 1024 * 1024
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        self._entries = OrderedDict()  # key -> (expires, size, response), least recently used first
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Cached response for `key`, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl and entry[0] < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key, response):
+        size = len(fast_json.dumps(response))
+        if size > self.max_bytes:
+            return
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, size, response)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def describe(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
@@ -0,0 +1,108 @@
+"""
+Production Launcher
+===================
+
+Sirve los servidores mock con gunicorn en lugar del servidor de desarrollo
+de Werkzeug (`app.run`): N procesos worker, cada uno con M hilos (gthread),
+y apagado ordenado con SIGTERM (los requests en curso terminan dentro de
+--graceful-timeout).
+
+Cada worker publica sus métricas en un directorio compartido
+(MODEL_SERVER_METRICS_DIR, ver shared_metrics.py), así que el dashboard,
+/api/v1/health, /api/v1/metrics y /metrics muestran los totales de todos
+los workers y no solo los del que atiende el request.
+
+Los streams del dashboard (/api/v1/executions/stream) ocupan un hilo
+mientras están abiertos: se cierran cada pocos segundos y cada worker acepta
+como mucho una cuarta parte de sus hilos en streams (ver execution_feed.py).
+
+Uso:
+    python3 serve.py                                  # 25 modelos, 4 workers
+    python3 serve.py --workers 8 --threads 16
+    python3 serve.py --app mock_server:app --port 8080
+
+Variables de entorno: WORKERS, THREADS, PORT.
+"""
+
+import argparse
+import importlib
+import os
+import shutil
+import tempfile
+
+from gunicorn.app.base import BaseApplication
+
+from shared_metrics import METRICS_DIR_ENV, WORKER_FILE
+
+class ModelServerApplication(BaseApplication):
+    def __init__(self, app_uri, options):
+        self.app_uri = app_uri
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        # Imported in each worker (no preload), so every worker starts its
+        # own shared-metrics publisher under its own pid
+        module_name, app_name = self.app_uri.split(':')
+        return getattr(importlib.import_module(module_name), app_name)
+
+def prepare_metrics_dir(directory):
+    """Helper to start with no worker files left over in the shared-metrics directory
+
+    Only the <pid>.json / <pid>.json.tmp files of shared_metrics.py are
+    removed: a user-chosen directory may be shared with anything else.
+    """
+    if directory is None:
+        directory = tempfile.mkdtemp(prefix='model-server-metrics-')
+    else:
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if WORKER_FILE.match(name.removesuffix('.tmp')):
+                os.remove(os.path.join(directory, name))
+    os.environ[METRICS_DIR_ENV] = directory
+    return directory
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the mock model servers with gunicorn')
+    parser.add_argument('--app', default='mock_server_25_models:app', help='module:app to serve')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 8080)))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WORKERS', 4)))
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('THREADS', 8)),
+                        help='Threads per worker; simulated latency is sleep, so threads scale well')
+    parser.add_argument('--timeout', type=int, default=60, help='Seconds before a silent worker is restarted')
+    parser.add_argument('--graceful-timeout', type=int, default=30,
+                        help='Seconds in-flight requests get to finish after SIGTERM')
+    parser.add_argument('--metrics-dir', default=os.environ.get(METRICS_DIR_ENV),
+                        help='Directory for per-worker metrics (default: fresh temp dir)')
+    args = parser.parse_args()
+
+    metrics_dir = prepare_metrics_dir(args.metrics_dir)
+    # Dashboard streams hold a thread each: leave most threads to inference
+    os.environ.setdefault('EXECUTION_FEED_MAX_SUBSCRIBERS', str(max(1, args.threads // 4)))
+    cleanup = args.metrics_dir is None  # Keep user-chosen directories for inspection
+
+    print("=" * 80)
+    print(f"🚀 Serving {args.app} on http://{args.host}:{args.port}")
+    print(f"   {args.workers} workers x {args.threads} threads")
+    print(f"   Shared metrics: {metrics_dir}")
+    print("=" * 80)
+
+    ModelServerApplication(args.app, {
+        'bind': f'{args.host}:{args.port}',
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread',
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'preload_app': False,
+        'accesslog': None,
+        'on_exit': lambda arbiter: cleanup and shutil.rmtree(metrics_dir, ignore_errors=True),
+    }).run()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Shared Metrics
+==============
+
+Agregación de métricas entre procesos cuando el servidor corre con varios
+workers (serve.py). Cada worker escribe periódicamente sus contadores en
+MODEL_SERVER_METRICS_DIR/<pid>.json; /api/v1/health, /api/v1/metrics,
+/metrics y el dashboard suman los de todos los workers.
+
+Los contadores de workers que ya terminaron se conservan (son acumulados);
+solo se descartan sus requests en curso.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+
+from metrics import MetricsRegistry
+
+METRICS_DIR_ENV = 'MODEL_SERVER_METRICS_DIR'
+# Per-worker state files; anything else in the directory is ignored
+WORKER_FILE = re.compile(r'^\d+\.json$')
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class SharedMetrics:
+    """Publishes this worker's counters and merges every worker's"""
+
+    def __init__(self, directory, metrics, execution_log, interval=1.0):
+        self.directory = directory
+        self.metrics = metrics
+        self.execution_log = execution_log
+        self.interval = interval
+        self.pid = os.getpid()
+        self.path = os.path.join(directory, f'{self.pid}.json')
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_env(cls, metrics, execution_log):
+        """Started instance when MODEL_SERVER_METRICS_DIR is set, else None"""
+        directory = os.environ.get(METRICS_DIR_ENV)
+        if not directory:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        shared = cls(directory, metrics, execution_log)
+        shared.start()
+        return shared
+
+    def start(self):
+        threading.Thread(target=self._run, name='shared-metrics', daemon=True).start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        self._stop.set()
+        self.write()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def state(self):
+        return {
+            'pid': self.pid,
+            'total_executions': self.execution_log.total,
+            'metrics': self.metrics.export_state()
+        }
+
+    def write(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state(), f)
+        os.replace(tmp_path, self.path)
+
+    def _worker_states(self):
+        yield self.state()  # Always live for the current worker
+        for name in os.listdir(self.directory):
+            if not WORKER_FILE.match(name) or name == os.path.basename(self.path):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    yield json.load(f)
+            except (OSError, ValueError):
+                continue  # Worker mid-shutdown or file being replaced
+
+    def aggregate(self):
+        """(MetricsRegistry, total executions) summed over every worker"""
+        merged = MetricsRegistry()
+        total = 0
+        for state in self._worker_states():
+            total += state['total_executions']
+            merged.merge_state(state['metrics'], include_in_flight=_alive(state['pid']))
+        return merged, total
@@ -0,0 +1,121 @@
+"""
+Scikit-learn Models
+===================
+
+Servido de modelos reales de scikit-learn (models/<nombre>.pkl) en lugar de
+la regla simulada, para que la latencia medida sea la de una inferencia real
+y no la de un `sleep`.
+
+- Los artefactos se cargan con joblib (memory-mapped a partir de
+  MMAP_THRESHOLD_MB) o con pickle si joblib no está instalado; el ciclo de
+  vida (carga perezosa, LRU, hot reload) está en model_store.py.
+- Los campos JSON se mapean a la posición de cada feature según
+  models/<nombre>_metadata.json ("sepal length (cm)" -> sepal_length; se
+  acepta también el nombre original). Los campos ausentes toman la media de
+  entrenamiento documentada en la metadata.
+- Los batches se evalúan con predict_proba en micro-batches de
+  MICRO_BATCH_SIZE filas.
+
+scikit-learn es opcional: si no está instalado, o la versión instalada no
+puede leer el pickle, el servidor sigue usando el modelo simulado (y lo
+avisa en el log). iris_classifier.pkl se guarda con la versión fijada en
+requirements.txt, registrada como "sklearn_version" en su metadata; tras
+cambiarla, models/train_iris_model.py lo vuelve a exportar.
+"""
+
+import json
+import os
+import pickle
+import time
+
+import numpy as np
+
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models')
+MICRO_BATCH_SIZE = 256
+# Artifacts at least this large have their numpy arrays memory-mapped
+MMAP_THRESHOLD_MB = float(os.environ.get('MODEL_MMAP_THRESHOLD_MB', 50))
+
+def load_artifact(path):
+    """Unpickle a model artifact, memory-mapping large joblib arrays"""
+    if joblib is not None:
+        large = os.path.getsize(path) >= MMAP_THRESHOLD_MB * 1024 * 1024
+        return joblib.load(path, mmap_mode='r' if large else None)
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def field_name(feature_name):
+    """JSON field for a metadata feature name: 'sepal length (cm)' -> 'sepal_length'"""
+    return feature_name.split('(')[0].strip().replace(' ', '_').lower()
+
+class SklearnClassifier:
+    """A fitted classifier plus the feature layout from its metadata"""
+
+    def __init__(self, estimator, metadata, label):
+        self.estimator = estimator
+        self.metadata = metadata
+        self.label = label
+        # estimator.classes_ holds indexes into the metadata class names
+        self.classes = [metadata['classes'][int(c)] for c in estimator.classes_]
+        features = sorted(metadata['input_features'], key=lambda f: f['position'])
+        self.fields = [(field_name(f['name']), f['name']) for f in features]
+        self.defaults = np.array([f.get('mean', 0.0) for f in features], dtype=float)
+
+    @classmethod
+    def load(cls, name, label=None, directory=MODELS_DIR):
+        estimator = load_artifact(os.path.join(directory, f'{name}.pkl'))
+        with open(os.path.join(directory, f'{name}_metadata.json')) as f:
+            metadata = json.load(f)
+        model = cls(estimator, metadata, label or metadata.get('model_name', name))
+        model.check_example()
+        return model
+
+    def check_example(self):
+        """Refuse a model that does not reproduce its documented example"""
+        example = self.metadata.get('example_input')
+        expected = self.metadata.get('example_output', {}).get('predicted_class')
+        if example is None or expected is None:
+            return
+        probabilities = self.estimator.predict_proba(np.array([example], dtype=float))[0]
+        predicted = self.classes[int(probabilities.argmax())]
+        if predicted != expected:
+            raise ValueError(f"predicts {predicted!r} for the metadata example, expected {expected!r}")
+
+    def features(self, inputs):
+        """(n, n_features) matrix for a list of input dicts"""
+        X = np.tile(self.defaults, (len(inputs), 1))
+        for i, data in enumerate(inputs):
+            for j, (field, original) in enumerate(self.fields):
+                value = data.get(field, data.get(original))
+                if value is not None:
+                    X[i, j] = value
+        return X
+
+    def predict_batch(self, inputs):
+        """One output dict per input, scored MICRO_BATCH_SIZE rows at a time"""
+        outputs = []
+        for start in range(0, len(inputs), MICRO_BATCH_SIZE):
+            chunk = inputs[start:start + MICRO_BATCH_SIZE]
+            began = time.perf_counter()
+            X = self.features(chunk)
+            probabilities = self.estimator.predict_proba(X)
+            per_record_ms = (time.perf_counter() - began) * 1000 / len(chunk)
+            for row, values in zip(probabilities, X):
+                best = int(row.argmax())
+                outputs.append({
+                    'model': self.label,
+                    'prediction': self.classes[best],
+                    'confidence': round(float(row[best]), 3),
+                    'probabilities': {name: round(float(p), 3) for name, p in zip(self.classes, row)},
+                    'input_features': {field: float(v) for (field, _), v in zip(self.fields, values)},
+                    'processing_time_ms': round(per_record_ms, 3),
+                    'backend': 'scikit-learn'
+                })
+        return outputs
+
+    def predict(self, data):
+        return self.predict_batch([data])[0]
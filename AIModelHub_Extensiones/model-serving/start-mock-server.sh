@@ -39,5 +39,5 @@ echo -e "${GREEN}✓${NC} Dependencies installed"
 echo -e "${YELLOW}[3/3]${NC} Starting server..."
 echo ""
 
-# Start the server
-python3 mock_server.py
+# Start the server (WORKERS/THREADS control the gunicorn worker pool)
+python3 serve.py --app mock_server:app
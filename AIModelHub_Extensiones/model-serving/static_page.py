@@ -0,0 +1,29 @@
+"""
+Static Page
+===========
+
+Páginas HTML renderizadas una sola vez al arrancar el servidor y servidas
+como bytes con ETag y Cache-Control: un navegador que ya tiene la página
+recibe un 304 sin cuerpo, y los datos que cambian (contadores, ejecuciones
+recientes) se piden aparte a un endpoint JSON pequeño.
+"""
+
+import hashlib
+
+from flask import Response
+
+class StaticPage:
+    """Pre-rendered HTML served with an ETag"""
+
+    def __init__(self, html, max_age=300):
+        self.body = html.encode('utf-8')
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self.max_age = max_age
+
+    def response(self, request):
+        """Full page, or 304 Not Modified when the client's copy is current"""
+        response = Response(self.body, content_type='text/html; charset=utf-8')
+        response.set_etag(self.etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = self.max_age
+        return response.make_conditional(request)
@@ -0,0 +1,140 @@
+"""
+Validation Datasets
+===================
+
+Lectura de los datasets de validación (tabla validation_datasets) sin
+necesidad de una base de datos: se extraen de los INSERT de
+database-scripts/005_create_validation_datasets.sql, el mismo script que los
+carga en PostgreSQL.
+
+Cada dataset es un dict con id, name, task_type, features_schema, samples
+(las filas de data.samples, con la etiqueta incluida) y labels_column.
+
+Para datasets grandes, las muestras se leen en streaming y en memoria
+constante:
+- iter_file_samples(): un archivo exportado, sea el blob `data`
+  ({"samples": [...]}, p. ej. `psql -At -c "SELECT data FROM
+  validation_datasets WHERE id = '...'"`), una lista JSON o JSON Lines
+  (.jsonl, una muestra por línea).
+- iter_database_samples(): directamente de PostgreSQL con un cursor del
+  lado del servidor sobre jsonb_array_elements(data->'samples'); requiere
+  psycopg2.
+"""
+
+import json
+import os
+import re
+
+DATASETS_SQL = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                            'database-scripts', '005_create_validation_datasets.sql')
+
+# One VALUES row: (id, name, task_type, samples, description, features_schema, data, labels_column)
+_ROW = re.compile(
+    r"\(\s*'(?P<id>[^']+)',\s*'(?P<name>[^']*)',\s*'(?P<task_type>[^']*)',\s*\d+,\s*'[^']*',"
+    r"\s*'(?P<features_schema>\{.*?\})'::jsonb,\s*'(?P<data>\{.*?\})'::jsonb,"
+    r"\s*'(?P<labels_column>[^']*)'\s*\)",
+    re.DOTALL
+)
+
+def load_datasets(path=DATASETS_SQL):
+    """Datasets inserted by the validation_datasets SQL script, in file order"""
+    with open(path, encoding='utf-8') as f:
+        sql = f.read()
+    return [
+        {
+            'id': row['id'],
+            'name': row['name'],
+            'task_type': row['task_type'],
+            'features_schema': json.loads(row['features_schema']),
+            'samples': json.loads(row['data'])['samples'],
+            'labels_column': row['labels_column']
+        }
+        for row in _ROW.finditer(sql)
+    ]
+
+_SAMPLES_ARRAY = re.compile(r'"samples"\s*:\s*\[')
+_SEPARATORS = ' \t\r\n,'
+
+def iter_file_samples(path, chunk_size=1 << 16):
+    """Samples of an exported dataset file, parsed chunk by chunk"""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        # Advance to the opening bracket of the samples array
+        buffer = ''
+        while True:
+            more = f.read(chunk_size)
+            buffer += more
+            stripped = buffer.lstrip()
+            if stripped.startswith('['):
+                pos = len(buffer) - len(stripped) + 1
+                break
+            match = _SAMPLES_ARRAY.search(buffer)
+            if match:
+                pos = match.end()
+                break
+            if not more:
+                raise ValueError(f'{path}: no "samples" array found')
+
+        decoder = json.JSONDecoder()
+        while True:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            if pos < len(buffer) and buffer[pos] == ']':
+                return
+            try:
+                if pos == len(buffer):
+                    raise json.JSONDecodeError('Need more data', buffer, pos)
+                sample, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                more = f.read(chunk_size)
+                if not more:
+                    raise ValueError(f'{path}: truncated samples array')
+                buffer, pos = buffer[pos:] + more, 0  # Keep only the unparsed tail
+                continue
+            yield sample
+
+def database_dataset(database_url, dataset_id):
+    """A dataset's metadata (everything but the samples) from PostgreSQL, or None"""
+    import psycopg2  # Only needed for this source
+
+    with psycopg2.connect(database_url) as connection, connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT id, name, task_type, features_schema, labels_column FROM validation_datasets WHERE id = %s",
+            (dataset_id,)
+        )
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    return dict(zip(('id', 'name', 'task_type', 'features_schema', 'labels_column'), row))
+
+def iter_database_samples(database_url, dataset_id, fetch_size=1000):
+    """Samples of a dataset streamed from PostgreSQL, fetch_size rows at a time"""
+    import psycopg2
+
+    with psycopg2.connect(database_url) as connection:
+        # A named cursor keeps the result set on the server
+        with connection.cursor(name=f'samples-{dataset_id}') as cursor:
+            cursor.itersize = fetch_size
+            cursor.execute(
+                "SELECT jsonb_array_elements(data->'samples') FROM validation_datasets WHERE id = %s",
+                (dataset_id,)
+            )
+            for (sample,) in cursor:
+                yield sample
+
+def model_inputs(dataset, fields):
+    """Dataset rows as request bodies for a model, or None if they lack a required field
+
+    Only the model's own input fields are kept (the label and extra columns
+    such as image_id are dropped).
+    """
+    names = [field['name'] for field in fields]
+    required = [field['name'] for field in fields if field.get('required')]
+    if not dataset['samples'] or any(name not in sample for sample in dataset['samples'] for name in required):
+        return None
+    return [{name: sample[name] for name in names if name in sample} for sample in dataset['samples']]
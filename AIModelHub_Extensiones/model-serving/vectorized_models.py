@@ -0,0 +1,224 @@
+"""
+Vectorized Models - Health Metrics & Flora Groups
+=================================================
+
+Versiones NumPy (array-in / array-out) de los modelos de los grupos 3
+(Health Metrics) y 4 (Flora Classification) de mock_server_25_models.py.
+
+Cada función recibe columnas completas (np.ndarray) y devuelve un dict de
+columnas con los mismos campos y reglas que la versión escalar, de modo que
+un batch de 10^5 filas se calcula en una sola pasada.
+
+Las salidas son idénticas a las de la versión escalar: el redondeo final
+se hace con round() de Python (np.round resuelve los empates de otra forma)
+y los valores recortados conservan el tipo que da max()/min().
+"""
+
+import copy
+
+import numpy as np
+
+rng = np.random.default_rng()
+
+# ============================================================================
+# COLUMN KERNELS
+# ============================================================================
+
+BMI_BOUNDS = np.array([18.5, 25.0, 30.0])
+BMI_CATEGORIES = np.array(['Underweight', 'Normal', 'Overweight', 'Obese'], dtype=object)
+BMI_RISK_SCORES = np.array([30, 10, 40, 70])
+
+HEALTH_RECOMMENDATIONS = ['Maintain healthy diet', 'Regular exercise', 'Annual checkup']
+
+IRIS_BOUNDS = np.array([2.5, 5.0])
+IRIS_SPECIES = np.array(['setosa', 'versicolor', 'virginica'], dtype=object)
+
+def bmi(weight_kg, height_m):
+    """Body Mass Index per row"""
+    return weight_kg / (height_m ** 2)
+
+def bmi_band(bmi_values):
+    """Index of the WHO band (0=Underweight .. 3=Obese) for each BMI"""
+    return np.searchsorted(BMI_BOUNDS, bmi_values, side='right')
+
+BODY_FAT_BOUNDS = (5, 50)
+IDEAL_WEIGHT_BOUNDS = (45, 120)
+
+def body_fat(bmi_values):
+    """Simplified body fat percentage (before the [5, 50] clip)"""
+    return (1.20 * bmi_values) + (0.23 * 30) - 5.4
+
+def bmr(weight_kg, height_m, age=30):
+    """Mifflin-St Jeor basal metabolic rate (male)"""
+    return (10 * weight_kg) + (6.25 * (height_m * 100)) - (5 * age) + 5
+
+def hamwi_ideal_weight(height_m):
+    """Hamwi ideal weight (male), before the [45, 120] kg clip"""
+    return 48 + 2.7 * (height_m * 100 - 152.4) / 2.54
+
+def iris_species_index(petal_length):
+    """Petal-length thresholds: 0=setosa, 1=versicolor, 2=virginica"""
+    return np.searchsorted(IRIS_BOUNDS, petal_length, side='right')
+
+def _choice(options, n):
+    return np.asarray(options, dtype=object)[rng.integers(0, len(options), n)]
+
+def _uniform(low, high, n, decimals):
+    return np.round(rng.uniform(low, high, n), decimals)
+
+def _round(values, digits, bounds=None):
+    """Python round() of each value, after the scalar max(low, min(high, v)) clip"""
+    rows = values.tolist()
+    if bounds is not None:
+        low, high = bounds
+        rows = [max(low, min(high, value)) for value in rows]
+    return np.array([round(value, digits) for value in rows], dtype=object)
+
+# ============================================================================
+# GRUPO 3: REGRESSION - HEALTH METRICS
+# ============================================================================
+
+def bmi_calculator(weight_kg, height_m):
+    values = bmi(weight_kg, height_m)
+    return {
+        'bmi': _round(values, 2),
+        'category': BMI_CATEGORIES[bmi_band(values)],
+    }
+
+def body_fat_estimator(weight_kg, height_m):
+    raw = body_fat(bmi(weight_kg, height_m))
+    fat = np.clip(raw, *BODY_FAT_BOUNDS)
+    return {
+        'body_fat_percentage': _round(raw, 1, BODY_FAT_BOUNDS),
+        'category': np.where(fat < 20, 'Athletic', np.where(fat < 30, 'Average', 'High')).astype(object),
+        'lean_mass_kg': _round(weight_kg * (1 - fat / 100), 1),
+    }
+
+def bmr_calculator(weight_kg, height_m):
+    values = bmr(weight_kg, height_m)
+    return {
+        'bmr_calories': _round(values, 0),
+        'sedentary': _round(values * 1.2, 0),
+        'moderate_activity': _round(values * 1.55, 0),
+        'very_active': _round(values * 1.9, 0),
+    }
+
+def ideal_weight_predictor(weight_kg, height_m):
+    raw = hamwi_ideal_weight(height_m)
+    ideal = np.clip(raw, *IDEAL_WEIGHT_BOUNDS)
+    return {
+        'ideal_weight_kg': _round(raw, 1, IDEAL_WEIGHT_BOUNDS),
+        'healthy_range_min': _round(ideal * 0.9, 1),
+        'healthy_range_max': _round(ideal * 1.1, 1),
+    }
+
+def health_risk_assessor(weight_kg, height_m):
+    risk = BMI_RISK_SCORES[bmi_band(bmi(weight_kg, height_m))]
+    return {
+        'risk_score': risk,
+        'risk_level': np.where(risk < 30, 'Low', np.where(risk < 50, 'Moderate', 'High')).astype(object),
+        'recommendations': HEALTH_RECOMMENDATIONS,
+    }
+
+# ============================================================================
+# GRUPO 4: TABULAR CLASSIFICATION - IRIS-LIKE
+# ============================================================================
+
+def iris_classifier(petal_length):
+    n = len(petal_length)
+    return {
+        'prediction': IRIS_SPECIES[iris_species_index(petal_length)],
+        'confidence': _uniform(0.85, 0.98, n, 3),
+    }
+
+def flower_type_classifier(petal_length):
+    n = len(petal_length)
+    return {
+        'prediction': _choice(['Rose', 'Tulip', 'Sunflower', 'Daisy', 'Lily'], n),
+        'confidence': _uniform(0.82, 0.96, n, 3),
+        'color_prediction': _choice(['Red', 'Yellow', 'White', 'Pink', 'Purple'], n),
+    }
+
+def plant_species_identifier(petal_length):
+    n = len(petal_length)
+    return {
+        'prediction': _choice(['Ficus', 'Monstera', 'Pothos', 'Snake Plant', 'Peace Lily'], n),
+        'confidence': _uniform(0.79, 0.94, n, 3),
+        'care_difficulty': _choice(['Easy', 'Moderate', 'Difficult'], n),
+    }
+
+def botanical_classifier(petal_length):
+    n = len(petal_length)
+    return {
+        'family': _choice(['Rosaceae', 'Asteraceae', 'Fabaceae', 'Lamiaceae', 'Solanaceae'], n),
+        'confidence': _uniform(0.81, 0.95, n, 3),
+        'genus_count': rng.integers(50, 501, n),
+    }
+
+def flora_recognition(petal_length):
+    n = len(petal_length)
+    return {
+        'category': _choice(['Flowering Plant', 'Conifer', 'Fern', 'Succulent', 'Grass'], n),
+        'confidence': _uniform(0.83, 0.97, n, 3),
+        'edible': rng.random(n) < 0.5,
+    }
+
+# ============================================================================
+# BATCH SCORING
+# ============================================================================
+
+HEALTH_INPUTS = (('weight_kg', 70.0), ('height_m', 1.75))
+IRIS_INPUTS = (('petal_length', 4.0),)
+
+# handler -> (response label, array function, input columns, echoed inputs, processing_time_ms range)
+BATCH_MODELS = {
+    'bmi_calculator': ('BMI Calculator', bmi_calculator, HEALTH_INPUTS, ('weight_kg', 'height_m'), (200, 500)),
+    'body_fat_estimator': ('Body Fat Estimator', body_fat_estimator, HEALTH_INPUTS, (), (300, 600)),
+    'bmr_calculator': ('BMR Calculator', bmr_calculator, HEALTH_INPUTS, (), (200, 500)),
+    'ideal_weight_predictor': ('Ideal Weight Predictor', ideal_weight_predictor, HEALTH_INPUTS, (), (300, 600)),
+    'health_risk_assessor': ('Health Risk Assessor', health_risk_assessor, HEALTH_INPUTS, (), (400, 700)),
+    'iris_classifier': ('Iris Classifier', iris_classifier, IRIS_INPUTS, (), (400, 900)),
+    'flower_type_classifier': ('Flower Type Classifier', flower_type_classifier, IRIS_INPUTS, (), (500, 1000)),
+    'plant_species_identifier': ('Plant Species Identifier', plant_species_identifier, IRIS_INPUTS, (), (600, 1100)),
+    'botanical_classifier': ('Botanical Classifier', botanical_classifier, IRIS_INPUTS, (), (500, 1000)),
+    'flora_recognition': ('Flora Recognition', flora_recognition, IRIS_INPUTS, (), (500, 1000)),
+}
+
+def column(inputs, field, default):
+    """Extract one numeric input column, keeping the raw values for echoing"""
+    raw = [data.get(field, default) for data in inputs]
+    values = np.asarray(raw)
+    if values.dtype.kind not in 'biuf':
+        raise TypeError(f"Field '{field}' must be numeric in every record")
+    return raw, values.astype(float)
+
+def score_batch(handler, inputs):
+    """Score a list of input dicts with the vectorized version of a model
+
+    Raises TypeError/AttributeError/FloatingPointError when the batch cannot
+    be vectorized (non-numeric fields, non-dict records, zero heights), so
+    callers can fall back to the scalar per-record path.
+    """
+    label, fn, fields, echo, (low, high) = BATCH_MODELS[handler]
+    raw = {}
+    arrays = []
+    for field, default in fields:
+        raw[field], values = column(inputs, field, default)
+        arrays.append(values)
+
+    with np.errstate(divide='raise', invalid='raise'):
+        columns = fn(*arrays)
+
+    n = len(inputs)
+    # Columns that are not arrays are constants, copied for every row so
+    # no two outputs (or cached responses) share a mutable list
+    columns = {
+        name: values.tolist() if isinstance(values, np.ndarray) else [copy.copy(values) for _ in range(n)]
+        for name, values in columns.items()
+    }
+    for field in echo:
+        columns[field] = raw[field]
+    columns['processing_time_ms'] = _uniform(low, high, n, 2).tolist()
+
+    names = list(columns)
+    return [dict(zip(names, row), model=label) for row in zip(*columns.values())]
@@ -1722,22 +1722,24 @@ app.post('/v3/models/execute', authenticateToken, async (req, res) => {
     const method = asset.execution_method || 'POST';
     const timeout = options?.timeout || asset.execution_timeout || 30000;
 
-    // Create execution record
+    // Create execution record. created_at is kept as text (a JS Date would
+    // drop its microseconds) to find the record's partition when updating it
     const executionId = uuidv4();
     const insertQuery = `
       INSERT INTO execution_history 
         (id, asset_id, user_id, connector_id, status, input_payload, created_at)
       VALUES ($1, $2, $3, $4, 'running', $5, NOW())
-      RETURNING *
+      RETURNING created_at::text AS created_at
     `;
 
-    await pool.query(insertQuery, [
+    const insertResult = await pool.query(insertQuery, [
       executionId,
       assetId,
       userId,
       connectorId,
       JSON.stringify(input)
     ]);
+    const createdAt = insertResult.rows[0].created_at;
 
     // Execute model
     const startTime = Date.now();
@@ -1770,7 +1772,8 @@ app.post('/v3/models/execute', authenticateToken, async (req, res) => {
 
     const executionTimeMs = Date.now() - startTime;
 
-    // Update execution record
+    // Update execution record (created_at limits it to one partition, see
+    // database-scripts/012_partition_execution_history.sql)
     const updateQuery = `
       UPDATE execution_history
       SET 
@@ -1781,7 +1784,7 @@ app.post('/v3/models/execute', authenticateToken, async (req, res) => {
         http_status_code = $5,
         execution_time_ms = $6,
         completed_at = NOW()
-      WHERE id = $7
+      WHERE id = $7 AND created_at = $8::timestamp
       RETURNING *
     `;
 
@@ -1792,11 +1795,13 @@ app.post('/v3/models/execute', authenticateToken, async (req, res) => {
       executionError?.code || null,
       httpStatus,
       executionTimeMs,
-      executionId
+      executionId,
+      createdAt
     ]);
 
     res.status(executionError ? 500 : 200).json({
       executionId,
+      createdAt,
       status: executionError ? 'error' : 'success',
       assetId,
       assetName: asset.name,
@@ -1860,20 +1865,23 @@ app.get('/v3/models/executions', authenticateToken, async (req, res) => {
 
 /**
  * GET /v3/models/executions/:executionId
- * Get specific execution details
+ * Get specific execution details. The optional createdAt query parameter
+ * (returned by POST /v3/models/execute) limits the lookup to one partition
  */
 app.get('/v3/models/executions/:executionId', authenticateToken, async (req, res) => {
   try {
     const { executionId } = req.params;
+    const { createdAt } = req.query;
     const userId = req.user.id;
 
     const query = `
       SELECT *
       FROM execution_history
       WHERE id = $1 AND user_id = $2
+        AND ($3::timestamp IS NULL OR created_at = $3::timestamp)
     `;
 
-    const result = await pool.query(query, [executionId, userId]);
+    const result = await pool.query(query, [executionId, userId, createdAt || null]);
 
     if (result.rows.length === 0) {
       return res.status(404).json({
@@ -77,6 +77,7 @@ echo -e "${YELLOW}[2/8]${NC} Stopping existing services..."
 pkill -f "node.*server-edc.js" || true
 pkill -f "ng serve" || true
 pkill -f "mock_server.py" || true
+pkill -f "python3 serve.py" || true
 
 # Stop Docker containers if running
 docker stop ml-assets-postgres ml-assets-minio 2>/dev/null || true
@@ -269,7 +270,7 @@ echo "Frontend started (PID: $FRONTEND_PID)"
 echo "Starting model server (Mock AI Server - 25 Models)..."
 cd "$MODEL_SERVER_DIR"
 source venv/bin/activate
-nohup python3 mock_server_25_models.py > "$PROJECT_DIR/model-server.log" 2>&1 &
+nohup python3 serve.py --app mock_server_25_models:app > "$PROJECT_DIR/model-server.log" 2>&1 &
 MODEL_SERVER_PID=$!
 deactivate
 echo "Model server started (PID: $MODEL_SERVER_PID)"